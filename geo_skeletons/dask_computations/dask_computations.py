@@ -1,6 +1,10 @@
+import dask
 import dask.array as da
+from dask.callbacks import Callback
 import numpy as np
 import xarray as xr
+import traceback
+import os
 
 from typing import Union
 
@@ -97,3 +101,56 @@ def undask_me(
     if data_is_dask(data):
         return data.compute()
     return data
+
+
+def writable_constant(
+    data: Union[np.ndarray, da.array]
+) -> Union[np.ndarray, da.array]:
+    """Gives a writable copy of a read-only (e.g. zero-stride) numpy array. Other arrays are returned as is.
+
+    Constant arrays (zero stride along every axis) are allocated with np.zeros, so the memory is only used
+    when the array is written to."""
+    if not isinstance(data, np.ndarray) or data.flags.writeable:
+        return data
+    if data.size == 0 or any(stride != 0 for stride in data.strides):
+        return np.array(data, copy=True)
+    value = data.flat[0]
+    new_data = np.zeros(data.shape, dtype=data.dtype)
+    if value:
+        new_data.fill(value)
+    return new_data
+
+
+class ComputeCounter(Callback):
+    """Counts the dask computations that are made while it is active. Use as a context manager:
+
+    with ComputeCounter() as counter:
+        skeleton.set_hs(hs)
+    counter.count # Number of computations
+    counter.calls # Where the computations were triggered
+
+    verbose [False]: Report every computation when it is made"""
+
+    def __init__(self, verbose: bool = False):
+        super().__init__()
+        self.verbose = verbose
+        self.count = 0
+        self.calls: list[str] = []
+
+    def _start(self, dsk) -> None:
+        self.count += 1
+        call = _caller()
+        self.calls.append(call)
+        if self.verbose:
+            print(f"Dask computation #{self.count} triggered by {call}")
+
+
+def _caller() -> str:
+    """Finds the line (outside of dask, xarray and numpy) that triggered a computation"""
+    library_dirs = tuple(
+        os.path.dirname(module.__file__) for module in [dask, np, xr]
+    ) + (os.path.dirname(__file__),)
+    for frame in reversed(traceback.extract_stack()):
+        if not frame.filename.startswith(library_dirs):
+            return f"{frame.filename}:{frame.lineno} ({frame.name})"
+    return "unknown"
@@ -218,6 +218,14 @@ def identify_core_in_ds(
     else:
         coords_needed = core.coords("init", cartesian=(not lonlat_set))
 
+    # Exact name matches and aliases are found without looking at only_vars
+    if only_vars:
+        core_vars_to_ds_vars = {
+            var: ds_var
+            for var, ds_var in core_vars_to_ds_vars.items()
+            if _ds_vars_are_allowed(ds_var, only_vars)
+        }
+
     # missing_coords = set(coords_needed) - set(core_coords_to_ds_coords.keys())
     # if not missing_coords.issubset(set(allowed_misses)) and strict:
     #     raise GridError(
@@ -403,6 +411,19 @@ def _map_geo_parameter_to_ds_variable(
     return None
 
 
+def _ds_vars_are_allowed(
+    ds_var: Union[str, tuple], only_vars: list[str]
+) -> bool:
+    """Checks that all Dataset variables used to set a core variable are listed in only_vars.
+
+    ds_var is either a variable name or a tuple (ds_var_x, ds_var_y, transform_function, dir_type)"""
+    if isinstance(ds_var, tuple):
+        ds_vars = [v for v in ds_var[0:2] if v is not None]
+    else:
+        ds_vars = [ds_var]
+    return all(v in only_vars for v in ds_vars)
+
+
 def _match_ds_aliases_to_parameter(
     var: Union[MetaParameter, str], ds_aliases: dict[str, Union[MetaParameter, str]]
 ) -> Union[str, None]:
@@ -494,7 +515,7 @@ def _map_inverse_geo_parameter_to_ds_variable(
             ignore_dir_ambiguity=False,
             verbose=verbose,
         )
-        transform_function = lambda x, y: 1 / x
+        transform_function = _invert
         dir_type = None
     elif var.i_am() == "frequency":
         ds_var = _map_geo_parameter_to_ds_variable(
@@ -507,7 +528,7 @@ def _map_inverse_geo_parameter_to_ds_variable(
             ignore_dir_ambiguity=False,
             verbose=verbose,
         )
-        transform_function = lambda x, y: 1 / x
+        transform_function = _invert
         dir_type = None
     elif var.i_am() == "direction":
         ds_var = _map_geo_parameter_to_ds_variable(
@@ -520,7 +541,7 @@ def _map_inverse_geo_parameter_to_ds_variable(
             ignore_dir_ambiguity=True,
             verbose=verbose,
         )
-        transform_function = lambda x, y: x
+        transform_function = _keep_x
         dir_type = var.my_family("opposite_direction").dir_type()
     elif var.i_am() == "opposite_direction":
         ds_var = _map_geo_parameter_to_ds_variable(
@@ -533,7 +554,7 @@ def _map_inverse_geo_parameter_to_ds_variable(
             ignore_dir_ambiguity=True,
             verbose=verbose,
         )
-        transform_function = lambda x, y: x
+        transform_function = _keep_x
         dir_type = var.my_family("direction").dir_type()
     else:
         return None, None, None
@@ -546,6 +567,16 @@ def _map_inverse_geo_parameter_to_ds_variable(
     return None, None, None
 
 
+def _invert(x, y):
+    """Transform function for inverse parameters, e.g. Tp from fp. Module level function so that decoding plans can be pickled."""
+    return 1 / x
+
+
+def _keep_x(x, y):
+    """Transform function for opposite directions (the conversion is made using the dir_type)."""
+    return x
+
+
 def _map_geo_parameter_to_components_in_ds(
     var: Union[MetaParameter, str],
     ds: xr.Dataset,
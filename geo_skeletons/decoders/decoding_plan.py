@@ -0,0 +1,116 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+import pickle
+import xarray as xr
+import numpy as np
+from typing import Union, Optional
+from geo_parameters.metaparameter import MetaParameter
+from geo_skeletons.managers.coordinate_manager import CoordinateManager
+
+# Number of decoding plans kept in memory
+MAX_CACHED_PLANS = 128
+
+_PLAN_CACHE: OrderedDict[tuple, DecodingPlan] = OrderedDict()
+
+
+@dataclass
+class DecodingPlan:
+    """The resolved mapping between the variables of a Dataset schema and the core of a Skeleton class.
+
+    Created by decoding a Dataset once. Datasets with the same fingerprint (same structure and reading options)
+    can then be read without decoding them again."""
+
+    fingerprint: tuple
+    core_coords_to_ds_coords: dict[str, str]
+    core_vars_to_ds_vars: dict[str, Union[str, tuple]]
+    coords_needed: list[str]
+    ds_remapped_coords: dict[str, list[str]]
+
+    def save(self, filename: str) -> None:
+        """Pickles the plan to a file"""
+        with open(filename, "wb") as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls, filename: str) -> DecodingPlan:
+        """Reads a pickled plan from a file"""
+        with open(filename, "rb") as f:
+            plan = pickle.load(f)
+        if not isinstance(plan, cls):
+            raise TypeError(f"{filename} does not contain a {cls.__name__}!")
+        return plan
+
+
+def decoding_fingerprint(
+    core: CoordinateManager,
+    ds: xr.Dataset,
+    only_vars: list[str],
+    ignore_vars: list[str],
+    keep_ds_names: bool,
+    decode_cf: bool,
+    core_aliases: dict[Union[MetaParameter, str], str],
+    ds_aliases: dict[str, Union[MetaParameter, str]],
+    extra_coords: dict[str, np.ndarray],
+) -> tuple:
+    """Fingerprint of everything that determines how a Dataset is decoded:
+
+    1) Structure of the Skeleton (names, geo-parameters and coord_groups of all objects)
+    2) Names, dimensions, shapes and standard names of all variables in the Dataset
+    3) All options for the decoding (aliases, only_vars etc.)
+    """
+    core_print = tuple(
+        (
+            name,
+            str(core.meta_parameter(name)),
+            core.coord_group(name),
+            getattr(core.get(name), "dir_type", None),
+        )
+        for name in core.all_objects("all")
+    )
+
+    ds_print = tuple(
+        (
+            name,
+            ds[name].dims,
+            ds[name].shape,
+            ds[name].attrs.get("standard_name"),
+        )
+        for name in sorted(list(ds.data_vars) + list(ds.coords))
+    )
+
+    options = (
+        tuple(only_vars),
+        tuple(ignore_vars),
+        keep_ds_names,
+        decode_cf,
+        _alias_print(core_aliases),
+        _alias_print(ds_aliases),
+        tuple(sorted((k, np.size(v)) for k, v in extra_coords.items())),
+    )
+    return core_print, ds_print, options
+
+
+def _alias_print(aliases: dict) -> tuple:
+    return tuple(sorted((str(k), str(v)) for k, v in aliases.items()))
+
+
+def get_cached_plan(fingerprint: tuple) -> Optional[DecodingPlan]:
+    """Returns the decoding plan with the given fingerprint if it has been cached"""
+    plan = _PLAN_CACHE.get(fingerprint)
+    if plan is not None:
+        _PLAN_CACHE.move_to_end(fingerprint)
+    return plan
+
+
+def cache_plan(plan: DecodingPlan) -> None:
+    """Caches a decoding plan. The least recently used plan is thrown away if the cache is full."""
+    _PLAN_CACHE[plan.fingerprint] = plan
+    _PLAN_CACHE.move_to_end(plan.fingerprint)
+    while len(_PLAN_CACHE) > MAX_CACHED_PLANS:
+        _PLAN_CACHE.popitem(last=False)
+
+
+def clear_decoding_plans() -> None:
+    """Throws away all cached decoding plans"""
+    _PLAN_CACHE.clear()
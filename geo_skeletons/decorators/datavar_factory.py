@@ -7,6 +7,7 @@ import geo_parameters as gp
 import dask.array as da
 import xarray as xr
 from geo_skeletons.variables import DataVar
+from geo_skeletons.packing import packing_parameters
 
 
 def add_datavar(
@@ -14,11 +15,16 @@ def add_datavar(
     coord_group: str = "all",
     default_value: float = 0.0,
     dir_type: Optional[bool] = None,
+    dtype: Optional[str] = None,
+    valid_range: Optional[tuple[float, float]] = None,
 ):
     """name: name of variable
     coord_group: 'all', 'spatial', 'grid' or 'gridpoint'
     default_value: float
     dir_type (for directional parameters): 'from', 'to' or 'math' (Autimatically parsed if name is a MetaParameter)
+    dtype: dtype the data is stored in, e.g. 'float32' (Default: the dtype of the class or of the data that is set)
+    valid_range: (min, max) used to pack data into an integer dtype (e.g. 'int16') using CF scale_factor and add_offset.
+        Directional data is packed using the range of the dir_type if not given.
 
     """
 
@@ -96,7 +102,10 @@ def add_datavar(
                 coord_group=coord_group,
                 default_value=def_val,
                 dir_type=dir_type,
-        )
+                dtype=dtype,
+                scale_factor=scale_factor,
+                add_offset=add_offset,
+            )
 
         c.core = deepcopy(c.core)  # Makes a copy of the class coord_manager
         c.meta = c.core.meta
@@ -121,4 +130,10 @@ def add_datavar(
     if dir_type is None and gp.is_gp(name):
         dir_type = name.dir_type()
 
+    scale_factor, add_offset = packing_parameters(dtype, valid_range, dir_type)
+    if dtype is not None and np.dtype(dtype).kind in "iu" and scale_factor is None:
+        raise ValueError(
+            f"Need a 'valid_range' to pack data into integer dtype '{dtype}'!"
+        )
+
     return datavar_decorator
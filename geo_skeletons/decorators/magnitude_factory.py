@@ -15,12 +15,14 @@ def add_magnitude(
     y: str,
     direction: Optional[Union[str, MetaParameter]] = None,
     dir_type: Optional[str] = None,
+    dtype: Optional[str] = None,
 ):
     """name: name of variable
     x [str]: name of already set variable that will be used as x-component
     y [str]: name of already set variable that will be used as y-component
     direction: name of the direction of the magnitude being set
     dir_type: 'from', 'to' or 'math'
+    dtype: dtype the x- and y-components are stored in, e.g. 'float32'
     """
 
     def magnitude_decorator(c):
@@ -130,6 +132,9 @@ def add_magnitude(
             dir_str, meta_dir = None, None
 
         coord_group = c.core.get(x).coord_group
+        if dtype is not None:
+            c.core.set_var_dtype(x, dtype)
+            c.core.set_var_dtype(y, dtype)
         mag_obj = Magnitude(name=name_str, meta=meta, x=x, y=y, coord_group=coord_group)
 
         if direction is not None:
@@ -162,6 +167,10 @@ def add_magnitude(
         raise ValueError(
             f"'dir_type' needs to be 'to', 'from' or 'math' (or None), not {dir_type}"
         )
+    if dtype is not None and np.dtype(dtype).kind != "f":
+        raise ValueError(
+            f"The components of a magnitude can only be stored in a floating point dtype, not '{dtype}'!"
+        )
 
     # Always respect explicitly set directional convention
     # Otherwise parse from MetaParameter is possible
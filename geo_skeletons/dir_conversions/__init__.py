@@ -4,4 +4,6 @@ from .conversion_functions import (
     convert_to_math_dir,
     compute_magnitude,
     compute_math_direction,
+    compute_components,
+    compute_polar,
 )
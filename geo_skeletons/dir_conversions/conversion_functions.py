@@ -22,29 +22,32 @@ def convert(data, in_type: str, out_type: str):
         return data
     if in_type is None:
         raise ValueError("Cannot convert 'dir_type' for a non-directional variable!")
+    if in_type == out_type:
+        # Only make sure the directions are in the range [0, 360)
+        if in_type == "math":
+            return data
+        return _mod(_shifted(data, 0), 360)
+
+    if "math" not in [in_type, out_type]:
+        # 'from' <-> 'to' is just a shift by 180 degrees
+        return _mod(_shifted(data, 180), 360)
+
     data = convert_to_math_dir(data, dir_type=in_type)
     data = convert_from_math_dir(data, dir_type=out_type)
     return data
 
 
 def convert_to_math_dir(data, dir_type: str):
-    """Converts data to mathematical convetion (radians, east=0, north = pi/2)"""
+    """Converts data to mathematical convetion (radians, east=0, north = pi/2)
+
+    The result is in the range (-pi, pi]."""
     if dir_type == "math":  # Convert to mathematical convention
         return data
-    math_dir = (90 - data + OFFSET[dir_type]) * np.pi / 180
-    math_dir = dask_computations.mod(math_dir, 2 * np.pi)
-    mask = dask_computations.undask_me(math_dir <= np.pi)
-    if isinstance(mask, xr.DataArray):
-        mask = mask.data
-    correction = np.full(mask.shape, 2 * np.pi)
-    correction[mask] = 0
-
-    if isinstance(math_dir, xr.DataArray):
-        # squeeze is needed for it to work with dask arrays
-        math_dir.data = math_dir.data - correction
-    else:
-        math_dir = math_dir - correction
-    return math_dir
+    # pi - ((data + 90 - offset) mod 360) * pi/180 gives (90 - data + offset) * pi/180 in the range (-pi, pi]
+    math_dir = _shifted(data, 90 - OFFSET[dir_type])
+    math_dir = _mod(math_dir, 360)
+    math_dir = _multiply(math_dir, np.pi / 180)
+    return _subtract_from(np.pi, math_dir)
 
 
 def convert_from_math_dir(data, dir_type: str):
@@ -52,8 +55,102 @@ def convert_from_math_dir(data, dir_type: str):
     if dir_type == "math":
         return data
 
-    data = 90 - data * 180 / np.pi + OFFSET[dir_type]
-    return dask_computations.mod(data, 360)
+    data = _scaled(data, -180 / np.pi)
+    data = _add(data, 90 + OFFSET[dir_type])
+    return _mod(data, 360)
+
+
+def compute_components(
+    magnitude: Union[np.ndarray, da.array, xr.DataArray],
+    direction: Union[np.ndarray, da.array, xr.DataArray],
+    dir_type: str,
+) -> tuple[
+    Union[np.ndarray, da.array, xr.DataArray], Union[np.ndarray, da.array, xr.DataArray]
+]:
+    """Computes the x- and y-components of a magnitude and direction with given dir_type
+
+    Numpy arrays are computed with a minimum of temporary arrays, and dask arrays are kept lazy."""
+    if magnitude is None or direction is None:
+        return None, None
+    math_dir = convert_to_math_dir(direction, dir_type)
+
+    if dir_type == "math" or not isinstance(math_dir, np.ndarray):
+        x = np.cos(math_dir)
+        y = np.sin(math_dir)
+    else:
+        # math_dir is a new array that can be reused
+        x = np.cos(math_dir)
+        y = np.sin(math_dir, out=math_dir)
+
+    return _multiply(x, magnitude), _multiply(y, magnitude)
+
+
+def compute_polar(
+    x: Union[np.ndarray, da.array, xr.DataArray],
+    y: Union[np.ndarray, da.array, xr.DataArray],
+    dir_type: str,
+) -> tuple[
+    Union[np.ndarray, da.array, xr.DataArray], Union[np.ndarray, da.array, xr.DataArray]
+]:
+    """Computes the magnitude and direction (with given dir_type) of two components"""
+    return compute_magnitude(x, y), convert_from_math_dir(
+        compute_math_direction(x, y), dir_type
+    )
+
+
+def _is_numpy(data) -> bool:
+    return isinstance(data, np.ndarray)
+
+
+def _fits_in_place(data, value) -> bool:
+    """Checks if the result of an operation between data and value can be written into data"""
+    if not _is_numpy(data):
+        return False
+    if not (np.isscalar(value) or (_is_numpy(value) and value.shape == data.shape)):
+        return False
+    return np.result_type(data, value) == data.dtype
+
+
+def _shifted(data, value: float):
+    """data + value as a new float array"""
+    if _is_numpy(data):
+        return np.add(data, value, dtype=np.result_type(data.dtype, 1.0))
+    return data + value
+
+
+def _scaled(data, value: float):
+    """data * value as a new float array"""
+    if _is_numpy(data):
+        return np.multiply(data, value, dtype=np.result_type(data.dtype, 1.0))
+    return data * value
+
+
+def _add(data, value):
+    """Adds in place for numpy arrays. Only use on arrays created here!"""
+    if _fits_in_place(data, value):
+        return np.add(data, value, out=data)
+    return data + value
+
+
+def _multiply(data, value):
+    """Multiplies in place for numpy arrays. Only use on arrays created here!"""
+    if _fits_in_place(data, value):
+        return np.multiply(data, value, out=data)
+    return data * value
+
+
+def _mod(data, value):
+    """mod in place for numpy arrays. Only use on arrays created here!"""
+    if _is_numpy(data):
+        return np.mod(data, value, out=data)
+    return dask_computations.mod(data, value)
+
+
+def _subtract_from(value, data):
+    """value - data in place for numpy arrays. Only use on arrays created here!"""
+    if _is_numpy(data):
+        return np.subtract(value, data, out=data)
+    return value - data
 
 
 def compute_magnitude(
@@ -63,7 +160,7 @@ def compute_magnitude(
     """Computes magnitudes (norms) of two variables"""
     if x is None or y is None:
         return None
-    return (x**2 + y**2) ** 0.5
+    return np.hypot(x, y)
 
 
 def compute_math_direction(
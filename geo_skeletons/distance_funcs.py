@@ -1,25 +1,32 @@
-import geopy.distance
 import numpy as np
+from typing import Union
+
+# WGS84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = (1 - WGS84_F) * WGS84_A
+# Mean radius of the earth used for spherical calculations
+EARTH_RADIUS = 6371008.8
+
+DISTANCE_METHODS = ["vincenty", "haversine"]
 
 
 def min_distance(
-    lon: float, lat: float, lon_vec: np.ndarray, lat_vec: np.ndarray, npoints: int = 1
+    lon: float,
+    lat: float,
+    lon_vec: np.ndarray,
+    lat_vec: np.ndarray,
+    npoints: int = 1,
+    method: str = "vincenty",
 ) -> tuple[np.ndarray[float], np.ndarray[int]]:
     """Calculates minimum distance [m] between a given point and a list of
     points given in spherical coordinates (lon/lat degrees).
 
     Also returns index of the found minimum.
     """
-    dx = []
-    for n, __ in enumerate(lat_vec):
-        dx.append(distance_2points(lat, lon, lat_vec[n], lon_vec[n]))
-    # inds = np.argpartition(dx, npoints - 1)[:npoints]
-    inds = np.argsort(dx)[0:npoints]
-    # if npoints > 1:
-    #    breakpoint()
-    return np.array(dx)[inds], inds
-
-    # return [np.array(dx).min()], [np.array(dx).argmin()]
+    dx = distance_2points(lat, lon, lat_vec, lon_vec, method=method)
+    inds = _smallest_inds(dx, npoints)
+    return dx[inds], inds
 
 
 def min_cartesian_distance(
@@ -29,33 +36,63 @@ def min_cartesian_distance(
     in cartesian coordinates [m].
 
     Also returns incex of found minimum"""
-    dx = ((y - y_vec) ** 2 + (x - x_vec) ** 2) ** 0.5
-    inds = np.argsort(dx)[0:npoints]
-    # if npoints > 1:
-    #    breakpoint()
-    return np.array(dx)[inds], inds
+    dx = np.array(((y - y_vec) ** 2 + (x - x_vec) ** 2) ** 0.5)
+    inds = _smallest_inds(dx, npoints)
+    return dx[inds], inds
 
-    # inds = np.argpartition(dx, npoints - 1)[:npoints]
-    # # if npoints > 1:
-    # #     breakpoint()
-    # return dx[inds], inds
-    # # return dx.min(), dx.argmin()
+
+def distances_to_candidates(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    lon_vec: np.ndarray,
+    lat_vec: np.ndarray,
+    candidates: np.ndarray,
+    method: str = "vincenty",
+) -> np.ndarray:
+    """Calculates distances [m] between given points and candidate points.
+
+    candidates has shape (len(lon), N) and contains indeces of lon_vec/lat_vec.
+    Returns distances of the same shape."""
+    lon = np.asarray(lon)[:, np.newaxis]
+    lat = np.asarray(lat)[:, np.newaxis]
+    return distance_2points(
+        lat,
+        lon,
+        np.asarray(lat_vec)[candidates],
+        np.asarray(lon_vec)[candidates],
+        method=method,
+    )
 
 
-def lon_in_km(lat: float) -> float:
+def _smallest_inds(dx: np.ndarray, npoints: int) -> np.ndarray:
+    """Indeces of the npoints smallest values in increasing order.
+
+    Uses a partition so that only the npoints values need to be sorted."""
+    if npoints >= len(dx):
+        return np.argsort(dx, kind="stable")
+    inds = np.argpartition(dx, npoints - 1)[:npoints]
+    return inds[np.argsort(dx[inds], kind="stable")]
+
+
+def lon_in_km(lat: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Converts one longitude degree to km for a given latitude."""
     return distance_2points(lat, 0, lat, 1) / 1000
 
 
-def lat_in_km(lat: float) -> float:
+def lat_in_km(lat: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Converts one latitude degree to km for a given latitude."""
+    lat = np.asarray(lat)
     return distance_2points(lat, 0, lat + 1, 0) / 1000
 
 
 def domain_size_in_km(
     lon: tuple[float, float], lat: tuple[float, float]
 ) -> tuple[float, float]:
-    """Calculates approximate size of grid in km."""
+    """Calculates approximate size of grid in km.
+
+    lon and lat can also be tuples of arrays to calculate the size of several domains at once."""
+    lon = [np.asarray(l) for l in lon]
+    lat = [np.asarray(l) for l in lat]
     km_x = (
         distance_2points((lat[0] + lat[1]) / 2, lon[0], (lat[0] + lat[1]) / 2, lon[1])
         / 1000
@@ -64,6 +101,191 @@ def domain_size_in_km(
     return km_x, km_y
 
 
-def distance_2points(lat1, lon1, lat2, lon2) -> float:
-    """Calculate distance between two points in m"""
-    return geopy.distance.geodesic((lat1, lon1), (lat2, lon2)).m
+def distance_2points(
+    lat1,
+    lon1,
+    lat2,
+    lon2,
+    method: str = "vincenty",
+    tolerance: float = 1e-12,
+    max_iter: int = 200,
+) -> Union[float, np.ndarray]:
+    """Calculate distance between two points in m
+
+    All coordinates can be given as arrays, and they are broadcast against each other.
+
+    method:
+    'vincenty' [default]: Distance on the WGS84 ellipsoid (accuracy better than 1 mm)
+    'haversine': Great circle distance on a sphere (error up to ~0.5%, but faster)
+
+    tolerance [default 1e-12], max_iter [default 200]: Convergence criterion [rad] and maximum number of iterations
+        used by the 'vincenty' method"""
+    if method not in DISTANCE_METHODS:
+        raise ValueError(f"'method' needs to be in {DISTANCE_METHODS}, not '{method}'!")
+
+    if method == "haversine":
+        dist = haversine(lat1, lon1, lat2, lon2)
+    else:
+        dist = vincenty(lat1, lon1, lat2, lon2, tolerance=tolerance, max_iter=max_iter)
+
+    if np.ndim(dist) == 0:
+        return float(dist)
+    return dist
+
+
+def haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great circle distance [m] between points on a sphere with the mean radius of the earth"""
+    lat1, lon1, lat2, lon2 = map(
+        lambda x: np.deg2rad(np.asarray(x, dtype=float)), (lat1, lon1, lat2, lon2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def vincenty(
+    lat1, lon1, lat2, lon2, tolerance: float = 1e-12, max_iter: int = 200
+) -> np.ndarray:
+    """Distance [m] between points on the WGS84 ellipsoid using the inverse Vincenty formula.
+
+    The iteration is done for all points at once. The iteration doesn't converge for some nearly antipodal points.
+    The geodesic between those points is instead found by bisection of the azimuth (see _bisect_geodesic)."""
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+        *map(lambda x: np.asarray(x, dtype=float), (lat1, lon1, lat2, lon2))
+    )
+
+    L = np.deg2rad(np.mod(lon2 - lon1 + 180, 360) - 180)
+    U1 = np.arctan((1 - WGS84_F) * np.tan(np.deg2rad(lat1)))
+    U2 = np.arctan((1 - WGS84_F) * np.tan(np.deg2rad(lat2)))
+    sinU1, cosU1 = np.sin(U1), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    active = np.full(L.shape, True)
+    for __ in range(max_iter):
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        sin_sigma = np.sqrt(
+            (cosU2 * sin_lam) ** 2 + (cosU1 * sinU2 - sinU1 * cosU2 * cos_lam) ** 2
+        )
+        cos_sigma = sinU1 * sinU2 + cosU1 * cosU2 * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        # Coincident points have sin_sigma = 0
+        sin_alpha = np.divide(
+            cosU1 * cosU2 * sin_lam,
+            sin_sigma,
+            out=np.zeros(L.shape),
+            where=sin_sigma != 0,
+        )
+        cos2_alpha = 1 - sin_alpha**2
+        # Points on the equator have cos2_alpha = 0
+        cos_2sigma_m = cos_sigma - np.divide(
+            2 * sinU1 * sinU2, cos2_alpha, out=np.zeros(L.shape), where=cos2_alpha != 0
+        )
+        new_lam = L + _lon_difference_correction(
+            sigma, sin_sigma, cos_sigma, cos_2sigma_m, sin_alpha
+        )
+        active = np.abs(new_lam - lam) > tolerance
+        lam = new_lam
+        if not np.any(active):
+            break
+
+    dist = _geodesic_length(sigma, sin_sigma, cos_sigma, cos_2sigma_m, sin_alpha)
+
+    if np.any(active):
+        dist = np.array(dist)
+        dist[active] = _bisect_geodesic(
+            U1[active], U2[active], L[active], tolerance, max_iter
+        )
+
+    return dist
+
+
+def _lon_difference_correction(
+    sigma, sin_sigma, cos_sigma, cos_2sigma_m, sin_alpha
+) -> np.ndarray:
+    """Difference [rad] between the longitude difference on the auxiliary sphere and on the ellipsoid"""
+    cos2_alpha = 1 - sin_alpha**2
+    C = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+    return (1 - C) * WGS84_F * sin_alpha * (
+        sigma
+        + C
+        * sin_sigma
+        * (cos_2sigma_m + C * cos_sigma * (-1 + 2 * cos_2sigma_m**2))
+    )
+
+
+def _geodesic_length(
+    sigma, sin_sigma, cos_sigma, cos_2sigma_m, sin_alpha
+) -> np.ndarray:
+    """Length [m] on the ellipsoid of a geodesic that has the arc length sigma on the auxiliary sphere"""
+    u2 = (1 - sin_alpha**2) * (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = (
+        B
+        * sin_sigma
+        * (
+            cos_2sigma_m
+            + B
+            / 4
+            * (
+                cos_sigma * (-1 + 2 * cos_2sigma_m**2)
+                - B
+                / 6
+                * cos_2sigma_m
+                * (-3 + 4 * sin_sigma**2)
+                * (-3 + 4 * cos_2sigma_m**2)
+            )
+        )
+    )
+    return WGS84_B * A * (sigma - delta_sigma)
+
+
+def _bisect_geodesic(
+    U1: np.ndarray, U2: np.ndarray, L: np.ndarray, tolerance: float, max_iter: int
+) -> np.ndarray:
+    """Length [m] of the geodesics between points with reduced latitudes U1, U2 [rad] and longitude difference L [rad].
+
+    The points are first moved so that U1 <= 0, |U1| >= |U2| and L >= 0, which doesn't change the distance.
+    The longitude difference reached at U2 then increases monotonically with the azimuth at the first point,
+    from 0 (heading north) to pi (heading south, Karney 2013). The azimuth is found by bisection, which also
+    converges for nearly antipodal points."""
+    swap = np.abs(U1) < np.abs(U2)
+    U1, U2 = np.where(swap, U2, U1), np.where(swap, U1, U2)
+    sign = np.where(U1 > 0, -1.0, 1.0)
+    U1, U2 = U1 * sign, U2 * sign
+    L = np.abs(L)
+
+    # -0.0 on the equator, so that a geodesic heading south starts at sigma1 = -pi
+    sinU1, cosU1 = -np.abs(np.sin(U1)), np.cos(U1)
+    sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+    def geodesic(alpha1: np.ndarray) -> tuple[np.ndarray, tuple]:
+        """Longitude difference [rad] where the geodesic with azimuth alpha1 reaches U2"""
+        sin_alpha1, cos_alpha1 = np.sin(alpha1), np.cos(alpha1)
+        sin_alpha = sin_alpha1 * cosU1
+        # The geodesic always reaches U2 heading north, since |U2| <= |U1|
+        cos_alpha2_cosU2 = np.sqrt(
+            np.maximum((cos_alpha1 * cosU1) ** 2 + cosU2**2 - cosU1**2, 0.0)
+        )
+        sigma1 = np.arctan2(sinU1, cos_alpha1 * cosU1)
+        sigma2 = np.arctan2(sinU2, cos_alpha2_cosU2)
+        omega1 = np.arctan2(sin_alpha * sinU1, cos_alpha1 * cosU1)
+        omega2 = np.arctan2(sin_alpha * sinU2, cos_alpha2_cosU2)
+        sigma = sigma2 - sigma1
+        arc = (sigma, np.sin(sigma), np.cos(sigma), np.cos(sigma1 + sigma2), sin_alpha)
+        return omega2 - omega1 - _lon_difference_correction(*arc), arc
+
+    low = np.zeros(L.shape)
+    high = np.full(L.shape, np.pi)
+    for __ in range(max_iter):
+        alpha1 = (low + high) / 2
+        too_far = geodesic(alpha1)[0] > L
+        high = np.where(too_far, alpha1, high)
+        low = np.where(too_far, low, alpha1)
+        if np.all(high - low <= tolerance):
+            break
+
+    return _geodesic_length(*geodesic((low + high) / 2)[1])
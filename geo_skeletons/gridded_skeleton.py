@@ -11,6 +11,7 @@ from .variables import Coordinate, DataVar
 import geo_parameters as gp
 from typing import Optional
 from .dask_computations import undask_me
+from .lazy_meshgrid import LazyMeshgrid
 
 lon_var = Coordinate(name="lon", meta=gp.grid.Lon, coord_group="spatial")
 lat_var = Coordinate(name="lat", meta=gp.grid.Lat, coord_group="spatial")
@@ -95,6 +96,9 @@ class GriddedSkeleton(Skeleton):
         native = True gives longitude values if Skeleton is spherical"""
         if not self.core.is_cartesian() and strict:
             return None
+        if self.core.is_cartesian() or native:
+            # The lazy meshgrid is a read-only view, so give out a writable copy
+            return np.array(self._native_meshgrid(normalize=normalize).xgrid())
         x, _ = self.xy(native=native, normalize=normalize)
         return np.reshape(x, self.size("spatial"))
 
@@ -107,6 +111,8 @@ class GriddedSkeleton(Skeleton):
         native = True gives longitude values if Skeleton is spherical"""
         if not self.core.is_cartesian() and strict:
             return None
+        if self.core.is_cartesian() or native:
+            return np.array(self._native_meshgrid(normalize=normalize).ygrid())
         _, y = self.xy(native=native, normalize=normalize)
         return np.reshape(y, self.size("spatial"))
 
@@ -117,6 +123,8 @@ class GriddedSkeleton(Skeleton):
         native = True gives UTM x-values if Skeleton is cartesian"""
         if self.core.is_cartesian() and strict:
             return None
+        if not self.core.is_cartesian() or native:
+            return np.array(self._native_meshgrid().xgrid())
         lon, _ = self.lonlat(native=native)
         if lon is None:  # Might happen if UTM-zone is not set
             return None
@@ -129,6 +137,8 @@ class GriddedSkeleton(Skeleton):
         native = True gives UTM y-values if Skeleton is cartesian"""
         if self.core.is_cartesian() and strict:
             return None
+        if not self.core.is_cartesian() or native:
+            return np.array(self._native_meshgrid().ygrid())
         _, lat = self.lonlat(native=native)
 
         if lat is None:  # Might happen if UTM-zone is not set
@@ -346,27 +356,20 @@ class GriddedSkeleton(Skeleton):
         if not self.core.is_cartesian() and strict:
             return None, None
 
-        if mask is None:
-            mask = np.full(super().size("spatial", **kwargs), True)
-
-        num_of_elements = (
-            self.shape(self.core.x_str)[0] * self.shape(self.core.y_str)[0]
-        )
-        if mask.ravel().shape[0] != num_of_elements:
-            raise ValueError(
-                f"Skeleton has {num_of_elements} elements but mask has shape {mask.shape}, not ({num_of_elements},)!"
-            )
-        mask = mask.ravel()
+        mask = self._check_points_mask(mask, **kwargs)
 
-        x, y = self._native_xy(utm=utm, normalize=normalize, **kwargs)
         if self.core.is_cartesian() or native:
-            return x[mask], y[mask]
+            return self._native_meshgrid(
+                utm=utm, normalize=normalize, **kwargs
+            ).masked(mask)
 
         # Only convert if skeleton is not Cartesian and native output is not requested
-        points = PointSkeleton(lon=x, lat=y)
-        points.utm.set(utm or self.utm.zone(), silent=True)
-
-        return points.xy(mask=mask, normalize=normalize)
+        x, y = self._projected_xy(utm=utm, **kwargs)
+        x, y = _apply_mask(x, mask), _apply_mask(y, mask)
+        if normalize:
+            x = x - min(x)
+            y = y - min(y)
+        return x, y
 
     def lonlat(
         self,
@@ -390,39 +393,52 @@ class GriddedSkeleton(Skeleton):
         if self.core.is_cartesian() and strict:
             return None, None
 
+        mask = self._check_points_mask(mask, **kwargs)
+
+        if not self.core.is_cartesian() or native:
+            return self._native_meshgrid(utm=utm, **kwargs).masked(mask)
+
+        # Only convert if skeleton is Cartesian and native output is not requested
+        if utm is None or utm == self.utm.zone():
+            lon, lat = self._projected_lonlat(**kwargs)
+        else:
+            x, y = self._native_xy(utm=utm, **kwargs)
+            lon, lat = self.utm._lonlat(x=x, y=y, utm=self.utm.zone())
+
+        if lon is None:
+            return None, None
+        return _apply_mask(lon, mask), _apply_mask(lat, mask)
+
+    def _check_points_mask(
+        self, mask: Optional[np.ndarray] = None, **kwargs
+    ) -> Optional[np.ndarray]:
+        """Checks that a mask covers all points of the grid and ravels it.
+
+        No mask is created if none is given, since that means all points."""
         if mask is None:
-            mask = np.full(super().size("spatial", **kwargs), True)
+            return None
 
-        num_of_elements = (
-            self.shape(self.core.x_str)[0] * self.shape(self.core.y_str)[0]
-        )
+        num_of_elements = int(np.prod(super().size("spatial", **kwargs)))
         if mask.ravel().shape[0] != num_of_elements:
             raise ValueError(
                 f"Skeleton has {num_of_elements} elements but mask has shape {mask.shape}, not ({num_of_elements},)!"
             )
-        mask = mask.ravel()
-        x, y = self._native_xy(utm=utm, **kwargs)
-
-        if not self.core.is_cartesian() or native:
-            return x[mask], y[mask]
-
-        # Only convert if skeleton is Cartesian and native output is not requested
-        points = PointSkeleton(x=x, y=y)
-        points.utm.set(self.utm.zone(), silent=True)
-
-        return points.lonlat(mask=mask)
+        return mask.ravel()
 
-    def _native_xy(
+    def _native_meshgrid(
         self, utm: Optional[tuple[int, str]] = None, normalize: bool = False, **kwargs
-    ) -> tuple[np.ndarray, np.ndarray]:
-        """Returns a tuple of native x and y of all points."""
-
-        x, y = np.meshgrid(
+    ) -> LazyMeshgrid:
+        """Returns a lazy meshgrid of the native x and y vectors."""
+        return LazyMeshgrid(
             self.x(native=True, utm=utm, normalize=normalize, **kwargs),
             self.y(native=True, utm=utm, normalize=normalize, **kwargs),
         )
 
-        return x.ravel(), y.ravel()
+    def _native_xy(
+        self, utm: Optional[tuple[int, str]] = None, normalize: bool = False, **kwargs
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns a tuple of native x and y of all points."""
+        return self._native_meshgrid(utm=utm, normalize=normalize, **kwargs).ravel()
 
     def set_spacing(
         self,
@@ -550,3 +566,10 @@ class GriddedSkeleton(Skeleton):
                 f"Skeleton has shape {self.size('spatial',**kwargs)} and {coord} has shape {self.shape(coord)} but mask is shape {mask.shape}"
             )
         return mask
+
+
+def _apply_mask(data: np.ndarray, mask: Optional[np.ndarray]) -> np.ndarray:
+    """Masks a vector of points. No mask gives a (writable) copy of all points."""
+    if mask is None:
+        return data.copy()
+    return data[mask]
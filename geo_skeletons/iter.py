@@ -1,60 +1,127 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-import itertools
+from typing import TYPE_CHECKING, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import os
+import numpy as np
+import dask
 
 if TYPE_CHECKING:
     from .skeleton import Skeleton
 
 
+MAP_BACKENDS = ["thread", "process", "dask"]
+
+
 class SkeletonIterator:
+    """Iterates over slices of a Skeleton. The slices are created one at a time when they are needed.
+
+    offset: Start from the n:th slice (e.g. to resume an interrupted iteration)
+    batch_size: Yield lists of (at most) batch_size slices instead of single slices
+    """
+
     def __init__(
-        self, dict_of_coords: dict, coords_to_iterate: list[str], skeleton
+        self,
+        dict_of_coords: dict,
+        coords_to_iterate: list[str],
+        skeleton,
+        offset: int = 0,
+        batch_size: Optional[int] = None,
     ) -> None:
-
         self.dict_of_coords = dict_of_coords
-        self.coords_to_iterate = list(coords_to_iterate)
-        # Needed to get the ordering right with itertools
-        self.coords_to_iterate.reverse()
         self.skeleton = skeleton
-        self.list_of_skeletons = self._compile_list()
-        self.ct = -1
+        self._set_coords(coords_to_iterate, offset, batch_size)
 
     def __iter__(self) -> SkeletonIterator:
         return self
 
-    def __next__(self) -> Skeleton:
-        self.ct += 1
-        if self.ct < len(self.list_of_skeletons):
-            return self.list_of_skeletons[self.ct]
-        raise StopIteration
-
-    def __call__(self, coords_to_iterate: list[str]) -> SkeletonIterator:
-        self.coords_to_iterate = list(coords_to_iterate)
-        # Needed to get the ordering right with itertools
-        self.coords_to_iterate.reverse()
-        self.list_of_skeletons = self._compile_list()
-        self.ct = -1
-        return self
+    def __len__(self) -> int:
+        """Number of items (slices or batches) that will be yielded by a full iteration"""
+        n_slices = max(self._n_slices - self.offset, 0)
+        if self.batch_size is None:
+            return n_slices
+        return int(np.ceil(n_slices / self.batch_size))
+
+    def __next__(self) -> Union[Skeleton, list[Skeleton]]:
+        if self.ct >= self._n_slices:
+            raise StopIteration
+
+        if self.batch_size is None:
+            self.ct += 1
+            return self._slice(self.ct - 1)
 
-    def _compile_list(self) -> list[Skeleton]:
-        """Returns a list of all the sliced Skeletons in the right order"""
-        coord_dict = {}
+        stop = min(self.ct + self.batch_size, self._n_slices)
+        batch = [self._slice(n) for n in range(self.ct, stop)]
+        self.ct = stop
+        return batch
+
+    def __call__(
+        self,
+        coords_to_iterate: list[str],
+        offset: int = 0,
+        batch_size: Optional[int] = None,
+    ) -> SkeletonIterator:
+        self._set_coords(coords_to_iterate, offset, batch_size)
+        return self
 
-        for coord in self.coords_to_iterate:
-            coord_value = self.dict_of_coords.get(coord)
-            if coord_value is None:
+    def _set_coords(
+        self, coords_to_iterate: list[str], offset: int, batch_size: Optional[int]
+    ) -> None:
+        """Sets the coordinates to iterate over and resets the iteration"""
+        for coord in coords_to_iterate:
+            if self.dict_of_coords.get(coord) is None:
                 raise KeyError(
                     f"Cannot iterate over coord {coord}, since it does not exist: {self.dict_of_coords.keys()}"
                 )
-            else:
-                coord_dict[coord] = coord_value
-
-        coord_tuples = itertools.product(*[val for __, val in coord_dict.items()])
-        list_of_skeletons = []
-        for ctuple in coord_tuples:
-            kwargs = {}
-            for n, val in enumerate(ctuple):
-                kwargs[list(coord_dict.keys())[n]] = val
-            list_of_skeletons.append(self.skeleton.sel(**kwargs))
-
-        return list_of_skeletons
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"'batch_size' needs to be positive, not {batch_size}!")
+
+        # The first coordinate varies fastest
+        self.coords_to_iterate = list(coords_to_iterate)[::-1]
+        self._shape = tuple(
+            len(self.dict_of_coords.get(coord)) for coord in self.coords_to_iterate
+        )
+        self._n_slices = int(np.prod(self._shape))
+        self.offset = offset
+        self.batch_size = batch_size
+        self.ct = offset
+
+    def _slice(self, n: int) -> Skeleton:
+        """Creates the n:th slice of the Skeleton"""
+        inds = np.unravel_index(n, self._shape)
+        return self.skeleton.isel(
+            **{coord: int(ind) for coord, ind in zip(self.coords_to_iterate, inds)}
+        )
+
+
+def map_over_slices(
+    skeleton: Skeleton,
+    func: Callable,
+    coords: list[str],
+    workers: Optional[int] = None,
+    backend: str = "thread",
+) -> list:
+    """Applies a function to all slices of a Skeleton (see Skeleton.iterate) in parallel. Returns the results in the order of the iteration.
+
+    backend:
+    'thread' [default]: Use a thread pool (good if func releases the GIL, e.g. numpy operations)
+    'process': Use a process pool (func needs to be pickleable, i.e. defined on module level)
+    'dask': Use dask.delayed and the set dask scheduler
+
+    The slices are created in batches when using pools, so that all slices are not kept in memory at the same time.
+    """
+    if backend not in MAP_BACKENDS:
+        raise ValueError(f"'backend' needs to be in {MAP_BACKENDS}, not '{backend}'!")
+
+    if backend == "dask":
+        tasks = [dask.delayed(func)(s) for s in skeleton.iterate(coords)]
+        if workers is None:
+            return list(dask.compute(*tasks))
+        return list(dask.compute(*tasks, num_workers=workers))
+
+    workers = workers or os.cpu_count() or 1
+    executor_class = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    results = []
+    with executor_class(max_workers=workers) as executor:
+        for batch in skeleton.iterate(coords, batch_size=4 * workers):
+            results += list(executor.map(func, batch))
+    return results
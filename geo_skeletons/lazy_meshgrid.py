@@ -0,0 +1,54 @@
+from __future__ import annotations
+import numpy as np
+from typing import Optional
+
+
+class LazyMeshgrid:
+    """Meshgrid of two coordinate vectors that is never materialized as a whole.
+
+    Corresponds to np.meshgrid(x, y), i.e. the 2D shape is (len(y), len(x)) and the raveled
+    points have x varying fastest.
+
+    2D views are broadcast (read-only) and take no extra memory. Raveled and masked points are only
+    allocated for the points that are actually requested.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self._x = np.asarray(x)
+        self._y = np.asarray(y)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self._y), len(self._x))
+
+    @property
+    def size(self) -> int:
+        return len(self._x) * len(self._y)
+
+    def xgrid(self) -> np.ndarray:
+        """Read-only 2D view of the x-values"""
+        return np.broadcast_to(self._x[np.newaxis, :], self.shape)
+
+    def ygrid(self) -> np.ndarray:
+        """Read-only 2D view of the y-values"""
+        return np.broadcast_to(self._y[:, np.newaxis], self.shape)
+
+    def ravel(self) -> tuple[np.ndarray, np.ndarray]:
+        """Raveled x- and y-values of all points"""
+        return np.tile(self._x, len(self._y)), np.repeat(self._y, len(self._x))
+
+    def masked(self, mask: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Raveled x- and y-values of the points where mask is True.
+
+        mask can be given either in the 2D shape or raveled. None gives all points."""
+        if mask is None:
+            return self.ravel()
+        mask = np.asarray(mask)
+        if mask.size != self.size:
+            raise ValueError(
+                f"Meshgrid has {self.size} elements but mask has shape {mask.shape}, not ({self.size},)!"
+            )
+        if np.all(mask):
+            return self.ravel()
+        rows, cols = np.nonzero(mask.reshape(self.shape))
+        return self._x[cols], self._y[rows]
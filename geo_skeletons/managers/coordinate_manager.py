@@ -4,12 +4,52 @@ import numpy as np
 from geo_skeletons.errors import VariableExistsError
 
 from geo_skeletons.variables import DataVar, Magnitude, Direction, GridMask, Coordinate
-from typing import Union
+from typing import Union, Optional
 from geo_skeletons.errors import StaticSkeletonError
+from dataclasses import dataclass, replace
+from functools import wraps
+from geo_skeletons import packing
 
 from geo_skeletons.variable_archive import SPATIAL_COORDS
 
 
+def cached_query(method):
+    """Caches the result of a query of the structure (e.g. .coords('grid')) until the structure is changed.
+
+    A copy of the cached list is returned, so the caller is free to modify it."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, self.x_str, self.y_str, args, tuple(kwargs.items()))
+        if key not in self._lookup:
+            self._lookup[key] = method(self, *args, **kwargs)
+        result = self._lookup[key]
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class AccessorPlan:
+    """How to get a variable from the Dataset. Resolved once per variable and cached in the CoordinateManager.
+
+    kind: 'coord', 'data', 'mask', 'magnitude', 'direction' or 'mask_point'
+    stored_name: Name of the variable in the Dataset (the primary mask for an opposite mask)
+    dir_type: The dir_type the data is stored in (None if not directional)
+    inverted: The mask is the opposite of the stored mask
+    packed: The data is stored packed into integers and needs to be unpacked
+    """
+
+    name: str
+    kind: str
+    stored_name: str
+    dir_type: Optional[str] = None
+    inverted: bool = False
+    packed: bool = False
+
+
 class CoordinateManager:
     """Keeps track of coordinates and data variables that are added to classes
     by the decorators."""
@@ -28,6 +68,7 @@ class CoordinateManager:
         self._added_directions = {}
         self._added_masks = {}
         self._added_mask_points = {}
+        self._structure_changed()
 
         self._set_initial_coords = [c.name for c in initial_coords]
         self._set_initial_vars = [v.name for v in initial_vars]
@@ -37,6 +78,11 @@ class CoordinateManager:
 
         self.meta = metadata_manager
 
+    def _structure_changed(self) -> None:
+        """Throws away all cached queries. Needs to be called every time the structure is changed."""
+        self._accessor_plans = {}
+        self._lookup = {}
+
     def _is_initialized(self) -> bool:
         """Check if the Dataset had been initialized"""
         return self.x_str is not None and self.y_str is not None
@@ -70,10 +116,23 @@ class CoordinateManager:
         if self.get(data_var.name) is not None:
             raise VariableExistsError(data_var.name)
         self._added_vars[data_var.name] = data_var
+        self._structure_changed()
 
         # Set metadata from MetaParameter if it is provided
         if data_var.meta is not None:
             self.meta.append(data_var.meta.meta_dict(), data_var.name)
+        if packing.is_packed(data_var):
+            self.meta.append(packing.packing_attrs(data_var), data_var.name)
+
+    def set_var_dtype(self, name: str, dtype: str) -> None:
+        """Sets the dtype that an already added data variable is stored in"""
+        data_var = self._added_vars.get(name)
+        if data_var is None:
+            raise KeyError(f"No data variable '{name}' exists!")
+        self._added_vars[name] = replace(
+            data_var, dtype=dtype, scale_factor=None, add_offset=None
+        )
+        self._structure_changed()
 
     def add_mask(self, grid_mask: GridMask) -> None:
         """Adds a mask to the structure"""
@@ -90,6 +149,7 @@ class CoordinateManager:
             )
         self._added_masks[grid_mask.name] = grid_mask
         self._added_mask_points[grid_mask.point_name] = grid_mask
+        self._structure_changed()
 
         # Set metadata from MetaParameter if it is provided
         if grid_mask.meta is not None:
@@ -106,6 +166,7 @@ class CoordinateManager:
         if self.get(coord.name) is not None:
             raise VariableExistsError(coord.name)
         self._added_coords[coord.name] = coord
+        self._structure_changed()
 
         # Set metadata from MetaParameter if it is provided
         if coord.meta is not None:
@@ -116,6 +177,7 @@ class CoordinateManager:
         if self.get(magnitude.name) is not None:
             raise VariableExistsError(magnitude.name)
         self._added_magnitudes[magnitude.name] = magnitude
+        self._structure_changed()
 
         # Set metadata from MetaParameter if it is provided
         if magnitude.meta is not None:
@@ -126,6 +188,7 @@ class CoordinateManager:
         if self.get(direction.name) is not None:
             raise VariableExistsError(direction.name)
         self._added_directions[direction.name] = direction
+        self._structure_changed()
 
         # Set metadata from MetaParameter if it is provided
         if direction.meta is not None:
@@ -141,6 +204,7 @@ class CoordinateManager:
                 del self._added_vars[var]
         for var in initial_vars:
             self._added_vars[var.name] = var
+        self._structure_changed()
 
     def set_initial_coords(self, initial_coords: list) -> None:
         """Set dictionary containing the initial coordinates of the Skeleton"""
@@ -152,7 +216,9 @@ class CoordinateManager:
                 del self._added_coords[coord]
         for coord in initial_coords:
             self._added_coords[coord.name] = coord
+        self._structure_changed()
 
+    @cached_query
     def coords(self, coord_group: str = "all", cartesian: bool = None) -> list[str]:
         """Returns list of coordinats that have been added to a specific coord group.
 
@@ -215,6 +281,7 @@ class CoordinateManager:
 
         return move_time_and_spatial_to_front(coords)
 
+    @cached_query
     def masks(self, coord_group: str = "all") -> list[str]:
         """Returns list of masks that have been added to a specific coord group.
 
@@ -253,6 +320,7 @@ class CoordinateManager:
 
         return [mask.name for mask in masks]
 
+    @cached_query
     def mask_points(self, coord_group: str = "all") -> list[str]:
         """Returns list of mask_points that have been added to a specific coord group.
 
@@ -307,6 +375,7 @@ class CoordinateManager:
                     return mask
         return None
 
+    @cached_query
     def data_vars(self, coord_group: str = "nonspatial") -> list[str]:
         """Returns list of variables that have been added to a specific coord group.
 
@@ -343,6 +412,7 @@ class CoordinateManager:
 
         return move_time_and_spatial_to_front([var.name for var in vars if var.name])
 
+    @cached_query
     def magnitudes(self, coord_group: str = "all") -> list[str]:
         """Returns list of magnitudes that have been added to a specific coord group.
 
@@ -381,6 +451,7 @@ class CoordinateManager:
 
         return [var.name for var in vars]
 
+    @cached_query
     def directions(self, coord_group: str = "all") -> list[str]:
         """Returns list of directions that have been added to a specific coord group.
 
@@ -419,6 +490,7 @@ class CoordinateManager:
 
         return [var.name for var in vars]
 
+    @cached_query
     def all_objects(self, coord_group: str = "all") -> list[str]:
         """Returns a list of all objects for the given coord_group"""
         list_of_objects = (
@@ -430,6 +502,7 @@ class CoordinateManager:
         )
         return list_of_objects
 
+    @cached_query
     def non_coord_objects(self, coord_group: str = "all") -> list[str]:
         """Returns a list of all objects for given coord_group that are not coords or spatial data_vars (e.g. 'x' in PointSkeleton)"""
         not_accepted = set(self.coords("all") + self.data_vars("spatial"))
@@ -437,6 +510,7 @@ class CoordinateManager:
         accepted = all_objects - not_accepted
         return list(accepted)
 
+    @cached_query
     def coord_group(self, var: str) -> str:
         """Returns the coordinate group that a variable/mask is defined over.
         The coordinates can then be retrived using the group by the method .coords()"""
@@ -451,6 +525,11 @@ class CoordinateManager:
 
         return all_vars[0].coord_group
 
+    @cached_query
+    def dims(self, var: str) -> list[str]:
+        """Returns the coordinates that a variable/mask is defined over (in order)"""
+        return self.coords(self.coord_group(var))
+
     def get(
         self, var: str
     ) -> Union[Coordinate, DataVar, Magnitude, Direction, GridMask]:
@@ -463,6 +542,44 @@ class CoordinateManager:
             or self._added_masks.get(var)
         )
 
+    def accessor_plan(self, name: str) -> Optional[AccessorPlan]:
+        """Returns the (cached) plan of how to get a variable. None if variable is unknown."""
+        if name not in self._accessor_plans:
+            self._accessor_plans[name] = self._create_accessor_plan(name)
+        return self._accessor_plans[name]
+
+    def _create_accessor_plan(self, name: str) -> Optional[AccessorPlan]:
+        if name in self._added_mask_points:
+            return AccessorPlan(name=name, kind="mask_point", stored_name=name)
+        if name in self._added_coords:
+            return AccessorPlan(name=name, kind="coord", stored_name=name)
+        if name in self._added_magnitudes:
+            return AccessorPlan(name=name, kind="magnitude", stored_name=name)
+        if name in self._added_directions:
+            return AccessorPlan(
+                name=name,
+                kind="direction",
+                stored_name=name,
+                dir_type=self._added_directions[name].dir_type,
+            )
+        if name in self._added_masks:
+            inverted = not self._mask_is_primary(name)
+            return AccessorPlan(
+                name=name,
+                kind="mask",
+                stored_name=self._find_primary_mask(name) if inverted else name,
+                inverted=inverted,
+            )
+        if name in self._added_vars:
+            return AccessorPlan(
+                name=name,
+                kind="data",
+                stored_name=name,
+                dir_type=self.get_dir_type(name),
+                packed=packing.is_packed(self._added_vars[name]),
+            )
+        return None
+
     def meta_parameter(self, var: str) -> Union[MetaParameter, None]:
         """Returns a metaparameter for a given parameter"""
         param = self.get(var)
@@ -524,6 +641,36 @@ class CoordinateManager:
                 return clean_names
             return names
 
+    def describe(self) -> dict:
+        """Returns a JSON-serializable description of the structure (coordinates, variables, masks etc.).
+
+        Used to store the structure of a Skeleton so it can be read without decoding the Dataset."""
+        return {
+            "x_str": self.x_str,
+            "y_str": self.y_str,
+            "coords": {c: self.coord_group(c) for c in self.coords("all")},
+            "data_vars": {
+                v: {
+                    "coord_group": self.coord_group(v),
+                    "dir_type": self.get(v).dir_type,
+                }
+                for v in self.data_vars("all")
+            },
+            "masks": {m: self.coord_group(m) for m in self.masks("all")},
+            "magnitudes": {
+                m: {"x": self.get(m).x, "y": self.get(m).y}
+                for m in self.magnitudes("all")
+            },
+            "directions": {
+                d: {
+                    "x": self.get(d).x,
+                    "y": self.get(d).y,
+                    "dir_type": self.get(d).dir_type,
+                }
+                for d in self.directions("all")
+            },
+        }
+
     def __repr__(self):
         def string_of_coords(list_of_coords) -> str:
             if not list_of_coords:
@@ -3,11 +3,12 @@ from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from ..skeleton import Skeleton
+import dask
 import dask.array as da
 import xarray as xr
 import numpy as np
 
-from geo_skeletons.dask_computations import data_is_dask
+from geo_skeletons.dask_computations import data_is_dask, ComputeCounter
 
 
 class DaskManager:
@@ -50,29 +51,64 @@ class DaskManager:
             for dim in primary_dim:
                 chunks[dim] = len(self._skeleton.get(dim))
 
-        if isinstance(chunks, dict):
-            chunks = self._skeleton._chunk_tuple_from_dict(chunks)
-        for var in self._skeleton.core.data_vars():
-            data = self._skeleton.get(var, strict=True)
-            if data is not None:
-                self._skeleton.set(var, self.dask_me(data, chunks))
-        for var in self._skeleton.core.masks():
-            data = self._skeleton.get(var, strict=True)
-            if data is not None:
-                self._skeleton.set(var, self.dask_me(data, chunks))
+        new_data = {}
+        for var, data in self._stored_data().items():
+            var_chunks = self._chunks_for_dims(chunks, data.dims)
+            if self.data_is_dask(data):
+                new_data[var] = data.data.rechunk(var_chunks)
+            else:
+                new_data[var] = da.from_array(data.data, chunks=var_chunks)
+
+        # Set directly to the Dataset, since the values don't change
+        if new_data:
+            self._skeleton._ds_manager.set_many(new_data)
 
     def dechunk(self) -> None:
         """Computes all dask arrays and coverts them to numpy arrays.
 
         If data is big this might taka a long time or kill Python."""
-        for var in self._skeleton.core.data_vars():
-            data = self._skeleton.get(var)
+        dask_data = {
+            var: data.data
+            for var, data in self._stored_data().items()
+            if self.data_is_dask(data)
+        }
+        # Compute everything at once so that shared parts of the graphs are only computed once
+        computed = dask.compute(*dask_data.values())
+        if dask_data:
+            self._skeleton._ds_manager.set_many(dict(zip(dask_data.keys(), computed)))
+
+    def _stored_data(self) -> dict[str, xr.DataArray]:
+        """The data variables and masks that are stored in the Dataset"""
+        stored_data = {}
+        for var in self._skeleton.core.data_vars() + self._skeleton.core.masks():
+            data = self._skeleton._ds_manager.get(var, strict=True)
             if data is not None:
-                self._skeleton.set(var, self.undask_me(data))
-        for var in self._skeleton.core.masks():
-            data = self._skeleton.get(var)
-            if data is not None:
-                self._skeleton.set(var, self.undask_me(data))
+                stored_data[var] = data
+        return stored_data
+
+    def _chunks_for_dims(
+        self, chunks: Union[tuple[int], dict[str, int], str], dims: tuple[str]
+    ) -> Union[tuple[int], str]:
+        """Determines the chunks of a variable based on chunks given for all coordinates of the Skeleton"""
+        if isinstance(chunks, str):
+            return chunks
+
+        all_coords = self._skeleton.core.coords()
+        if not isinstance(chunks, dict):
+            if len(chunks) != len(all_coords):
+                return chunks
+            chunks = dict(zip(all_coords, chunks))
+        return tuple(chunks.get(dim, "auto") for dim in dims)
+
+    @staticmethod
+    def count_computes(verbose: bool = False) -> ComputeCounter:
+        """Context manager that counts (and reports if verbose) all dask computations:
+
+        with skeleton.dask.count_computes() as counter:
+            skeleton.set_hs(hs)
+        counter.count, counter.calls
+        """
+        return ComputeCounter(verbose=verbose)
 
     def is_active(self) -> bool:
         """Checks if dask-mode is activated"""
@@ -11,9 +11,10 @@ from ..errors import (
     CoordinateWrongLengthError,
     GridError,
 )
-from typing import Any
+from typing import Any, Optional
 
 import dask
+from geo_skeletons.dask_computations import data_is_dask, writable_constant
 
 
 class DatasetManager:
@@ -22,6 +23,8 @@ class DatasetManager:
 
     def __init__(self, coordinate_manager: CoordinateManager) -> None:
         self.coord_manager = coordinate_manager
+        # Variables whose numpy buffers are private to this Dataset and can be written to in place
+        self._writable_vars: set[str] = set()
 
     def create_structure(
         self, x: np.ndarray, y: np.ndarray, new_coords: dict[str, np.ndarray]
@@ -144,6 +147,13 @@ class DatasetManager:
 
     def set_new_ds(self, ds: xr.Dataset) -> None:
         self.data = ds
+        self._writable_vars = set()
+
+    def mark_shared(self) -> None:
+        """The data has been given out (e.g. the Dataset, a view or a slice), so the buffers might be shared.
+
+        They are then copied before they are written to in place the next time."""
+        self._writable_vars = set()
 
     def ds(self) -> xr.Dataset:
         """Resturns the Dataset (None if doesn't exist)."""
@@ -151,16 +161,71 @@ class DatasetManager:
             return None
         return self.data
 
-    def set(self, data: np.ndarray, name: str) -> None:
-        """Adds in new data to the Dataset."""
-        all_metadata = self.get_attrs()
-        self.data[name] = self.compile_data_array(data, name)
+    def set(
+        self, data: np.ndarray, name: str, attrs: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Adds in new data to the Dataset.
+
+        attrs [None]: Attributes of the variable. Keeps possible existing attributes if not given.
+
+        Only the variable itself is replaced, so the attributes of other variables are not touched."""
+        self.data[name] = self.compile_data_array(data, name, attrs)
+        self._writable_vars.discard(name)
+
+    def set_many(
+        self,
+        data_dict: dict[str, np.ndarray],
+        attrs: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> None:
+        """Adds in several new variables to the Dataset with one update.
+
+        attrs [None]: Attributes of the variables (keys are the variable names)."""
+        attrs = attrs or {}
+        self.data.update(
+            {
+                name: self.compile_data_array(data, name, attrs.get(name))
+                for name, data in data_dict.items()
+            }
+        )
+        self._writable_vars.difference_update(data_dict)
+
+    def write_region(self, name: str, index: tuple, data: np.ndarray) -> None:
+        """Writes data into a region of a stored variable without replacing the rest of the variable.
+
+        index: tuple of integers, slices or integer arrays (one per dimension of the variable).
+            Several integer arrays index the dimensions independently (e.g. a batch of times and points).
+
+        Numpy data is written in place. The buffer is copied before the first write after the data was given out
+        (see mark_shared), since it might be shared (e.g. with a sliced Skeleton or a zero-stride placeholder).
+        Dask data stays lazy: the region is assigned in the task graph.
 
-        for var, metadata in all_metadata.items():
-            if var == "_global_":
-                self.set_attrs(metadata)
+        The stored variable is upcast if needed, e.g. when writing floats into data that was set as integers."""
+        variable = self.data.variables[name]
+        dtype = np.result_type(
+            variable.dtype, data.dtype if hasattr(data, "dtype") else np.asarray(data)
+        )
+
+        # Dask already indexes several integer arrays independently
+        if data_is_dask(variable.data):
+            new_data = variable.data.astype(dtype, copy=True)
+            new_data[index] = data
+            variable.data = new_data
+            return
+
+        if name not in self._writable_vars:
+            stored = variable.data
+            if stored.flags.writeable:
+                stored = stored.astype(dtype, copy=True)
             else:
-                self.set_attrs(metadata, var)
+                stored = writable_constant(stored)
+                if not stored.flags.owndata or stored.dtype != dtype:
+                    stored = stored.astype(dtype, copy=True)
+            variable.data = stored
+            self._writable_vars.add(name)
+        elif variable.dtype != dtype:
+            variable.data = variable.data.astype(dtype)
+
+        variable.data[_orthogonal_index(index, variable.shape)] = data
 
     def empty_vars(self) -> list[str]:
         """Get a list of empty variables"""
@@ -207,13 +272,17 @@ class DatasetManager:
                 return None
             coords = self.coord_manager.coords(obj.coord_group)
 
-            empty_data = dask.array.full(
+            # Zero-stride constant, so no memory is used until data is actually written
+            empty_data = np.broadcast_to(
+                np.array(
+                    obj.default_value,
+                    dtype=bool if name in self.coord_manager.masks("all") else None,
+                ),
                 self.coords_to_size(coords),
-                obj.default_value,
             )
 
-            coords_dict = {coord: self.get(coord) for coord in coords}
-            data = xr.DataArray(data=empty_data, coords=coords_dict)
+            coords_dict = {coord: ds[coord] for coord in coords}
+            data = xr.DataArray(data=empty_data, coords=coords_dict, dims=coords)
 
         return self._slice_data(data, **kwargs)
 
@@ -243,10 +312,29 @@ class DatasetManager:
             self.data = self.data.drop_attrs(deep=False)
             self.data = self.data.assign_attrs(**attributes)
         else:
-            self.data[data_array_name] = self.data[data_array_name].drop_attrs()
-            self.data[data_array_name] = self.data.get(data_array_name).assign_attrs(
-                **attributes
-            )
+            # Shallow copy, since the variable might be shared with other Datasets
+            daa = self.data[data_array_name].copy(deep=False)
+            daa.attrs = dict(attributes)
+            self.data[data_array_name] = daa
+
+    def set_many_attrs(self, attributes: dict[str, dict[str, Any]]) -> None:
+        """Sets attributes to several DataArrays with one update. Key '_global_' sets global attributes.
+
+        Attributes that are already set are skipped."""
+        global_attrs = attributes.get("_global_")
+        if global_attrs is not None and global_attrs != self.data.attrs:
+            self.set_attrs(global_attrs)
+
+        variables = {}
+        for name, attrs in attributes.items():
+            if name == "_global_" or self.data.variables[name].attrs == attrs:
+                continue
+            # Shallow copy, since the variable might be shared with other Datasets
+            variables[name] = self.data.variables[name].copy(deep=False)
+            variables[name].attrs = dict(attrs)
+
+        if variables:
+            self.data.update(variables)
 
     def _slice_data(self, data: xr.DataArray, **kwargs) -> xr.DataArray:
         coordinates = {}
@@ -273,18 +361,26 @@ class DatasetManager:
         for ds in ds_list:
             self.set_new_ds(ds.merge(self.ds(), compat="override"))
 
-    def compile_data_array(self, data: np.ndarray, name: str) -> xr.DataArray:
-        """Creates an xr.DataArray based on the np.array data and the variable name"""
+    def compile_data_array(
+        self, data: np.ndarray, name: str, attrs: Optional[dict[str, Any]] = None
+    ) -> xr.DataArray:
+        """Creates an xr.DataArray based on the np.array data and the variable name
+
+        The existing coordinates (with their attributes) are used. If 'attrs' is not given, then the
+        attributes of a possible existing variable are kept."""
+        if attrs is None:
+            old_data = self.get(name)
+            attrs = old_data.attrs if old_data is not None else {}
 
         if name in self.coord_manager.coords("all"):
             # E.g. 'lon' should only depend on dim 'lon', not ['lat','lon']
-            coord_dict = {name: ([name], data)}
+            coords = [name]
+            coord_dict = {name: ([name], data, attrs)}
         else:
-            coord_group = self.coord_manager.coord_group(name)
-            coords = self.coord_manager.coords(coord_group)
-            coord_dict = {coord: ([coord], self.get(coord).data) for coord in coords}
+            coords = self.coord_manager.dims(name)
+            coord_dict = {coord: self.data[coord].variable for coord in coords}
 
-        daa = xr.DataArray(data=data, coords=coord_dict)
+        daa = xr.DataArray(data=data, coords=coord_dict, dims=coords, attrs=attrs)
         daa.name = name
         return daa
 
@@ -298,9 +394,38 @@ class DatasetManager:
 
     def coords_to_size(self, coords: list[str], **kwargs) -> tuple[int]:
         """Gets the size of the data for a list of coordinates"""
+        if not kwargs:
+            return tuple(self.data.sizes[coord] for coord in coords)
+
         list = []
         data = self._slice_data(self.ds(), **kwargs)
         for coord in coords:
             list.append(len(data.get(coord)))
 
         return tuple(list)
+
+
+def _orthogonal_index(index: tuple, shape: tuple[int]) -> tuple:
+    """Makes integer arrays index the dimensions independently (as in xarray) and not pointwise (as in numpy)"""
+    n_arrays = sum(np.ndim(ind) > 0 for ind in index)
+    # Integers combined with an array are also advanced indices in numpy
+    n_advanced = sum(not isinstance(ind, slice) for ind in index)
+    if n_arrays == 0 or n_advanced < 2:
+        return tuple(index)
+
+    arrays = []
+    for ind, size in zip(index, shape):
+        if isinstance(ind, slice):
+            ind = np.arange(size)[ind]
+        arrays.append(np.atleast_1d(ind))
+    squeezed = [
+        n
+        for n, ind in enumerate(index)
+        if np.ndim(ind) == 0 and not isinstance(ind, slice)
+    ]
+    mesh = np.ix_(*arrays)
+    if not squeezed:
+        return mesh
+    # Integer indices drop the dimension
+    return tuple(np.squeeze(m, axis=tuple(squeezed)) for m in mesh)
+
@@ -5,17 +5,45 @@ if TYPE_CHECKING:
     from .dataset_manager import DatasetManager
 
 from copy import deepcopy
+from collections.abc import Mapping
 
 
 class MetaDataManager:
+    """Stores the metadata of the variables and the global metadata.
+
+    The stored dicts are never modified in place (a change always replaces the dict), so they can be
+    shared between copies of the manager. Only a shallow copy is needed when the metadata is handed out.
+
+    Setting metadata only marks it as changed. The metadata is written to the Dataset with .sync_to_ds(),
+    which is done when the Dataset is accessed through the Skeleton."""
+
     def __init__(self, ds_manager: Union[DatasetManager, None]):
         self._ds_manager = ds_manager
         self._metadata: dict = {}
+        # Names of metadata that has changed since last written to the Dataset
+        self._unsynced: set[str] = set()
+        self._version = 0
         # This will be used to make a deepcopy of the manager for different classes
         self._initial_state = True
         # This will be used to make a deepcopy of the manager for instances
         self._uninitialized = True
 
+    def __deepcopy__(self, memo: dict) -> MetaDataManager:
+        new_manager = object.__new__(type(self))
+        memo[id(self)] = new_manager
+        for key, value in self.__dict__.items():
+            if key == "_metadata":
+                # The stored dicts are never modified, so they can be shared
+                new_manager._metadata = dict(value)
+            else:
+                setattr(new_manager, key, deepcopy(value, memo))
+        return new_manager
+
+    @property
+    def version(self) -> int:
+        """Increases every time the metadata is changed"""
+        return self._version
+
     def _ds_set_possible(self, name: Optional[str]):
         """Checks if it is possible to set metadata to the dataset"""
         if self._ds_manager is None:
@@ -45,21 +73,29 @@ class MetaDataManager:
 
         If 'name' is not given, the metadata is saved as general metadata not connected to any variable.
         """
-        if not isinstance(metadata, dict):
+        if not isinstance(metadata, Mapping):
             raise TypeError(f"metadata needs to be a dict, not '{metadata}'!")
 
         # Store the metadata
-        if name is not None:
-            self._metadata[name] = metadata
-        else:
-            self._metadata["_global_"] = metadata
-        self.metadata_to_ds(name)
+        name = name or "_global_"
+        self._metadata[name] = dict(metadata)
+        self._unsynced.add(name)
+        self._version += 1
 
     def metadata_to_ds(self, name: Optional[str]) -> None:
-        """Sets the stored metadata the the underlying dataset if possible"""
-        if self._ds_set_possible(name):
-            metadata = self.get(name)
-            self._ds_manager.set_attrs(metadata, name)
+        """Marks the stored metadata to be set to the underlying dataset"""
+        self._unsynced.add(name or "_global_")
+
+    def sync_to_ds(self) -> None:
+        """Sets all metadata that has changed to the underlying dataset if possible"""
+        if not self._unsynced or not self._ds_set_possible(None):
+            return
+        attrs = {}
+        for name in self._unsynced:
+            if name == "_global_" or self._ds_set_possible(name):
+                attrs[name] = self.get(name)
+        self._ds_manager.set_many_attrs(attrs)
+        self._unsynced = set()
 
     def append(
         self,
@@ -70,21 +106,15 @@ class MetaDataManager:
 
         If 'name' is not given, the metadata is saved as general metadata not connected to any variable.
         """
-        old_metadata = self.get(name)
-
-        old_metadata.update(metadata)
-        self.set(old_metadata, name)
+        self.set({**self.get(name), **metadata}, name)
 
     def get(self, name: Optional[str] = None) -> dict[str, Any]:
-        """Return metadata.
+        """Return metadata (a shallow copy that can be modified freely).
 
         If 'name' is not given, it return the metadata not connected to any variable.
         """
-        if name is None:
-            return deepcopy(self.meta_dict().get("_global_", {}))
-
-        return deepcopy(self.meta_dict().get(name, {}))
+        return dict(self._metadata.get(name or "_global_", {}))
 
     def meta_dict(self) -> dict:
         """Returns a dictonary of all the metadata"""
-        return self._metadata
+        return {name: dict(metadata) for name, metadata in self._metadata.items()}
@@ -0,0 +1,338 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import hashlib
+import os
+from scipy.spatial import Delaunay, cKDTree
+from scipy import sparse
+import numpy as np
+
+REGRID_METHODS = ["nearest", "linear"]
+
+
+@dataclass
+class RegridWeights:
+    """Interpolation weights from source points to target points as a sparse matrix (n_target x n_source).
+
+    The geometry (triangulation / nearest neighbours) is determined once, and the weights can then be applied to any
+    number of fields defined on the source points. Targets outside the convex hull of the source points ('linear') are NaN.
+    """
+
+    matrix: sparse.csr_matrix
+    outside: np.ndarray
+    target_shape: tuple
+    method: str
+    fingerprint: str = ""
+
+    @classmethod
+    def from_points(
+        cls,
+        source_points: np.ndarray,
+        target_points: np.ndarray,
+        method: str = "nearest",
+        target_shape: Optional[tuple] = None,
+    ) -> RegridWeights:
+        """Determines the weights between source points (n_source x 2) and target points (n_target x 2)
+
+        method:
+        'nearest' [default]: value of the nearest source point
+        'linear': barycentric interpolation in the Delaunay triangulation of the source points
+        """
+        if method not in REGRID_METHODS:
+            raise ValueError(f"'method' needs to be in {REGRID_METHODS}, not '{method}'!")
+
+        n_source, n_target = len(source_points), len(target_points)
+        target_shape = tuple(target_shape or (n_target,))
+        fingerprint = regrid_fingerprint(
+            source_points, target_points, method, target_shape
+        )
+
+        if method == "nearest":
+            __, inds = cKDTree(source_points).query(target_points)
+            matrix = sparse.csr_matrix(
+                (np.ones(n_target), (np.arange(n_target), inds)),
+                shape=(n_target, n_source),
+            )
+            return cls(
+                matrix, np.full(n_target, False), target_shape, method, fingerprint
+            )
+
+        tri = Delaunay(source_points)
+        simplex = tri.find_simplex(target_points)
+        outside = simplex < 0
+        ndim = tri.ndim
+
+        transform = tri.transform[simplex]
+        bary = np.einsum(
+            "nij,nj->ni", transform[:, :ndim], target_points - transform[:, ndim]
+        )
+        weights = np.c_[bary, 1 - bary.sum(axis=1)]
+        weights[outside] = 0.0
+        vertices = tri.simplices[simplex]
+
+        matrix = sparse.csr_matrix(
+            (
+                weights.ravel(),
+                (np.repeat(np.arange(n_target), ndim + 1), vertices.ravel()),
+            ),
+            shape=(n_target, n_source),
+        )
+        return cls(matrix, outside, target_shape, method, fingerprint)
+
+    @classmethod
+    def from_skeletons(
+        cls,
+        data,
+        new_grid,
+        method: str = "nearest",
+        source_mask: Optional[np.ndarray] = None,
+        cache_dir: Optional[str] = None,
+    ) -> RegridWeights:
+        """Determines the weights to regrid the spatial data of a Skeleton to a new grid.
+
+        source_mask: Use only these source points (flattened spatial data), e.g. to exclude NaN values
+        cache_dir: Read the weights from this directory if they have been determined before. Otherwise they are written there.
+            The files are identified by a hash of the source and target coordinates, so they can be reused between runs.
+        """
+        source_points, target_points, target_shape = regrid_points(data, new_grid)
+        if source_mask is not None:
+            source_points = source_points[source_mask]
+
+        if cache_dir is None:
+            return cls.from_points(source_points, target_points, method, target_shape)
+
+        fingerprint = regrid_fingerprint(
+            source_points, target_points, method, target_shape
+        )
+        filename = os.path.join(cache_dir, f"regrid_weights_{fingerprint}.npz")
+        if os.path.isfile(filename):
+            weights = cls.load(filename)
+            if weights.fingerprint == fingerprint:
+                return weights
+
+        weights = cls.from_points(source_points, target_points, method, target_shape)
+        os.makedirs(cache_dir, exist_ok=True)
+        weights.save(filename)
+        return weights
+
+    def save(self, filename: str) -> None:
+        """Writes the weights to a compressed npz-file"""
+        matrix = self.matrix.tocsr()
+        # Write to a temporary file first so that concurrent runs never read a half written file
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            np.savez_compressed(
+                f,
+                data=matrix.data,
+                indices=matrix.indices,
+                indptr=matrix.indptr,
+                shape=np.array(matrix.shape),
+                outside=self.outside,
+                target_shape=np.array(self.target_shape),
+                method=np.array(self.method),
+                fingerprint=np.array(self.fingerprint),
+            )
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> RegridWeights:
+        """Reads weights written by .save()"""
+        with np.load(filename) as npz:
+            matrix = sparse.csr_matrix(
+                (npz["data"], npz["indices"], npz["indptr"]),
+                shape=tuple(npz["shape"]),
+            )
+            return cls(
+                matrix,
+                npz["outside"],
+                tuple(int(n) for n in npz["target_shape"]),
+                str(npz["method"]),
+                str(npz["fingerprint"]),
+            )
+
+    def apply(self, values: np.ndarray, workers: int = 1) -> np.ndarray:
+        """Applies the weights to values (..., n_source). Returns an array (..., *target_shape).
+
+        The leading dimensions (e.g. time) are split in chunks and processed by 'workers' threads."""
+        leading_shape = values.shape[:-1]
+        values = values.reshape(-1, values.shape[-1])
+
+        if workers > 1 and len(values) > 1:
+            chunks = np.array_split(np.arange(len(values)), min(4 * workers, len(values)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                new_values = np.concatenate(
+                    list(executor.map(lambda inds: self._apply_2d(values[inds]), chunks))
+                )
+        else:
+            new_values = self._apply_2d(values)
+
+        return new_values.reshape(leading_shape + tuple(self.target_shape))
+
+    def _apply_2d(self, values: np.ndarray) -> np.ndarray:
+        """values (n, n_source) -> (n, n_target)"""
+        new_values = (self.matrix @ values.T).T
+        new_values[:, self.outside] = np.nan
+        return new_values
+
+
+def regrid_fingerprint(
+    source_points: np.ndarray,
+    target_points: np.ndarray,
+    method: str,
+    target_shape: tuple,
+) -> str:
+    """Hash of everything that determines the weights: source and target coordinates and the method"""
+    sha = hashlib.sha256()
+    for points in (source_points, target_points):
+        points = np.ascontiguousarray(points, dtype=float)
+        sha.update(str(points.shape).encode())
+        sha.update(points.tobytes())
+    sha.update(f"{method}{tuple(target_shape)}".encode())
+    return sha.hexdigest()
+
+
+def regrid_points(data, new_grid) -> tuple[np.ndarray, np.ndarray, tuple]:
+    """Determines the source points (n_source x 2), the target points (n_target x 2) and the shape of the target"""
+    if new_grid.is_gridded():
+        target_lon, target_lat = new_grid.longrid(native=True), new_grid.latgrid(
+            native=True
+        )
+    else:
+        target_lon, target_lat = new_grid.lonlat(native=True)
+
+    if new_grid.core.is_cartesian():
+        lon, lat = data.xy()
+    else:
+        lon, lat = data.lonlat()
+
+    source_points = np.column_stack([lon, lat])
+    target_points = np.column_stack([np.ravel(target_lon), np.ravel(target_lat)])
+    return source_points, target_points, np.shape(target_lon)
+
+
+def sparse_regrid(
+    data,
+    new_grid,
+    new_data,
+    verbose,
+    method: str = "nearest",
+    drop_nan: bool = False,
+    mask_nan: float = None,
+    workers: int = 1,
+    weights: Optional[RegridWeights] = None,
+    cache_dir: Optional[str] = None,
+    **kwargs,
+):
+    """Regrids using sparse interpolation weights that are determined only once and then applied to all variables and time steps.
+
+    Gives the same result as the 'scipy' engine (griddata), but all non-spatial dimensions (e.g. time) are interpolated at once.
+
+    workers [1]: Number of threads used to apply the weights
+    weights: Precomputed RegridWeights (e.g. from RegridWeights.from_skeletons) to be reused. Not used with 'drop_nan'.
+    cache_dir: Directory where weights are cached between runs (see RegridWeights.from_skeletons)
+    """
+    if weights is None:
+        weights = RegridWeights.from_skeletons(
+            data, new_grid, method=method, cache_dir=cache_dir
+        )
+
+    spatial_coords = data.core.coords("spatial")
+    new_spatial_coords = new_data.core.coords("spatial")
+
+    if verbose:
+        print(f"Using '{weights.method}' weights ({weights.matrix.nnz} non-zero)")
+        if drop_nan:
+            print("Excluding nan values from interpolation")
+        elif mask_nan is not None:
+            print(f"Replacing nan values with {mask_nan}")
+
+    # Weights for source data with NaN-values dropped. Determined once for every unique NaN-pattern
+    masked_weights = {}
+
+    for var_name in data.core.data_vars("all"):
+        if var_name in ["x", "y", "lon", "lat"]:
+            continue
+        if data.get(var_name, strict=True) is None:
+            continue
+
+        var_coords = data.core.coords(data.core.get(var_name).coord_group)
+        other_coords = [c for c in var_coords if c not in spatial_coords]
+        if not set(spatial_coords).issubset(var_coords) or not set(
+            other_coords
+        ).issubset(new_data.core.coords("all")):
+            if verbose:
+                print(f"'{var_name}' {var_coords}: Skipping!")
+            continue
+
+        if verbose:
+            print(f"'{var_name}' {var_coords}: Regridding...")
+
+        # Spatial dimensions last and flattened
+        values = data.get(var_name, data_array=True, dask=False).transpose(
+            *other_coords, *spatial_coords
+        )
+        leading_shape = values.shape[: len(other_coords)]
+        values = values.values.reshape(leading_shape + (-1,)).astype(float)
+
+        if drop_nan:
+            new_array = _apply_dropping_nan(
+                data, new_grid, values, method, masked_weights, workers, cache_dir
+            )
+        else:
+            if mask_nan is not None:
+                values = np.where(np.isnan(values), mask_nan, values)
+            new_array = weights.apply(values, workers=workers)
+
+        new_data.set(
+            var_name,
+            new_array,
+            coords=other_coords + new_spatial_coords,
+            allow_transpose=True,
+        )
+
+    return new_data
+
+
+def _apply_dropping_nan(
+    data,
+    new_grid,
+    values: np.ndarray,
+    method: str,
+    masked_weights: dict,
+    workers: int,
+    cache_dir: Optional[str],
+) -> np.ndarray:
+    """Applies weights determined for the non-NaN source points. Fields with the same NaN-pattern share weights."""
+    leading_shape = values.shape[:-1]
+    values = values.reshape(-1, values.shape[-1])
+    valid = np.logical_not(np.isnan(values))
+    patterns, pattern_inds = np.unique(valid, axis=0, return_inverse=True)
+    pattern_inds = np.ravel(pattern_inds)
+
+    new_values = None
+    for n, pattern in enumerate(patterns):
+        key = pattern.tobytes()
+        if key not in masked_weights:
+            masked_weights[key] = RegridWeights.from_skeletons(
+                data, new_grid, method=method, source_mask=pattern, cache_dir=cache_dir
+            )
+        weights = masked_weights[key]
+        fields = pattern_inds == n
+        regridded = weights.apply(values[fields][:, pattern], workers=workers)
+        if new_values is None:
+            new_values = np.empty((len(values),) + regridded.shape[1:])
+        new_values[fields] = regridded
+
+    return new_values.reshape(leading_shape + new_values.shape[1:])
+
+
+sparse_regridders = {
+    "gridded_to_gridded": sparse_regrid,
+    "point_to_gridded": sparse_regrid,
+    "gridded_to_point": sparse_regrid,
+    "point_to_point": sparse_regrid,
+    "available": True,
+    "installation": "Native (scipy)",
+    "options": "method: str, drop_nan: bool, mask_nan: float, workers: int, weights: RegridWeights, cache_dir: str",
+}
@@ -0,0 +1,180 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+import xarray as xr
+import dask.array as da
+from typing import Union
+from geo_skeletons.dask_computations import data_is_dask
+
+TIME_REDUCERS = [
+    "mean",
+    "squared_mean",
+    "period_mean",
+    "max",
+    "angular_mean",
+    "angular_mean_deg",
+]
+
+
+class TimeBins:
+    """Bins of a resampling in time. Determined once and then used for all variables.
+
+    The time steps are sorted, so every bin is a contiguous range of time indeces: starts[n]:starts[n+1]
+    Empty bins have starts[n] == starts[n+1]."""
+
+    def __init__(self, starts: np.ndarray):
+        self.starts = np.asarray(starts, dtype=int)
+
+    @classmethod
+    def from_time(
+        cls,
+        time: xr.DataArray,
+        freq: str,
+        closed: str,
+        offset: pd.Timedelta,
+    ) -> TimeBins:
+        """Determines the bins that xarray uses for .resample(time=freq, closed=closed, offset=offset)"""
+        counts = (
+            xr.DataArray(np.ones(len(time)), coords={"time": time.values})
+            .resample(time=freq, closed=closed, offset=offset)
+            .count()
+            .fillna(0)
+            .values.astype(int)
+        )
+        return cls(np.concatenate([[0], np.cumsum(counts)]))
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    def grouped(self, max_times: int) -> list[tuple[int, int]]:
+        """Groups consecutive bins (first, last+1) so that every group covers roughly max_times time steps"""
+        groups = []
+        first = 0
+        for n in range(len(self)):
+            if self.starts[n + 1] - self.starts[first] >= max_times:
+                groups.append((first, n + 1))
+                first = n + 1
+        if first < len(self) or not groups:
+            groups.append((first, len(self)))
+        return groups
+
+
+def resample_array(
+    data: Union[np.ndarray, da.Array],
+    bins: TimeBins,
+    reducer: str,
+    axis: int = 0,
+    skipna: bool = False,
+) -> Union[np.ndarray, da.Array]:
+    """Resamples an array along the time axis using the given bins.
+
+    reducer:
+    'mean': np.mean(x)
+    'squared_mean': np.sqrt(np.mean(x**2)) (e.g. for significant wave height)
+    'period_mean': np.mean(x**-1)**-1 (e.g. for wave periods)
+    'max': np.max(x)
+    'angular_mean': Circular mean of directions in radians [0, 2*pi)
+    'angular_mean_deg': Circular mean of directions in degrees [0, 360)
+
+    skipna [False]: Skip NaN values. Otherwise a NaN value gives a NaN for the entire bin.
+
+    Dask arrays are kept lazy. They are rechunked along time so that no bin is split between two chunks.
+    """
+    if reducer not in TIME_REDUCERS:
+        raise ValueError(f"'reducer' needs to be in {TIME_REDUCERS}, not '{reducer}'!")
+
+    if data_is_dask(data):
+        return _resample_dask(data, bins, reducer, axis, skipna)
+    return _resample_numpy(np.asarray(data), bins.starts, reducer, axis, skipna)
+
+
+def _resample_dask(
+    data: da.Array, bins: TimeBins, reducer: str, axis: int, skipna: bool
+) -> da.Array:
+    groups = bins.grouped(max_times=max(data.chunks[axis]))
+    time_chunks = tuple(bins.starts[last] - bins.starts[first] for first, last in groups)
+    data = data.rechunk({axis: time_chunks})
+
+    new_chunks = list(data.chunks)
+    new_chunks[axis] = tuple(last - first for first, last in groups)
+
+    def resample_block(block: np.ndarray, block_info=None) -> np.ndarray:
+        first, last = groups[block_info[0]["chunk-location"][axis]]
+        starts = bins.starts[first : last + 1] - bins.starts[first]
+        return _resample_numpy(block, starts, reducer, axis, skipna)
+
+    return da.map_blocks(
+        resample_block,
+        data,
+        chunks=tuple(new_chunks),
+        dtype=np.result_type(data.dtype, 1.0),
+    )
+
+
+def _resample_numpy(
+    data: np.ndarray, starts: np.ndarray, reducer: str, axis: int, skipna: bool
+) -> np.ndarray:
+    """Vectorized grouped reduction of contiguous bins"""
+    if reducer == "max":
+        max_func = np.fmax if skipna else np.maximum
+        return _reduce_bins(max_func, data, starts, axis)
+
+    if reducer in ["angular_mean", "angular_mean_deg"]:
+        radians = np.deg2rad(data) if reducer == "angular_mean_deg" else data
+        sin_mean = _mean_bins(np.sin(radians), starts, axis, skipna)
+        cos_mean = _mean_bins(np.cos(radians), starts, axis, skipna)
+        mean_dir = np.arctan2(sin_mean, cos_mean)
+        full_circle = 2 * np.pi
+        if reducer == "angular_mean_deg":
+            mean_dir = np.rad2deg(mean_dir)
+            full_circle = 360.0
+        mean_dir = np.mod(mean_dir, full_circle)
+        # Tiny negative angles are rounded up to a full circle by np.mod
+        return np.where(mean_dir >= full_circle, 0.0, mean_dir)
+
+    if reducer == "squared_mean":
+        return np.sqrt(_mean_bins(data**2, starts, axis, skipna))
+    if reducer == "period_mean":
+        with np.errstate(divide="ignore"):
+            return _mean_bins(data**-1.0, starts, axis, skipna) ** -1.0
+    return _mean_bins(data, starts, axis, skipna)
+
+
+def _mean_bins(
+    data: np.ndarray, starts: np.ndarray, axis: int, skipna: bool
+) -> np.ndarray:
+    data = data.astype(np.result_type(data.dtype, 1.0), copy=False)
+    if skipna:
+        valid = np.logical_not(np.isnan(data))
+        sums = _reduce_bins(np.add, np.where(valid, data, 0.0), starts, axis)
+        counts = _reduce_bins(np.add, valid.astype(float), starts, axis)
+    else:
+        sums = _reduce_bins(np.add, data, starts, axis)
+        shape = [1] * data.ndim
+        shape[axis] = len(starts) - 1
+        counts = np.diff(starts).astype(float).reshape(shape)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    # Bins without any (valid) values
+    return np.where(counts > 0, means, np.nan)
+
+
+def _reduce_bins(
+    ufunc: np.ufunc, data: np.ndarray, starts: np.ndarray, axis: int
+) -> np.ndarray:
+    """Reduces the contiguous bins with a ufunc. Empty bins are set to NaN."""
+    data = data.astype(np.result_type(data.dtype, 1.0), copy=False)
+    shape = list(data.shape)
+    shape[axis] = len(starts) - 1
+    result = np.full(shape, np.nan, dtype=data.dtype)
+
+    non_empty = np.diff(starts) > 0
+    if not np.any(non_empty):
+        return result
+
+    reduced = ufunc.reduceat(data, starts[:-1][non_empty], axis=axis)
+    index = [slice(None)] * data.ndim
+    index[axis] = non_empty
+    result[tuple(index)] = reduced
+    return result
@@ -4,6 +4,8 @@ import numpy as np
 from scipy.stats import circmean
 from typing import Union, Optional
 from .resample.scipy_regridders import scipy_regridders
+from .resample.sparse_regridders import sparse_regridders
+from .resample.time_resampler import TimeBins, resample_array
 import geo_parameters as gp
 from copy import deepcopy
 def squared_mean(x, *args, **kwargs):
@@ -26,6 +28,19 @@ def period_mean(x, *args, **kwargs):
     return np.mean(x**-1.0, *args, **kwargs) ** -1.0
 
 
+# Functions used by the xarray-engine and the corresponding reducers of the vectorized engine
+MEAN_FUNC_REDUCERS = {
+    squared_mean: "squared_mean",
+    period_mean: "period_mean",
+    np.max: "max",
+    angular_mean_deg: "angular_mean_deg",
+    angular_mean: "angular_mean",
+    np.mean: "mean",
+}
+
+TIME_ENGINES = ["vectorized", "xarray"]
+
+
 def set_up_mean_func(
     skeleton, var: str, new_dt: float, mode: str, using_mag: bool = False
 ) -> tuple:
@@ -144,6 +159,7 @@ def create_new_class(data, new_grid):
         del new_base.core._added_vars['y']
         new_base.core._added_coords['x'] = new_base_coords['x']
         new_base.core._added_coords['y'] = new_base_coords['y']
+        new_base.core._structure_changed()
 
         
         return new_base
@@ -155,6 +171,7 @@ def create_new_class(data, new_grid):
         new_base.core._added_coords['inds'] = new_base_coords['inds']
         new_base.core._added_vars['x'] = new_base_vars['x']
         new_base.core._added_vars['y'] = new_base_vars['y']
+        new_base.core._structure_changed()
 
         
         return new_base
@@ -177,7 +194,7 @@ def init_new_class_to_grid(new_class, new_grid, data):
 
     return new_data
 
-REGRID_ENGINES = {'scipy': scipy_regridders}
+REGRID_ENGINES = {'scipy': scipy_regridders, 'sparse': sparse_regridders}
 
 class ResampleManager:
     def __init__(self, skeleton):
@@ -243,6 +260,7 @@ class ResampleManager:
         mode: str = "left",
         skipna: bool = False,
         all_times: bool = False,
+        engine: str = "vectorized",
     ):
         """Resamples the data of the Skeleton in time.
 
@@ -251,6 +269,8 @@ class ResampleManager:
         mode ('start' [default], 'end', or 'centered'): Type of average being calculated
         skipna [default False]: skips NaN values in the original data when calculating the mean values
         all_times [default False]: Create NaN values for miossing time stamps
+        engine ('vectorized' [default] or 'xarray'): 'vectorized' determines the time bins once and reduces all variables at once (keeps dask arrays lazy).
+            'xarray' uses xarray's .resample().reduce() for every variable separately.
 
         - Significant wave height (geo_parameters.wave.Hs) will be averaged using np.sqrt(np.mean(hs**2))
         - Circular variables (those having a dir_type) will be averaged using scipy.stats.circmean
@@ -275,6 +295,8 @@ class ResampleManager:
         coord_dict = self.skeleton.coord_dict()
         if "time" not in coord_dict.keys():
             raise ValueError("Skeleton does not have a time variable!")
+        if engine not in TIME_ENGINES:
+            raise ValueError(f"'engine' needs to be in {TIME_ENGINES}, not '{engine}'!")
 
         dt = pd.Timedelta(dt) / pd.Timedelta("1 hour")  # float in hours
 
@@ -300,6 +322,9 @@ class ResampleManager:
         # Create new skeleton with hourly values
         new_skeleton = self.skeleton.from_coord_dict(coord_dict)
         new_skeleton.meta.set_by_dict({"_global_": self.skeleton.meta.get()})
+        if self.skeleton.dask.is_active():
+            # Keep resampled data lazy
+            new_skeleton.dask.activate(chunks=self.skeleton.dask.chunks, rechunk=False)
 
         new_data = {}
 
@@ -314,6 +339,14 @@ class ResampleManager:
                 )
             offset = pd.Timedelta(hours=new_skeleton.dt() / 2)
 
+        if engine == "vectorized":
+            bins = TimeBins.from_time(
+                self.skeleton.time(data_array=True),
+                freq=f"{dt}h",
+                closed=closed,
+                offset=offset,
+            )
+
         data_vars_not_to_resample = []
         data_vars_to_resample = self.skeleton.core.data_vars()
         for key, val in self.skeleton.core._added_magnitudes.items():
@@ -358,6 +391,17 @@ class ResampleManager:
                     var_y,
                 )
 
+            if engine == "vectorized":
+                data = self.skeleton.get(var, data_array=True)
+                new_data[var] = resample_array(
+                    data.data,
+                    bins,
+                    reducer=MEAN_FUNC_REDUCERS[mean_func],
+                    axis=data.dims.index("time"),
+                    skipna=skipna,
+                )
+                continue
+
             # Some version of python/xarray didn't like pd.Timedeltas in the resample method, so forcing to string
             new_data[var] = (
                 self.skeleton.get(var, data_array=True)
@@ -365,8 +409,7 @@ class ResampleManager:
                 .reduce(mean_func)
             )
 
-        for key, value in new_data.items():
-            new_skeleton.set(key, value)
+        new_skeleton.set_many(new_data)
 
         if dropna:
             new_skeleton = new_skeleton.from_ds(
@@ -0,0 +1,132 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..skeleton import Skeleton
+
+import numpy as np
+from scipy.spatial import cKDTree
+from .. import distance_funcs
+
+
+class SpatialIndexManager:
+    """Keeps lazily built KD-trees of the spatial points of a Skeleton.
+
+    The trees are used by .yank_point() to find nearest points without looping over all points of the Skeleton.
+
+    Cartesian trees are built on UTM x/y-coordinates (one per UTM-zone).
+    The spherical tree is built on points projected on the unit sphere, where the chordal distance increases monotonically with the great circle distance.
+    """
+
+    def __init__(self, skeleton: Skeleton):
+        self._skeleton = skeleton
+        self.reset()
+
+    def reset(self) -> None:
+        """Throws away all built trees. Needs to be called if the spatial coordinates change."""
+        self._cartesian_trees: dict[tuple[int, str], tuple[cKDTree, bool]] = {}
+        self._spherical_tree: Optional[cKDTree] = None
+        self._lonlat: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    def cartesian_tree(self, utm: tuple[int, str]) -> tuple[cKDTree, bool]:
+        """Returns a tree built on the x/y-coordinates in the given UTM-zone.
+
+        Also return True if all points could be converted to UTM-coordinates (i.e. no latitudes over 84 or under -80)
+        """
+        if utm not in self._cartesian_trees:
+            x, y = self._skeleton.xy(utm=utm)
+            all_points_valid = not np.any(np.isnan(y))
+            if all_points_valid:
+                tree = cKDTree(np.column_stack((x, y)))
+            else:
+                tree = None
+            self._cartesian_trees[utm] = (tree, all_points_valid)
+        return self._cartesian_trees[utm]
+
+    def spherical_tree(self) -> cKDTree:
+        """Returns a tree built on the lon/lat-coordinates projected on the unit sphere."""
+        if self._spherical_tree is None:
+            lon, lat = self.lonlat()
+            self._spherical_tree = cKDTree(_unit_sphere(lon, lat))
+        return self._spherical_tree
+
+    def lonlat(self) -> tuple[np.ndarray, np.ndarray]:
+        """Cached lon/lat-coordinates of all points in the Skeleton."""
+        if self._lonlat is None:
+            self._lonlat = self._skeleton.lonlat()
+        return self._lonlat
+
+    def nearest_cartesian(
+        self, x: np.ndarray, y: np.ndarray, utm: tuple[int, str], npoints: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the 'npoints' nearest points [cartesian distance] to every given x/y-point.
+
+        Returns distances [m] and indeces as arrays of shape (len(x), npoints)"""
+        tree, __ = self.cartesian_tree(utm)
+        k = min(npoints, tree.n)
+        dx, inds = tree.query(np.column_stack((x, y)), k=k)
+        return dx.reshape(len(x), k), inds.reshape(len(x), k)
+
+    def nearest_spherical(
+        self, lon: np.ndarray, lat: np.ndarray, npoints: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the 'npoints' nearest points [geodesic distance] to every given lon/lat-point.
+
+        A few more candidates than needed are taken from the tree (great circle distance),
+        and they are then ranked using the geodesic distance. The geodesic ordering can differ from the
+        great circle ordering, so all points within the great circle distance that corresponds to the
+        npoints:th geodesic distance are then checked as well. The result is therefore exact.
+
+        Returns distances [m] and indeces as arrays of shape (len(lon), npoints)"""
+        tree = self.spherical_tree()
+        k = min(npoints, tree.n)
+        ncandidates = min(max(2 * npoints, npoints + 8), tree.n)
+        points = _unit_sphere(lon, lat)
+        __, candidates = tree.query(points, k=ncandidates)
+        candidates = candidates.reshape(len(lon), ncandidates)
+
+        lon_vec, lat_vec = self.lonlat()
+        dx = distance_funcs.distances_to_candidates(
+            lon, lat, lon_vec, lat_vec, candidates
+        )
+        order = np.argsort(dx, axis=1, kind="stable")[:, :k]
+        dx = np.take_along_axis(dx, order, axis=1)
+        inds = np.take_along_axis(candidates, order, axis=1)
+        if ncandidates == tree.n:
+            return dx, inds
+
+        radius = _chord_radius(dx[:, -1])
+        n_within = tree.query_ball_point(points, radius, return_length=True)
+        for n in np.where(n_within > ncandidates)[0]:
+            ball = np.array(tree.query_ball_point(points[n], radius[n]))
+            ball_dx = distance_funcs.distances_to_candidates(
+                lon[n : n + 1], lat[n : n + 1], lon_vec, lat_vec, ball[np.newaxis, :]
+            )[0]
+            ball_order = np.argsort(ball_dx, kind="stable")[:k]
+            dx[n], inds[n] = ball_dx[ball_order], ball[ball_order]
+        return dx, inds
+
+
+def _chord_radius(geodesic_distance: np.ndarray) -> np.ndarray:
+    """Chord on the unit sphere that contains all points within the given geodesic distances [m].
+
+    Projecting the WGS84 ellipsoid radially onto a sphere with the polar radius b doesn't increase any distances
+    (it is the closest point projection onto the ball inside the ellipsoid), so a geodesic distance D corresponds
+    to a great circle angle of at most D/b."""
+    angle = np.minimum(geodesic_distance / distance_funcs.WGS84_B, np.pi)
+    radius = 2 * np.sin(angle / 2) * (1 + 1e-9) + 1e-12
+    # Distances that could not be determined: check all points
+    return np.where(np.isnan(radius), 2.0 + 1e-9, radius)
+
+
+def _unit_sphere(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Converts lon/lat [deg] to cartesian coordinates on the unit sphere.
+
+    The points on the WGS84 ellipsoid are projected radially (i.e. using the geocentric latitude),
+    so that the great circle angle between two points is bounded by their geodesic distance (see _chord_radius)."""
+    lon = np.deg2rad(np.asarray(lon, dtype=float))
+    lat = np.arctan(
+        (1 - distance_funcs.WGS84_F) ** 2 * np.tan(np.deg2rad(np.asarray(lat, dtype=float)))
+    )
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
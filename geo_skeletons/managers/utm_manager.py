@@ -2,7 +2,7 @@ from .metadata_manager import MetaDataManager
 import numpy as np
 import numpy as np
 import utm as utm_module
-from typing import Optional
+from typing import Optional, Callable
 
 VALID_UTM_ZONES = [
     "C",
@@ -38,6 +38,7 @@ class UTMManager:
         self._lat_edges: float = lat
         self._lon_edges: float = lon
         self._meta: MetaDataManager = metadata_manager
+        self._cache: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
 
     def zone(self) -> tuple[int, str]:
         """Returns UTM zone number and letter. Returns (None, None)
@@ -79,6 +80,7 @@ class UTMManager:
 
     def reset(self, silent: bool = False) -> None:
         """Resets the UTM-zone based on the lon/lat edges"""
+        self.clear_cache()
         if self._lat_edges[0] is None:
             self._zone = (None, None)
         else:
@@ -107,26 +109,60 @@ class UTMManager:
             raise ValueError(f"{zone} is not a valid UTM zone!")
 
         self._zone = (zone[0], zone[1])
+        self.clear_cache()
         self._meta.append({"utm_zone": f"{zone[0]:02.0f}{zone[1]}"})
 
         if not silent:
             print(f"Setting UTM {self._zone}")
 
-    def _lat(self, x: np.ndarray, y: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
-        """Calculates latitudes based on given x,y-coordinates and the set UTM-zone"""
+    def clear_cache(self) -> None:
+        """Throws away all memoized projections. Needed when the coordinates of the Skeleton change."""
+        self._cache = {}
+
+    def _memoize(
+        self, key: tuple, compute: Callable[[], tuple[np.ndarray, np.ndarray]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns a memoized projection if it exists, otherwise computes and stores it.
+
+        The stored arrays are read-only, since they are shared between calls."""
+        if key in self._cache:
+            return self._cache[key]
+
+        result = compute()
+        if result[0] is None:
+            return result
+        for array in result:
+            array.setflags(write=False)
+        self._cache[key] = result
+        return result
+
+    def _lonlat(
+        self, x: np.ndarray, y: np.ndarray, utm: tuple[int, str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculates longitudes and latitudes in one pass based on given x,y-coordinates and the set UTM-zone"""
         if self._zone[0] is None:
-            print("Need to set an UTM-zone, e.g. set_utm((33,'W')), to get latitudes!")
-            return None
+            print(
+                "Need to set an UTM-zone, e.g. set_utm((33,'W')), to get longitudes and latitudes!"
+            )
+            return None, None
         utm = utm or self._zone
         if not self.is_valid(self._zone):
             raise ValueError(f"{self._zone} is not a valid UTM zone!")
-        lat, __ = utm_module.to_latlon(
+        lat, lon = utm_module.to_latlon(
             x,
             np.mod(y, 10_000_000),
             zone_number=utm[0],
             zone_letter=utm[1],
             strict=False,
         )
+        return lon, lat
+
+    def _lat(self, x: np.ndarray, y: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
+        """Calculates latitudes based on given x,y-coordinates and the set UTM-zone"""
+        if self._zone[0] is None:
+            print("Need to set an UTM-zone, e.g. set_utm((33,'W')), to get latitudes!")
+            return None
+        __, lat = self._lonlat(x, y, utm)
         return lat
 
     def _lon(self, x: np.ndarray, y: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
@@ -134,86 +170,59 @@ class UTMManager:
         if self._zone[0] is None:
             print("Need to set an UTM-zone, e.g. set_utm((33,'W')), to get longitudes!")
             return None
-        utm = utm or self._zone
-        if not self.is_valid(self._zone):
-            raise ValueError(f"{self._zone} is not a valid UTM zone!")
-
-        __, lon = utm_module.to_latlon(
-            x,
-            np.mod(y, 10_000_000),
-            zone_number=utm[0],
-            zone_letter=utm[1],
-            strict=False,
-        )
+        lon, __ = self._lonlat(x, y, utm)
         return lon
 
-    def _x(self, lon: np.ndarray, lat: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
-        """Calculates x-coordinates based on given lon,lat-coordinates and the set UTM-zone.
+    def _xy(
+        self, lon: np.ndarray, lat: np.ndarray, utm: tuple[int, str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculates x- and y-coordinates in one pass based on given lon,lat-coordinates and the set UTM-zone.
 
         latitudes higher than 84 or lower than -80 will produce np.nan"""
         assert len(lon) == len(
             lat
         ), f"lon and lat vectors need to be of equal length ({len(lon)}, {len(lat)})!"
         utm = utm or self._zone
-        # lat = cap_lat_for_utm(lat)
+        lon = np.atleast_1d(lon)
+        lat = np.atleast_1d(lat)
         # High/low latitudes cannot be transformed to UTM
         good_mask = np.logical_and(lat <= 84, lat >= -80)
         posmask = np.logical_and(lat >= 0, good_mask)
         negmask = np.logical_and(lat < 0, good_mask)
         x = np.zeros(len(lon))
+        y = np.zeros(len(lat))
         if np.any(posmask):
-            x[posmask], __, __, __ = utm_module.from_latlon(
+            x[posmask], y[posmask], __, __ = utm_module.from_latlon(
                 lat[posmask],
                 lon[posmask],
                 force_zone_number=utm[0],
                 force_zone_letter=utm[1],
             )
         if np.any(negmask):
-            x[negmask], __, __, __ = utm_module.from_latlon(
+            x[negmask], y[negmask], __, __ = utm_module.from_latlon(
                 -lat[negmask],
                 lon[negmask],
                 force_zone_number=utm[0],
                 force_zone_letter=utm[1],
             )
+            y[negmask] = -y[negmask]
         if not np.all(good_mask):
             x[np.logical_not(good_mask)] = np.nan
-        return x
+            y[np.logical_not(good_mask)] = np.nan
+        return x, y
 
-    def _y(self, lon: np.ndarray, lat: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
+    def _x(self, lon: np.ndarray, lat: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
         """Calculates x-coordinates based on given lon,lat-coordinates and the set UTM-zone.
 
         latitudes higher than 84 or lower than -80 will produce np.nan"""
+        x, __ = self._xy(lon, lat, utm)
+        return x
 
-        assert len(lon) == len(
-            lat
-        ), f"lon and lat vectors need to be of equal length ({len(lon)}, {len(lat)})!"
-        utm = utm or self._zone
-        # lat = cap_lat_for_utm(lat)
-        # High/low latitudes cannot be transformed to UTM
-        good_mask = np.logical_and(lat <= 84, lat >= -80)
-        lon = np.atleast_1d(lon)
-        posmask = np.logical_and(lat >= 0, good_mask)
-        negmask = np.logical_and(lat < 0, good_mask)
-        y = np.zeros(len(lat))
-
-        if np.any(posmask):
-            _, y[posmask], __, __ = utm_module.from_latlon(
-                lat[posmask],
-                lon[posmask],
-                force_zone_number=utm[0],
-                force_zone_letter=utm[1],
-            )
-        if np.any(negmask):
-            _, y[negmask], __, __ = utm_module.from_latlon(
-                -lat[negmask],
-                lon[negmask],
-                force_zone_number=utm[0],
-                force_zone_letter=utm[1],
-            )
-            y[negmask] = -y[negmask]
-        if not np.all(good_mask):
-            y[np.logical_not(good_mask)] = np.nan
+    def _y(self, lon: np.ndarray, lat: np.ndarray, utm: tuple[int, str]) -> np.ndarray:
+        """Calculates x-coordinates based on given lon,lat-coordinates and the set UTM-zone.
 
+        latitudes higher than 84 or lower than -80 will produce np.nan"""
+        __, y = self._xy(lon, lat, utm)
         return y
 
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+import numpy as np
+import xarray as xr
+import dask.array as da
+from .dask_computations import data_is_dask
+
+if TYPE_CHECKING:
+    from .variables import DataVar
+
+# Valid ranges used for packing directional data if no range is given explicitly
+DIR_TYPE_RANGES = {"from": (0.0, 360.0), "to": (0.0, 360.0), "math": (0.0, 2 * np.pi)}
+
+
+def packing_parameters(
+    dtype: Optional[Union[str, np.dtype]],
+    valid_range: Optional[tuple[float, float]],
+    dir_type: Optional[str] = None,
+) -> tuple[Optional[float], Optional[float]]:
+    """Determines the CF scale_factor and add_offset to pack values in the valid range into an integer dtype.
+
+    Returns (None, None) if the data will not be packed (no dtype or a non-integer dtype).
+    One integer value is reserved for the _FillValue (NaN)."""
+    if dtype is None or np.dtype(dtype).kind not in "iu":
+        if valid_range is not None:
+            raise ValueError(
+                f"'valid_range' is only used to pack data into an integer 'dtype', not '{dtype}'!"
+            )
+        return None, None
+
+    valid_range = valid_range or DIR_TYPE_RANGES.get(dir_type)
+    if valid_range is None:
+        return None, None
+
+    low, high = valid_range
+    if not high > low:
+        raise ValueError(f"'valid_range' needs to be (min, max), not {valid_range}!")
+
+    info = np.iinfo(dtype)
+    # E.g. int16: values -32767...32767 are used and -32768 is the _FillValue
+    n_values = int(info.max) - int(info.min) - 1
+    scale_factor = (high - low) / n_values
+    if info.kind == "u":
+        add_offset = low
+    else:
+        add_offset = low - (int(info.min) + 1) * scale_factor
+    return float(scale_factor), float(add_offset)
+
+
+def is_packed(var: Optional[DataVar]) -> bool:
+    return getattr(var, "scale_factor", None) is not None
+
+
+def fill_value(var: DataVar) -> int:
+    """The integer that marks NaN values in packed data"""
+    info = np.iinfo(var.dtype)
+    if info.kind == "u":
+        return int(info.max)
+    return int(info.min)
+
+
+def unpacked_dtype(var: DataVar) -> np.dtype:
+    """Packed 8- and 16-bit integers are unpacked to float32, others to float64"""
+    if np.dtype(var.dtype).itemsize <= 2:
+        return np.dtype("float32")
+    return np.dtype("float64")
+
+
+def packing_attrs(var: DataVar) -> dict:
+    """CF-attributes of packed data"""
+    return {
+        "scale_factor": var.scale_factor,
+        "add_offset": var.add_offset,
+        "_FillValue": fill_value(var),
+    }
+
+
+def pack(
+    data: Union[np.ndarray, da.Array], var: DataVar
+) -> Union[np.ndarray, da.Array]:
+    """Packs floating point data to the integer dtype of the variable. NaN's are set to the _FillValue.
+
+    Values outside of the valid range are also set to the _FillValue (i.e. read as NaN), as for a CF valid_range.
+    A warning is printed for numpy data (dask data is not computed to check)."""
+    info = np.iinfo(var.dtype)
+    fill = fill_value(var)
+    low, high = (info.min + 1, info.max) if info.kind == "i" else (info.min, info.max - 1)
+
+    packed = np.round((data - var.add_offset) / var.scale_factor)
+    outside = np.logical_or(packed < low, packed > high)
+    if not data_is_dask(outside) and np.any(outside):
+        valid_range = (
+            low * var.scale_factor + var.add_offset,
+            high * var.scale_factor + var.add_offset,
+        )
+        print(
+            f"{np.sum(outside)} value(s) of '{var.name}' outside of the valid range {valid_range} stored as missing (NaN)!"
+        )
+    packed = np.where(np.logical_or(np.isnan(packed), outside), fill, packed)
+    return packed.astype(var.dtype)
+
+
+def unpack(data: xr.DataArray, var: DataVar) -> xr.DataArray:
+    """Unpacks integer data to floating point values. The _FillValue is set to NaN. Dask arrays are kept lazy."""
+    dtype = unpacked_dtype(var)
+    unpacked = data.astype(dtype) * dtype.type(var.scale_factor) + dtype.type(
+        var.add_offset
+    )
+    return unpacked.where(data != fill_value(var))
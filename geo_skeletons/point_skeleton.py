@@ -172,11 +172,8 @@ class PointSkeleton(Skeleton):
         if self.core.is_cartesian() and (self.utm.zone() == utm or utm is None):
             x = self._ds_manager.get("x", **kwargs).values.copy()[mask]
         else:
-            x = self.utm._x(
-                lon=self.lon(mask=mask, **kwargs),
-                lat=self.lat(mask=mask, **kwargs),
-                utm=utm,
-            )
+            x, __ = self._projected_xy(utm=utm, **kwargs)
+            x = x[mask]
 
         if normalize:
             x = x - min(x)
@@ -218,11 +215,8 @@ class PointSkeleton(Skeleton):
         if self.core.is_cartesian() and (self.utm.zone() == utm):
             y = self._ds_manager.get("y", **kwargs).values.copy()[mask]
         else:
-            y = self.utm._y(
-                lon=self.lon(mask=mask, **kwargs),
-                lat=self.lat(mask=mask, **kwargs),
-                utm=utm,
-            )
+            __, y = self._projected_xy(utm=utm, **kwargs)
+            y = y[mask]
 
         if normalize:
             y = y - min(y)
@@ -260,11 +254,17 @@ class PointSkeleton(Skeleton):
         if not self.core.is_cartesian():
             return self._ds_manager.get("lon", **kwargs).values.copy()[mask]
 
-        return self.utm._lon(
-            x=self.x(mask=mask, utm=utm, **kwargs),
-            y=self.y(mask=mask, utm=utm, **kwargs),
-            utm=utm,
-        )
+        if utm is not None and utm != self.utm.zone():
+            return self.utm._lon(
+                x=self.x(mask=mask, utm=utm, **kwargs),
+                y=self.y(mask=mask, utm=utm, **kwargs),
+                utm=utm,
+            )
+
+        lon, __ = self._projected_lonlat(**kwargs)
+        if lon is None:
+            return None
+        return lon[mask]
 
     def lat(
         self,
@@ -297,11 +297,17 @@ class PointSkeleton(Skeleton):
         if not self.core.is_cartesian():
             return self._ds_manager.get("lat", **kwargs).values.copy()[mask]
 
-        return self.utm._lat(
-            x=self.x(mask=mask, utm=utm, **kwargs),
-            y=self.y(mask=mask, utm=utm, **kwargs),
-            utm=utm,
-        )
+        if utm is not None and utm != self.utm.zone():
+            return self.utm._lat(
+                x=self.x(mask=mask, utm=utm, **kwargs),
+                y=self.y(mask=mask, utm=utm, **kwargs),
+                utm=utm,
+            )
+
+        __, lat = self._projected_lonlat(**kwargs)
+        if lat is None:
+            return None
+        return lat[mask]
 
     def xy(
         self,
@@ -1,9 +1,12 @@
 import numpy as np
 import xarray as xr
+import json
+import os
 from .managers.dataset_manager import DatasetManager
 from .managers.dask_manager import DaskManager
 from .managers.reshape_manager import ReshapeManager
 from .managers.resample_manager import ResampleManager
+from .managers.spatial_index_manager import SpatialIndexManager
 from .decoders import (
     identify_core_in_ds,
     set_core_vars_to_skeleton_from_ds,
@@ -12,15 +15,21 @@ from .decoders import (
     map_ds_to_gp,
     remap_coords_of_ds_vars_to_skeleton_names,
     gather_coord_values,
+    DecodingPlan,
+    decoding_fingerprint,
+    get_cached_plan,
+    cache_plan,
 )
 from . import data_sanitizer as sanitize
 from .managers.utm_manager import UTMManager
-from typing import Iterable, Union, Optional
+from .variable_archive import SPATIAL_COORDS
+from typing import Iterable, Union, Optional, Callable
 from . import distance_funcs
 from .errors import (
     DataWrongDimensionError,
     DirTypeError,
     SkeletonError,
+    UnknownCoordinateError,
     UnknownVariableError,
 )
 
@@ -35,10 +44,10 @@ from .decorators import (
     add_direction,
     add_coord,
 )
-from .iter import SkeletonIterator
+from .iter import SkeletonIterator, map_over_slices
+from .time_buffer import TimeAppendBuffer
 
-from geo_skeletons import dask_computations, dir_conversions
-import itertools
+from geo_skeletons import dask_computations, dir_conversions, packing
 
 import geo_parameters as gp
 from geo_parameters.metaparameter import MetaParameter
@@ -47,6 +56,9 @@ from .distance_funcs import distance_2points
 import pandas as pd
 from copy import deepcopy
 
+# Attribute used to store the structure of the Skeleton in a Zarr-store
+ZARR_CORE_ATTR = "geo_skeletons_core"
+
 
 class Skeleton:
     """Contains methods and data of the spatial x,y / lon, lat coordinates and
@@ -56,6 +68,8 @@ class Skeleton:
     """
 
     chunks = None
+    # Default dtype that data variables are stored in, e.g. 'float32'. None keeps the dtype of the data that is set.
+    dtype = None
 
     def __init__(
         self,
@@ -108,6 +122,15 @@ class Skeleton:
 
         self._ds_manager.create_structure(x=xvec, y=yvec, new_coords=kwargs)
 
+        # Spatial coordinates might have changed, so any cached searches or projections are outdated
+        self._reset_spatial_caches()
+
+    def _reset_spatial_caches(self) -> None:
+        """Throws away cached spatial search trees and UTM projections. Needed when the spatial coordinates change."""
+        self._spatial_index = SpatialIndexManager(self)
+        if hasattr(self, "utm"):
+            self.utm.clear_cache()
+
     def _init_managers(self, utm: tuple[str, int], chunks: tuple[int]) -> None:
         """Initialized a DirTypeManager, UTMManager and DaskManager, and sets a UTM-zone"""
         if chunks is None:
@@ -200,6 +223,8 @@ class Skeleton:
         name: Union[str, MetaParameter],
         coord_group: str = "all",
         default_value: float = 0.0,
+        dtype: Optional[str] = None,
+        valid_range: Optional[tuple[float, float]] = None,
     ) -> None:
         """Creates a new class with a data variable added.
 
@@ -207,6 +232,8 @@ class Skeleton:
         coord_group: 'all', 'spatial', 'grid' or 'gridpoint'
         default_value: float
         dir_type (for directional parameters): 'from', 'to' or 'math' (Autimatically parsed if name is a MetaParameter)
+        dtype: dtype the data is stored in, e.g. 'float32'
+        valid_range: (min, max) used to pack data into an integer dtype (e.g. 'int16')
 
         Equivalent to using:
 
@@ -217,7 +244,11 @@ class Skeleton:
             pass"""
         new_cls = type(_modified_name(cls.__name__), (cls,), {})
         return add_datavar(
-            name=name, coord_group=coord_group, default_value=default_value
+            name=name,
+            coord_group=coord_group,
+            default_value=default_value,
+            dtype=dtype,
+            valid_range=valid_range,
         )(new_cls)
 
     @classmethod
@@ -228,6 +259,7 @@ class Skeleton:
         y: str,
         direction: Optional[Union[str, MetaParameter]] = None,
         dir_type: Optional[str] = None,
+        dtype: Optional[str] = None,
     ) -> None:
         """Adds a magnitude to an instance of a (non-static) Skeleton.
 
@@ -237,10 +269,11 @@ class Skeleton:
         x [str]: name of already set variable that will be used as x-component
         y [str]: name of already set variable that will be used as y-component
         direction: name of the direction of the magnitude being set
-        dir_type: 'from', 'to' or 'math'"""
+        dir_type: 'from', 'to' or 'math'
+        dtype: dtype the x- and y-components are stored in, e.g. 'float32'"""
         new_cls = type(_modified_name(cls.__name__), (cls,), {})
         return add_magnitude(
-            name=name, x=x, y=y, direction=direction, dir_type=dir_type
+            name=name, x=x, y=y, direction=direction, dir_type=dir_type, dtype=dtype
         )(new_cls)
 
     @classmethod
@@ -283,20 +316,153 @@ class Skeleton:
         return cls(**coord_dict)
 
     @classmethod
-    def from_netcdf(cls, filename: str, name: Optional[str]=None, **kwargs) -> "Skeleton":
+    def from_netcdf(
+        cls,
+        filename: Union[str, list[str]],
+        name: Optional[str] = None,
+        lazy: bool = False,
+        chunks: Optional[Union[tuple[int], dict[str, int], str]] = None,
+        **kwargs,
+    ) -> "Skeleton":
         """Generates a instance of the Skeleton class from a netcdf.
 
-        For information about the keywords, see the from_ds-method"""
-        ds = xr.open_dataset(filename)
+        lazy [default False]: Open the file with dask chunks and keep the data as dask arrays (dask-mode is activated).
+            Data is then only read from disk when it is computed, e.g. with .get(..., dask=False)
+        chunks: Chunks used when reading the file lazily (dict or 'auto') or chunks of the Skeleton (tuple). Implies lazy=True.
+
+        filename can also be a list of files or contain wildcards (e.g. 'hindcast_2020*.nc').
+        The files are then opened with xr.open_mfdataset, which is always lazy.
+
+        For information about the other keywords, see the from_ds-method"""
+        multifile = not isinstance(filename, str) or _has_wildcards(filename)
+        lazy = lazy or multifile or chunks is not None
+
+        file_chunks, skeleton_chunks = _chunks_for_reading(lazy, chunks)
+
+        if multifile:
+            ds = xr.open_mfdataset(filename, chunks=file_chunks, combine="by_coords")
+        else:
+            ds = xr.open_dataset(filename, chunks=file_chunks)
+
         if hasattr(ds, 'name'):
             ds_name = ds.name
         else:
             ds_name = None
         name = name or ds_name or f"Created from {filename}"
         return cls.from_ds(
-            ds, name=name, **kwargs
+            ds, name=name, chunks=skeleton_chunks, **kwargs
         )
 
+    @classmethod
+    def from_zarr(
+        cls,
+        store: str,
+        name: Optional[str] = None,
+        lazy: bool = True,
+        chunks: Optional[Union[tuple[int], dict[str, int], str]] = None,
+        strict: bool = False,
+    ) -> "Skeleton":
+        """Generates a instance of the Skeleton class from a Zarr-store.
+
+        If the store was written by .to_zarr(), the stored structure is used to set the variables directly.
+        Otherwise the Dataset is decoded using the from_ds-method.
+
+        lazy [default True]: Keep the data as dask arrays (dask-mode is activated).
+        chunks: Chunks used when reading the store (dict or 'auto') or chunks of the Skeleton (tuple).
+        strict [default False]: Raise an UnknownVariableError if the store has variables that the class doesn't have.
+            Otherwise the ignored variables are reported.
+        """
+        file_chunks, skeleton_chunks = _chunks_for_reading(lazy, chunks)
+        ds = xr.open_zarr(store, chunks=file_chunks)
+        name = name or ds.attrs.get("name") or f"Created from {store}"
+
+        if ZARR_CORE_ATTR not in ds.attrs:
+            return cls.from_ds(ds, name=name, chunks=skeleton_chunks)
+
+        structure = json.loads(ds.attrs[ZARR_CORE_ATTR])
+        stored_coords = {
+            c for c, group in structure["coords"].items() if group != "spatial"
+        }
+        class_coords = set(cls.core.coords("nonspatial"))
+        if stored_coords != class_coords:
+            raise UnknownCoordinateError(
+                f"Zarr-store has coordinates {sorted(stored_coords)} but {cls.__name__} has {sorted(class_coords)}! Use .from_ds(xr.open_zarr(...)) to decode the Dataset."
+            )
+
+        cartesian = structure["x_str"] == "x"
+        # 'init' also lists spatial data variables (e.g. topography), which are set below
+        init_coords = set(cls.core.coords("nonspatial")) | {
+            structure["x_str"],
+            structure["y_str"],
+        }
+        coords = {
+            c: ds[c].values
+            for c in cls.core.coords("init", cartesian=cartesian)
+            if c in ds and c in init_coords
+        }
+        points = cls(**coords, chunks=skeleton_chunks, name=name)
+        points.utm.set(tuple(structure["utm_zone"]), silent=True)
+
+        stored_vars = [
+            var
+            for var in list(structure["data_vars"]) + list(structure["masks"])
+            if var in ds.data_vars
+            and var not in coords
+            and points.core.get(var) is not None
+        ]
+        ignored_vars = [
+            var for var in ds.data_vars if var not in coords and var not in stored_vars
+        ]
+        if ignored_vars:
+            msg = f"Zarr-store has variables {ignored_vars} that {cls.__name__} doesn't have!"
+            if strict:
+                raise UnknownVariableError(msg)
+            print(f"{msg} They are ignored.")
+
+        for var in stored_vars:
+            dir_type = structure["data_vars"].get(var, {}).get("dir_type")
+            points.set(
+                var, ds[var].data, coords=list(ds[var].dims), dir_type=dir_type
+            )
+            points.meta.append(ds[var].attrs, name=var)
+
+        metadata = {
+            key: value
+            for key, value in ds.attrs.items()
+            if key not in ["name", ZARR_CORE_ATTR]
+        }
+        points.meta.append(metadata)
+
+        return points
+
+    def to_zarr(self, store: str, append: bool = False, **kwargs) -> None:
+        """Writes the Skeleton to a Zarr-store. The structure of the Skeleton is stored as well, so that reading it
+        with .from_zarr() doesn't need to decode the Dataset.
+
+        append [default False]: Append the data along the time-dimension of an existing store.
+            If the store doesn't exist yet, it is created. Otherwise any existing store is overwritten.
+
+        Other keywords are passed on to xr.Dataset.to_zarr()
+        """
+        if self.ds() is None:
+            raise SkeletonError("Skeleton has no data to write!")
+
+        ds = self.ds().copy()
+        structure = self.core.describe()
+        structure["utm_zone"] = list(self.utm.zone())
+        ds.attrs[ZARR_CORE_ATTR] = json.dumps(structure)
+
+        if append:
+            if "time" not in self.core.coords("all"):
+                raise UnknownCoordinateError(
+                    "Can only append to a Zarr-store along 'time', but Skeleton has no time coordinate!"
+                )
+            if os.path.exists(store):
+                ds.to_zarr(store, append_dim="time", **kwargs)
+                return
+
+        ds.to_zarr(store, mode="w", **kwargs)
+
     @classmethod
     def from_ds(
         cls,
@@ -312,6 +478,7 @@ class Skeleton:
         verbose: bool = False,
         meta_dict: dict = None,
         name: Optional[str] = None,
+        plan: Optional[DecodingPlan] = None,
         **kwargs,
     ) -> "Skeleton":
         """Generats an instance of a Skeleton from an xarray Dataset.
@@ -327,6 +494,9 @@ class Skeleton:
 
         dynamic [default: False] Allows creation of new data variables. Otherwise limited to existing variables.
 
+        plan [default None]: DecodingPlan (see create_decoding_plan) to use instead of decoding the Dataset.
+        The decoding is otherwise cached, so Datasets with the same structure are only decoded once per session.
+
         Core aliases
         ------------------------------------------------------------------------
         Ex1: core_aliases = {'hs': 'Hm0'}
@@ -394,6 +564,130 @@ class Skeleton:
                 verbose=verbose,
             )
 
+        fingerprint = decoding_fingerprint(
+            cls.core,
+            ds,
+            only_vars=only_vars,
+            ignore_vars=ignore_vars,
+            keep_ds_names=keep_ds_names,
+            decode_cf=decode_cf,
+            core_aliases=core_aliases,
+            ds_aliases=ds_aliases,
+            extra_coords=kwargs,
+        )
+        if plan is not None:
+            if plan.fingerprint != fingerprint:
+                raise ValueError(
+                    f"Decoding plan doesn't match the Dataset, the class {cls.__name__} or the keywords!"
+                )
+        else:
+            plan = get_cached_plan(fingerprint)
+
+        name = name or ds.attrs.get("name")
+        if plan is None:
+            plan, points = cls._decode_ds(
+                ds,
+                fingerprint,
+                core_aliases=core_aliases,
+                ds_aliases=ds_aliases,
+                ignore_vars=ignore_vars,
+                only_vars=only_vars,
+                verbose=verbose,
+                chunks=chunks,
+                name=name,
+                extra_coords=kwargs,
+            )
+            cache_plan(plan)
+        else:
+            coords = gather_coord_values(
+                plan.coords_needed,
+                ds,
+                plan.core_coords_to_ds_coords,
+                extra_coords=kwargs,
+            )
+            points = cls(**coords, chunks=chunks, name=name)
+
+        # Set data
+        points = set_core_vars_to_skeleton_from_ds(
+            points,
+            ds,
+            plan.core_vars_to_ds_vars,
+            plan.ds_remapped_coords,
+            meta_dict,
+        )
+        
+        metadata = meta_dict.get("_global_") or ds.attrs
+
+        metadata = {key: value for key, value in metadata.items() if key != 'name'}
+        points.meta.append(metadata)
+
+        return points
+
+    @classmethod
+    def create_decoding_plan(
+        cls,
+        ds: xr.Dataset,
+        only_vars: Optional[list[str]] = None,
+        ignore_vars: Optional[list[str]] = None,
+        keep_ds_names: bool = False,
+        decode_cf: bool = True,
+        core_aliases: dict[Union[MetaParameter, str], str] = None,
+        ds_aliases: dict[str, Union[MetaParameter, str]] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> DecodingPlan:
+        """Decodes a Dataset and returns the plan that from_ds uses to read it.
+
+        The plan can be saved with plan.save(filename) and later be given to from_ds (plan=DecodingPlan.load(filename)),
+        to read Datasets with the same structure without decoding them. The keywords need to be the same as when reading.
+
+        NB! Plans are cached automatically within a session, so this is only needed for precomputing plans.
+        """
+        core_aliases = core_aliases or {}
+        ds_aliases = ds_aliases or {}
+        only_vars = only_vars or []
+        ignore_vars = ignore_vars or []
+        fingerprint = decoding_fingerprint(
+            cls.core,
+            ds,
+            only_vars=only_vars,
+            ignore_vars=ignore_vars,
+            keep_ds_names=keep_ds_names,
+            decode_cf=decode_cf,
+            core_aliases=core_aliases,
+            ds_aliases=ds_aliases,
+            extra_coords=kwargs,
+        )
+        plan, __ = cls._decode_ds(
+            ds,
+            fingerprint,
+            core_aliases=core_aliases,
+            ds_aliases=ds_aliases,
+            ignore_vars=ignore_vars,
+            only_vars=only_vars,
+            verbose=verbose,
+            extra_coords=kwargs,
+        )
+        cache_plan(plan)
+        return plan
+
+    @classmethod
+    def _decode_ds(
+        cls,
+        ds: xr.Dataset,
+        fingerprint: tuple,
+        core_aliases: dict[Union[MetaParameter, str], str],
+        ds_aliases: dict[str, Union[MetaParameter, str]],
+        ignore_vars: list[str],
+        only_vars: list[str],
+        verbose: bool,
+        extra_coords: dict,
+        chunks: Optional[Union[tuple[int], str]] = None,
+        name: Optional[str] = None,
+    ) -> tuple[DecodingPlan, "Skeleton"]:
+        """Decodes the Dataset to find how it maps to the core of the class.
+
+        Returns the decoding plan and an instance of the class with the coordinates set (no data)"""
         # These are the mappings identified in the ds. Might miss some that are provided as keywords
         (
             core_coords_to_ds_coords,
@@ -406,15 +700,14 @@ class Skeleton:
             ds_aliases=ds_aliases,
             ignore_vars=ignore_vars,
             only_vars=only_vars,
-            allowed_misses=list(kwargs.keys()),
+            allowed_misses=list(extra_coords.keys()),
             verbose=verbose,
         )
 
         coords = gather_coord_values(
-            coords_needed, ds, core_coords_to_ds_coords, extra_coords=kwargs
+            coords_needed, ds, core_coords_to_ds_coords, extra_coords=extra_coords
         )
 
-        name = name or ds.attrs.get("name")
         points = cls(**coords, chunks=chunks, name=name)
         # Lengths needed for matching coordinates with wrong name
         # We do this instead of reading the lengths of the arrays directyl
@@ -430,35 +723,93 @@ class Skeleton:
             ds, cls.core, core_vars_to_ds_vars, core_coords_to_ds_coords, core_lens
         )
 
-        # Set data
-        points = set_core_vars_to_skeleton_from_ds(
-            points,
-            ds,
-            core_vars_to_ds_vars,
-            ds_remapped_coords,
-            meta_dict,
+        plan = DecodingPlan(
+            fingerprint=fingerprint,
+            core_coords_to_ds_coords=core_coords_to_ds_coords,
+            core_vars_to_ds_vars=core_vars_to_ds_vars,
+            coords_needed=coords_needed,
+            ds_remapped_coords=ds_remapped_coords,
         )
-        
-        metadata = meta_dict.get("_global_") or ds.attrs
-
-        metadata = {key: value for key, value in metadata.items() if key != 'name'}
-        points.meta.append(metadata)
-
-        return points
+        return plan, points
 
     def absorb(self, skeleton_to_absorb: "Skeleton", dim: str) -> "Skeleton":
         """Absorb another object of same type over a centrain dimension.
         For a PointSkeleton the inds-variable reorganized if dim='inds' is given."""
-        if not self.is_gridded() and dim == "inds":
-            inds = skeleton_to_absorb.inds() + len(self.inds())
-            skeleton_to_absorb.ds()["inds"] = inds
-
-        new_skeleton = self.from_ds(
-            xr.concat(
-                [self.ds(), skeleton_to_absorb.ds()], dim=dim, data_vars="minimal"
-            ).sortby(dim)
+        return self.concat([self, skeleton_to_absorb], dim=dim)
+
+    @classmethod
+    def concat(cls, skeletons: list["Skeleton"], dim: str) -> "Skeleton":
+        """Concatenates several objects of the same type over a certain dimension in one pass.
+
+        For a PointSkeleton the inds-variable is renumbered if dim='inds' is given.
+        The result is sorted along the dimension unless the concatenated values are already increasing.
+
+        E.g. merging hourly files:
+        hourly = [SkeletonClass.from_netcdf(fn) for fn in filenames]
+        month = SkeletonClass.concat(hourly, dim='time')
+        """
+        skeletons = list(skeletons)
+        if not skeletons:
+            raise ValueError("Need at least one Skeleton to concatenate!")
+
+        first = skeletons[0]
+        if dim not in first.core.coords("all"):
+            raise UnknownCoordinateError(
+                f"Can't concatenate over '{dim}', since it is not a coordinate of {type(first).__name__}!"
+            )
+
+        structure = first.core.describe()
+        for skeleton in skeletons[1:]:
+            if type(skeleton) is not type(first) or skeleton.core.describe() != structure:
+                raise SkeletonError(
+                    f"Can only concatenate Skeletons with identical structure, not {type(first).__name__} and {type(skeleton).__name__}!"
+                )
+
+        # Coordinates and variables without the dimension need to be identical in all Skeletons
+        try:
+            ds = xr.concat(
+                [skeleton.ds() for skeleton in skeletons],
+                dim=dim,
+                data_vars="minimal",
+                coords="minimal",
+                compat="equals",
+                join="exact",
+            )
+        except (ValueError, xr.MergeError) as error:
+            raise SkeletonError(
+                f"Can only concatenate Skeletons that are identical except along '{dim}'! {error}"
+            ) from error
+
+        # 'inds' is renumbered when the new Skeleton is created, so it is always increasing
+        if dim != "inds" and not ds.indexes[dim].is_monotonic_increasing:
+            ds = ds.sortby(dim)
+
+        return first._from_sliced_ds(ds)
+
+    def append_buffer(
+        self,
+        capacity: int = 16,
+        store: Optional[str] = None,
+        flush_every: Optional[int] = None,
+    ) -> TimeAppendBuffer:
+        """Returns a buffer that new timesteps can be appended to, starting with the times of this Skeleton.
+
+        The buffer is preallocated and grows by doubling its capacity, so appending a timestep only writes that slice.
+        Use absorb/concat to combine existing Skeletons.
+
+        capacity [default 16]: Number of timesteps to preallocate
+        store: Zarr-store ('.zarr') or netcdf-file that the buffer is flushed to
+        flush_every: Flush the buffer to the store when it contains this many timesteps, so that memory stays bounded
+
+        E.g. ingesting observations:
+        buffer = skeleton.append_buffer(store='obs.zarr', flush_every=24)
+        for time, hs in observations:
+            buffer.append(time, hs=hs)
+        buffer.flush()
+        """
+        return TimeAppendBuffer(
+            self, capacity=capacity, store=store, flush_every=flush_every
         )
-        return new_skeleton
 
     def cut_to_common_times(self, skeleton_to_compare_with: "Skeleton") -> "Skeleton":
         """Cuts the skeletons to cover only the coinciding times in the two skeletons.
@@ -504,12 +855,16 @@ class Skeleton:
             if slice_inds is not None:
                 return self.sel(inds=slice_inds, **kwargs)
 
-        return self.from_ds(
-            self.ds().sel(**kwargs),
-            data_vars=self.core.non_coord_objects(),
-            keep_ds_names=True,
-            name=self.name,
-        )
+        ds = self.ds().sel(**kwargs)
+        # Scalar selections drop the dimension, so select a list instead to keep the structure
+        dropped_dims = [dim for dim in kwargs if dim in self.ds().dims and dim not in ds.dims]
+        if dropped_dims:
+            kwargs = {
+                dim: [val] if dim in dropped_dims else val for dim, val in kwargs.items()
+            }
+            ds = self.ds().sel(**kwargs)
+
+        return self._from_sliced_ds(ds)
 
     def _determine_slice_inds(self, x_slice, y_slice, x: str, y: str):
         """Determines the indeces of e.g. a lon-slice for a PointSkeleton"""
@@ -533,12 +888,45 @@ class Skeleton:
         e.g. new_skeleton = skeleton.isel(lon=[0,1,2])
 
         Calls the Xarray .isel method on the underlying DataSet"""
-        return self.from_ds(
-            self.ds().isel(**kwargs),
-            data_vars=self.core.non_coord_objects(),
-            keep_ds_names=True,
-            name=self.name,
-        )
+        # Scalar indeces drop the dimension, so select a list instead to keep the structure
+        kwargs = {
+            dim: [val] if _is_scalar_index(val) else val
+            for dim, val in kwargs.items()
+        }
+        return self._from_sliced_ds(self.ds().isel(**kwargs))
+
+    def _from_sliced_ds(self, ds: xr.Dataset) -> "Skeleton":
+        """Creates a new instance from a Dataset that has been derived from the Dataset of this instance (e.g. a slice).
+
+        The structure (core, metadata, UTM-zone and dask-mode) is copied and the Dataset is used as is,
+        so nothing needs to be decoded or set.
+
+        The new instance shares the data with this instance (e.g. a basic slice is a view), so both copy a buffer
+        before writing to it in place (see DatasetManager.write_region)."""
+        self._ds_manager.mark_shared()
+        if "inds" in ds.dims:
+            ds = ds.assign_coords(inds=np.arange(ds.sizes["inds"]))
+
+        # Gridded coordinates are always unique and sorted
+        if self.is_gridded():
+            for coord in [self.core.x_str, self.core.y_str]:
+                __, unique_inds = np.unique(ds[coord].values, return_index=True)
+                if not np.array_equal(unique_inds, np.arange(ds.sizes[coord])):
+                    ds = ds.isel({coord: unique_inds})
+
+        new_skeleton = object.__new__(self.__class__)
+        # Don't copy the DatasetManager (and the data) that the metadata manager refers to
+        new_skeleton.core = deepcopy(self.core, memo={id(self._ds_manager): None})
+        new_skeleton.meta = new_skeleton.core.meta
+        new_skeleton._ds_manager = DatasetManager(new_skeleton.core)
+        new_skeleton._ds_manager.set_new_ds(ds)
+        new_skeleton.meta._ds_manager = new_skeleton._ds_manager
+        new_skeleton._reset_spatial_caches()
+
+        new_skeleton._init_managers(utm=None, chunks=self.dask.chunks)
+        if self.utm.is_set():
+            new_skeleton.utm.set(self.utm.zone(), silent=True)
+        return new_skeleton
 
     def insert(self, name: str, data: np.ndarray, **kwargs) -> None:
         """Inserts a slice of data into the Skeleton.
@@ -547,6 +935,8 @@ class Skeleton:
         data_slice having the threshold=0.4 and time='2023-11-08 12:00:00' having shape=(10,) can be inserted by using the values:
 
         skeleton.insert(name='geodata', data=data_slice, time='2023-11-08 12:00:00', threshold=0.4)
+
+        A batch of slices can be inserted by giving several values, e.g. time=['2023-11-08 12:00:00', '2023-11-08 18:00:00']
         """
         coord_group = self.core.coord_group(name)
         dims = self.core.coords(coord_group)
@@ -555,39 +945,116 @@ class Skeleton:
         for dim in dims:
             val = kwargs.get(dim)
             if val is not None:
-                index_kwargs[dim] = np.where(self.get(dim) == val)[0][0]
+                index_kwargs[dim] = self._coord_index(dim, val)
 
         self.ind_insert(name=name, data=data, **index_kwargs)
 
+    def _coord_index(self, dim: str, value) -> Union[int, np.ndarray]:
+        """Finds the index of a value (or of several values) of a coordinate using the index of the Dataset"""
+        index = self._ds_manager.ds().indexes.get(dim)
+        if index is None:
+            raise KeyError(f"No coordinate {dim} exists!")
+
+        values = np.atleast_1d(value)
+        if isinstance(index, pd.DatetimeIndex):
+            values = pd.to_datetime(values)
+
+        inds = index.get_indexer(values)
+        if np.any(inds < 0):
+            raise KeyError(f"Value(s) {value} not found in coordinate {dim}!")
+        if np.ndim(value) == 0:
+            return int(inds[0])
+        return inds
+
     def ind_insert(self, name: str, data: np.ndarray, **kwargs) -> None:
         """Inserts a slice of data into the Skeleton.
 
         If data named 'geodata' has dimension ('time', 'inds', 'threshold') and shape (57, 10, 3), then
         data_slice having the first threshold and first time can be inserted by using the index values:
 
-        skeleton.ind_insert(name='geodata', data=data_slice, time=0, threshold=0)"""
+        skeleton.ind_insert(name='geodata', data=data_slice, time=0, threshold=0)
+
+        A batch of slices can be inserted by giving several indices, e.g. time=[0, 5, 7]
+
+        The data is written directly into the stored array (lazily in dask-mode), so the rest of the variable is not copied.
+        The array is copied once if it might be shared, e.g. if the Dataset, a slice or the data has been given out."""
 
         coord_group = self.core.coord_group(name)
         dims = self.core.coords(coord_group)
-        index_list = list(np.arange(len(dims)))
 
-        for n, dim in enumerate(dims):
-            var = self.get(dim)
-            if var is None:
+        index = []
+        for dim in dims:
+            if dim not in self._ds_manager.ds().sizes:
                 raise KeyError(f"No coordinate {dim} exists!")
-            ind = kwargs.get(dim, slice(len(var)))
-            index_list[n] = ind
-
-        old_data = self.get(name, squeeze=False).copy()
-        N = len(old_data.shape)
-        data_str = "old_data["
-        for n in range(N):
-            data_str += f"{index_list[n]},"
-        data_str = data_str[:-1]
-        data_str += "] = data"
-        exec(data_str)
-        self.set(name, old_data, allow_reshape=False)
-        return
+            ind = kwargs.get(dim, slice(None))
+            if isinstance(ind, (list, tuple)):
+                ind = np.array(ind)
+            index.append(ind)
+        index = tuple(index)
+
+        if name in self.core.magnitudes("all") + self.core.directions("all"):
+            self._insert_vector(name, index, data)
+        else:
+            self._insert_data(name, index, data)
+
+    def _insert_data(self, name: str, index: tuple, data: np.ndarray) -> None:
+        """Writes data into a region of a data variable or mask"""
+        plan = self.core.accessor_plan(name)
+        if plan is None or plan.kind not in ["data", "mask"]:
+            raise UnknownVariableError(f"Cannot insert data into '{name}'!")
+
+        if self._ds_manager.get(plan.stored_name, strict=True) is None:
+            self.set(plan.stored_name)
+
+        if not self.dask.data_is_dask(data):
+            data = np.asarray(data)
+
+        if plan.kind == "mask":
+            if plan.inverted:
+                data = np.logical_not(data)
+            data = data.astype(bool)
+        else:
+            data = self._to_storage(name, data)
+
+        self._ds_manager.write_region(plan.stored_name, index, data)
+
+        if name in SPATIAL_COORDS:
+            self._reset_spatial_caches()
+        if self.core.triggers(name):
+            self._trigger_masks(name, self.get(name, squeeze=False))
+
+    def _insert_vector(self, name: str, index: tuple, data: np.ndarray) -> None:
+        """Writes a region of a magnitude or direction by writing the region of the components.
+
+        The other part of the vector is computed only for the region."""
+        obj = self.core.get(name)
+        for component in [obj.x, obj.y]:
+            if self._ds_manager.get(component, strict=True) is None:
+                self.set(component)
+
+        region = dict(zip(self.core.dims(obj.x), index))
+        x, y = [
+            self._from_storage(
+                component,
+                self._ds_manager.get(component).isel(region),
+                is_empty=False,
+            ).data
+            for component in [obj.x, obj.y]
+        ]
+
+        if name in self.core.magnitudes("all"):
+            __, math_dir = dir_conversions.compute_polar(x, y, dir_type="math")
+            ux, uy = dir_conversions.compute_components(
+                data, math_dir, dir_type="math"
+            )
+        else:
+            magnitude, __ = dir_conversions.compute_polar(x, y, dir_type="math")
+            ux, uy = dir_conversions.compute_components(
+                magnitude, data, dir_type=obj.dir_type
+            )
+
+        self._insert_data(obj.x, index, ux)
+        self._insert_data(obj.y, index, uy)
 
     def set(
         self,
@@ -626,6 +1093,114 @@ class Skeleton:
 
         """
 
+        name, data = self._prepare_data(
+            name,
+            data,
+            dir_type=dir_type,
+            allow_reshape=allow_reshape,
+            allow_transpose=allow_transpose,
+            coords=coords,
+            silent=silent,
+            chunks=chunks,
+        )
+
+        if name in self.core.magnitudes("all"):
+            if dir_type:
+                raise DirTypeError
+            self._set_magnitude(
+                name=name,
+                data=data,
+            )
+        elif name in self.core.directions("all"):
+            self._set_direction(
+                name=name,
+                data=data,
+                dir_type=dir_type,
+            )
+        else:
+            self._set_data(
+                name=name,
+                data=data,
+                dir_type=dir_type,
+            )
+
+        return
+
+    def set_many(
+        self,
+        data: dict[Union[str, MetaParameter], Optional[Union[np.ndarray, xr.DataArray]]],
+        allow_reshape: bool = True,
+        allow_transpose: bool = False,
+        silent: bool = True,
+        chunks: Optional[Union[tuple, str]] = None,
+    ) -> None:
+        """Sets several variables and masks at once, e.g. .set_many({'hs': hs, 'tp': tp}).
+
+        The data is processed in the same way as in .set(), and the keywords are used for all variables.
+        Directional data is assumed to be in the dir_type of the variable.
+        An opposite mask (e.g. 'land_mask') is inverted and stored as its primary mask (e.g. 'sea_mask').
+
+        All data variables and masks are added to the Dataset in one update.
+        Magnitudes and directions are set after that, since they depend on each other."""
+        bulk_data = {}
+        vectors = []
+        for name, values in data.items():
+            name, values = self._prepare_data(
+                name,
+                values,
+                allow_reshape=allow_reshape,
+                allow_transpose=allow_transpose,
+                silent=silent,
+                chunks=chunks,
+            )
+            plan = self.core.accessor_plan(name)
+            if plan.kind in ["magnitude", "direction"]:
+                vectors.append((name, values))
+                continue
+
+            if plan.kind == "mask" and plan.inverted:
+                values = np.logical_not(values)
+            elif plan.dir_type is not None:
+                # Only makes sure the directions are in the range [0, 360)
+                values = dir_conversions.convert(
+                    values, in_type=plan.dir_type, out_type=plan.dir_type
+                )
+            bulk_data[plan.stored_name] = values
+
+        if bulk_data:
+            self._ds_manager.set_many(
+                {
+                    name: self._to_storage(name, values)
+                    for name, values in bulk_data.items()
+                },
+                attrs={name: self.meta.get(name) for name in bulk_data},
+            )
+            if set(bulk_data) & set(SPATIAL_COORDS):
+                self._reset_spatial_caches()
+
+            triggered_masks = {}
+            for name, values in bulk_data.items():
+                triggered_masks.update(self._triggered_masks(name, values))
+            if triggered_masks:
+                self.set_many(triggered_masks)
+
+        for name, values in vectors:
+            self.set(name, values, allow_reshape=False)
+
+    def _prepare_data(
+        self,
+        name: Union[str, MetaParameter],
+        data: Optional[Union[np.ndarray, xr.DataArray]],
+        dir_type: Optional[str] = None,
+        allow_reshape: bool = True,
+        allow_transpose: bool = False,
+        coords: Optional[list[str]] = None,
+        silent: bool = True,
+        chunks: Optional[Union[tuple, str]] = None,
+    ) -> tuple[str, np.ndarray]:
+        """Resolves the name of the variable and converts the data to an array of the right shape (see .set()).
+
+        Returns the name and the data."""
         if not isinstance(name, str) and not gp.is_gp(name):
             raise TypeError(
                 f"'name' must be of type 'str', or 'MetaParameter' not '{type(name).__name__}'!"
@@ -641,13 +1216,13 @@ class Skeleton:
                 )
             name = names[0]
 
-        first_set = (
-            name in self._ds_manager.empty_vars()
-            or name in self._ds_manager.empty_masks()
-        )
-
+        # Given numpy arrays are copied so that later changes to them don't affect the Skeleton
+        copy_needed = data is not None
         if data is None:
-            data = self.get(name, empty=True, squeeze=False, dir_type=dir_type)
+            # Keeps the empty data a zero-stride constant until it is written
+            data = self.get(
+                name, empty=True, squeeze=False, dir_type=dir_type, data_array=True
+            )
 
         data = dask_computations.atleast_1d(data)
 
@@ -679,34 +1254,13 @@ class Skeleton:
                 f"'dir_type' needs to be 'to', 'from' or 'math' (or None), not {dir_type}"
             )
 
-        # Masks are stored as integers
+        # Masks are stored as booleans (1 byte per value)
         if name in self.core.masks("all"):
-            data = data.astype(int)
+            data = data.astype(bool, copy=copy_needed)
+        elif copy_needed and isinstance(data, np.ndarray):
+            data = data.copy()
 
-        if name in self.core.magnitudes("all"):
-            if dir_type:
-                raise DirTypeError
-            self._set_magnitude(
-                name=name,
-                data=data,
-            )
-        elif name in self.core.directions("all"):
-            self._set_direction(
-                name=name,
-                data=data,
-                dir_type=dir_type,
-            )
-        else:
-            self._set_data(
-                name=name,
-                data=data,
-                dir_type=dir_type,
-            )
-
-        if first_set:
-            self.meta.metadata_to_ds(name)
-
-        return
+        return name, data
 
     def _reshape_data(
         self,
@@ -798,10 +1352,7 @@ class Skeleton:
         x_component, y_component = obj.x, obj.y
         dir_data = self.get(obj.direction.name, dir_type="math", squeeze=False)
 
-        s = dask_computations.sin(dir_data)
-        c = dask_computations.cos(dir_data)
-        ux = data * c
-        uy = data * s
+        ux, uy = dir_conversions.compute_components(data, dir_data, dir_type="math")
         self._set_data(
             name=x_component,
             data=ux,
@@ -828,12 +1379,7 @@ class Skeleton:
 
         dir_type = dir_type or obj.dir_type
 
-        data = dir_conversions.convert_to_math_dir(data, dir_type)
-
-        s = dask_computations.sin(data)
-        c = dask_computations.cos(data)
-        ux = mag_data * c
-        uy = mag_data * s
+        ux, uy = dir_conversions.compute_components(mag_data, data, dir_type=dir_type)
 
         self._set_data(
             name=x_component,
@@ -865,13 +1411,66 @@ class Skeleton:
 
         dir_type = dir_type or set_dir_type
         data = dir_conversions.convert(data, in_type=dir_type, out_type=set_dir_type)
-        self._ds_manager.set(data=data, name=name)
-        self.meta.metadata_to_ds(name)
+        self._ds_manager.set(
+            data=self._to_storage(name, data), name=name, attrs=self.meta.get(name)
+        )
+        if name in SPATIAL_COORDS:
+            self._reset_spatial_caches()
         self._trigger_masks(name, data)
 
+    def _storage_dtype(self, name: str) -> Optional[np.dtype]:
+        """The dtype a data variable is stored in: set for the variable, or the default of the class.
+
+        None means that the data is stored in the dtype it is set with."""
+        var = self.core._added_vars.get(name)
+        if var is None or name in SPATIAL_COORDS:
+            return None
+        dtype = var.dtype or self.dtype
+        if dtype is None:
+            return None
+        return np.dtype(dtype)
+
+    def _to_storage(
+        self, name: str, data: Union[np.ndarray, xr.DataArray]
+    ) -> Union[np.ndarray, xr.DataArray]:
+        """Casts (or packs) data to the dtype that the variable is stored in"""
+        var = self.core._added_vars.get(name)
+        if packing.is_packed(var):
+            return packing.pack(data, var)
+        dtype = self._storage_dtype(name)
+        if dtype is None:
+            return data
+        return data.astype(dtype, copy=False)
+
+    def _from_storage(
+        self, name: str, data: xr.DataArray, is_empty: bool
+    ) -> xr.DataArray:
+        """Unpacks stored data. Empty arrays (filled with the default value) are cast to the right dtype."""
+        var = self.core._added_vars.get(name)
+        if packing.is_packed(var):
+            dtype = packing.unpacked_dtype(var)
+            if not is_empty:
+                return packing.unpack(data, var)
+        else:
+            dtype = self._storage_dtype(name)
+        if dtype is None or not is_empty:
+            return data
+        # Keep the empty array a zero-stride constant
+        return data.copy(
+            data=np.broadcast_to(np.array(var.default_value, dtype=dtype), data.shape)
+        )
+
     def _trigger_masks(self, name: str, data: Union[np.ndarray, xr.DataArray]) -> None:
         """Set any masks that are triggered by setting a specific data variable
         E.g. Set new 'land_mask' when 'topo' is set."""
+        for mask_name, mask_array in self._triggered_masks(name, data).items():
+            self.set(mask_name, mask_array)
+
+    def _triggered_masks(
+        self, name: str, data: Union[np.ndarray, xr.DataArray]
+    ) -> dict[str, Union[np.ndarray, xr.DataArray]]:
+        """Computes the masks that are triggered by setting a specific data variable"""
+        masks = {}
         for mask in self.core.triggers(name):
 
             if mask.range_inclusive[0]:
@@ -884,8 +1483,8 @@ class Skeleton:
             else:
                 high_mask = data < mask.valid_range[1]
 
-            mask_array = np.logical_and(low_mask, high_mask)
-            self.set(mask.name, mask_array)
+            masks[mask.name] = np.logical_and(low_mask, high_mask)
+        return masks
 
     def get(
         self,
@@ -910,6 +1509,11 @@ class Skeleton:
         if self.ds() is None:
             return None
 
+        if isinstance(name, str) and not (empty or data_array or kwargs):
+            data = self._get_numpy_view(name, dir_type, squeeze, dask)
+            if data is not None:
+                return dask_computations.writable_constant(data)
+
         if not isinstance(name, str) and not gp.is_gp(name):
             raise TypeError(
                 f"'name' must be of type 'str', or 'MetaParameter' not '{type(name).__name__}'!"
@@ -974,7 +1578,7 @@ class Skeleton:
                 **kwargs,
             )
             if mask_is_secondary:
-                data = np.logical_not(data).astype(int)
+                data = np.logical_not(data)
         else:
             data = self._get_data(
                 name=name,
@@ -992,7 +1596,7 @@ class Skeleton:
             dask = False
 
         if name in self.core.masks("all"):
-            data = data.astype(bool)
+            data = data.astype(bool, copy=False)
 
         if squeeze:
             data = self._smart_squeeze(name, data)
@@ -1016,6 +1620,9 @@ class Skeleton:
             data = data.data
             if name == "time":
                 data = pd.to_datetime(data)
+            else:
+                # Empty (zero-stride) data is only allocated when given out
+                data = dask_computations.writable_constant(data)
 
         return data
 
@@ -1106,15 +1713,15 @@ class Skeleton:
         **kwargs,
     ) -> xr.DataArray:
         data = self._ds_manager.get(name, empty=empty, strict=strict, **kwargs)
-
-        if not self.dask.is_active() and (
-            empty or self._ds_manager.get(name, strict=True) is None
-        ):
-            data = self.dask.undask_me(data)
+        is_empty = empty or self._ds_manager.get(name, strict=True) is None
 
         if data is None:
             return None
 
+        data = self._from_storage(name, data, is_empty)
+        if not self.dask.is_active() and is_empty:
+            data = self.dask.undask_me(data)
+
         set_dir_type = self.core.get_dir_type(name)
         if dir_type is not None and set_dir_type is None:
             raise DirTypeError
@@ -1122,6 +1729,71 @@ class Skeleton:
         data = dir_conversions.convert(data, in_type=set_dir_type, out_type=dir_type)
         return data
 
+    def _get_numpy_view(
+        self,
+        name: str,
+        dir_type: Optional[str],
+        squeeze: bool,
+        dask: Optional[bool],
+    ) -> Optional[np.ndarray]:
+        """Fast path of .get() for stored numpy data. Returns a view of the data in the Dataset
+        (a new array only for opposite masks and for masks that were not stored as booleans).
+
+        Returns None if the fast path doesn't apply, e.g. if the data needs to be converted or is a dask array.
+        """
+        plan = self.core.accessor_plan(name)
+        if plan is None or plan.kind not in ["data", "mask", "coord"] or plan.packed:
+            return None
+        if name in SPATIAL_COORDS or name == "time":
+            return None
+        if dir_type is not None and dir_type != plan.dir_type:
+            return None
+        if plan.kind != "coord" and (
+            dask or (dask is None and self.dask.is_active())
+        ):
+            return None
+
+        variable = self._ds_manager.ds().variables.get(plan.stored_name)
+        if variable is None or not isinstance(variable.data, np.ndarray):
+            return None
+
+        data = variable.data
+        if squeeze:
+            axes = [
+                variable.dims.index(dim)
+                for dim in self._dims_to_squeeze(name, variable.dims, variable.shape)
+            ]
+            if axes:
+                data = np.squeeze(data, axis=tuple(axes))
+
+        if plan.kind == "mask":
+            if plan.inverted:
+                return np.logical_not(data)
+            return data.astype(bool, copy=False)
+
+        return data
+
+    def _dims_to_squeeze(
+        self, name: str, dims: tuple[str], shape: tuple[int]
+    ) -> list[str]:
+        """Determines the trivial dimensions to squeeze out, but takes care that one dimension is kept.
+
+        Spatial dims are not generally protected, but if the results is a 0-dim,
+        then 'inds' or 'lon'&'lat' or 'x'&'y' is kept."""
+        all_coords = self.core.coords("all")
+        dims_to_drop = [
+            dim for dim, size in zip(dims, shape) if size == 1 and dim in all_coords
+        ]
+
+        # If it looks like we are dropping all coords, then save the spatial ones
+        if set(dims_to_drop) == set(dims):
+            dims_to_drop = [
+                dim
+                for dim in dims_to_drop
+                if dim not in self.core.coords("spatial") and dim != name
+            ]
+        return dims_to_drop
+
     def _smart_squeeze(self, name: str, data: xr.DataArray) -> xr.DataArray:
         """Squeezes the data but takes care that one dimension is kept.
 
@@ -1182,6 +1854,10 @@ class Skeleton:
         """
         if not hasattr(self, "_ds_manager"):
             return None
+        # Changes to the metadata are written to the Dataset only when it is needed
+        self.meta.sync_to_ds()
+        # The Dataset shares the buffers, so they can't be written to in place anymore
+        self._ds_manager.mark_shared()
         ds = self._ds_manager.ds()
         if compile:
             ds = deepcopy(ds)
@@ -1462,12 +2138,9 @@ class Skeleton:
         fast: bool,
         npoints: int,
     ) -> tuple[np.ndarray, np.ndarray]:
-        """Applies a cartesian or spherical search on given coordinates, finding nearest points and returning indeces and distances."""
-        inds = []
-        dx = []
-        xlist, ylist = self.xy(utm=utm_to_use)
-        lonlist, latlist = self.lonlat()
+        """Applies a cartesian or spherical search on given coordinates, finding nearest points and returning indeces and distances.
 
+        The searches are done for all points at once using the cached spatial index of the Skeleton."""
         if (
             x is None
         ):  # x is None e.g. when all lat are over 84 deg or no UTM zone is set
@@ -1475,10 +2148,10 @@ class Skeleton:
         elif lat is None:  # lat is None e.g. when no UTM zone is set
             fast = True
 
-        if np.any(
-            np.isnan(ylist)
-        ):  # Some over 84 deg latitudes means we can't calculate shorest cartesian distance
-            fast = False
+        if fast:
+            __, all_points_valid = self._spatial_index.cartesian_tree(utm_to_use)
+            # Some over 84 deg latitudes means we can't calculate shorest cartesian distance
+            fast = all_points_valid
 
         if x is not None:
             number_of_points = len(x)
@@ -1486,32 +2159,65 @@ class Skeleton:
             number_of_points = len(lon)
 
         if lat is not None:
-            out_of_range_lats = np.logical_or(lat > 84, lat < -80)
+            slow_points = np.logical_or(lat > 84, lat < -80)
         else:
-            out_of_range_lats = np.full(number_of_points, False)
+            slow_points = np.full(number_of_points, False)
 
-        for n in range(number_of_points):
-            dxx, ii = None, None
+        if not fast:
+            slow_points = np.full(number_of_points, True)
 
-            if out_of_range_lats[n] or not fast:  # Over 84 lat so using slow method
-                dxx, ii = distance_funcs.min_distance(
-                    lon[n], lat[n], lonlist, latlist, npoints
-                )
-            else:
-                dxx, ii = distance_funcs.min_cartesian_distance(
-                    x[n], y[n], xlist, ylist, npoints
-                )
+        npoints = min(npoints, self._number_of_spatial_points())
+        inds = np.zeros((number_of_points, npoints), dtype=int)
+        dx = np.zeros((number_of_points, npoints))
 
-            if dxx is not None:
-                inds.append(ii)
-                dx.append(dxx)
-        return list(itertools.chain.from_iterable(inds)), list(
-            itertools.chain.from_iterable(dx)
-        )
+        if np.any(slow_points):  # Over 84 lat so using geodesic distances
+            dx[slow_points], inds[slow_points] = self._spatial_index.nearest_spherical(
+                lon[slow_points], lat[slow_points], npoints
+            )
+        fast_points = np.logical_not(slow_points)
+        if np.any(fast_points):
+            dx[fast_points], inds[fast_points] = self._spatial_index.nearest_cartesian(
+                x[fast_points], y[fast_points], utm_to_use, npoints
+            )
+
+        return list(inds.ravel()), list(dx.ravel())
+
+    def _number_of_spatial_points(self) -> int:
+        """Total number of spatial points (e.g. nx*ny for gridded skeletons)"""
+        return int(np.prod(self.size("spatial")))
+
+    def _projected_xy(
+        self, utm: Optional[tuple[int, str]] = None, **kwargs
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """UTM x- and y-coordinates of all points converted from lon/lat in the given UTM-zone (default: zone of Skeleton).
+
+        The result is memoized (read-only arrays) unless the data is sliced using keywords."""
+        utm = utm or self.utm.zone()
+
+        def project():
+            lon, lat = self.lonlat(**kwargs)
+            return self.utm._xy(lon=lon, lat=lat, utm=utm)
+
+        if kwargs:
+            return project()
+        return self.utm._memoize(("xy", utm), project)
+
+    def _projected_lonlat(self, **kwargs) -> tuple[np.ndarray, np.ndarray]:
+        """Longitudes and latitudes of all points converted from x/y using the UTM-zone of the Skeleton.
+
+        The result is memoized (read-only arrays) unless the data is sliced using keywords."""
+
+        def unproject():
+            x, y = self.xy(**kwargs)
+            return self.utm._lonlat(x=x, y=y, utm=self.utm.zone())
+
+        if kwargs:
+            return unproject()
+        return self.utm._memoize(("lonlat", self.utm.zone()), unproject)
 
     @property
     def name(self) -> str:
-        return self._ds_manager.get_attrs().get('_global_').get('name') or 'LonelySkeleton'
+        return self.meta.get().get('name') or 'LonelySkeleton'
 
     @name.setter
     def name(self, new_name: str) -> None:
@@ -1527,7 +2233,12 @@ class Skeleton:
             chunk_list.append(chunk_dict.get(coord, "auto"))
         return tuple(chunk_list)
 
-    def iterate(self, coords: Optional[list[str]] = None):
+    def iterate(
+        self,
+        coords: Optional[list[str]] = None,
+        offset: int = 0,
+        batch_size: Optional[int] = None,
+    ) -> SkeletonIterator:
         """Return an iterator object for iterating over a list of coordinates.
 
         E.g. to iterates first over 'time' values, and then over 'z' values:
@@ -1538,9 +2249,65 @@ class Skeleton:
         Default is the defined 'grid' coord group (including basic spatial coords), which is identical to:
         for slice in skeleton:
             pass
+
+        The slices are created when they are needed, so the iteration runs in constant memory.
+
+        offset [default 0]: Start from the n:th slice (e.g. to resume an interrupted iteration).
+        batch_size [default None]: Give lists of batch_size slices instead of single slices.
+        """
+        coords = coords or self.core.coords("grid")
+        return iter(self)(coords, offset=offset, batch_size=batch_size)
+
+    def map(
+        self,
+        func: Callable[["Skeleton"], "Skeleton"],
+        coords: Optional[list[str]] = None,
+        workers: Optional[int] = None,
+        backend: str = "thread",
+    ) -> "Skeleton":
+        """Applies a function to all slices of the Skeleton in parallel and combines the results to a new Skeleton.
+
+        func takes a slice (an instance of the same class) and returns the processed slice.
+        coords: Coordinates to iterate over (see .iterate()). Default is the 'grid' coord group.
+        workers: Number of parallel workers (default: number of CPUs)
+        backend: 'thread' [default], 'process' (func needs to be pickleable) or 'dask'
+
+        E.g. to integrate spectra for every time and point:
+        def integrate(spec_slice):
+            spec_slice.set_hs(4*np.sqrt(np.sum(spec_slice.spec())*df))
+            return spec_slice
+
+        new_skeleton = skeleton.map(integrate, coords=['time','inds'], workers=8)
         """
         coords = coords or self.core.coords("grid")
-        return iter(self)(coords)
+        results = map_over_slices(
+            self, func, coords=coords, workers=workers, backend=backend
+        )
+
+        for result in results:
+            if not isinstance(result, Skeleton):
+                raise TypeError(
+                    f"The mapped function needs to return a Skeleton, not '{type(result).__name__}'!"
+                )
+
+        # The first coordinate varies fastest in the iteration, so it is the innermost list
+        concat_dims = list(coords)[::-1]
+        shape = [len(self.get(coord)) for coord in concat_dims]
+        nested_ds = _nest_list([result.ds() for result in results], shape)
+
+        if concat_dims:
+            ds = xr.combine_nested(
+                nested_ds,
+                concat_dim=concat_dims,
+                data_vars="minimal",
+                coords="minimal",
+                compat="override",
+                combine_attrs="override",
+            )
+        else:
+            ds = nested_ds
+
+        return results[0]._from_sliced_ds(ds)
 
     def __iter__(self):
         """Equal to calling skeleton.iterate()"""
@@ -1658,3 +2425,39 @@ def _determine_inds(coord_slice, all_vals):
         )
     )[0]
     return coord_inds
+
+
+def _chunks_for_reading(
+    lazy: bool, chunks: Optional[Union[tuple[int], dict[str, int], str]]
+) -> tuple[Optional[Union[dict[str, int], str]], Optional[Union[tuple[int], str]]]:
+    """Determines the chunks used by xarray when reading a file and the chunks given to the Skeleton.
+
+    Tuple-chunks are meant for the Skeleton and are not known by xarray. Giving chunks implies lazy reading."""
+    if not lazy and chunks is None:
+        return None, None
+    file_chunks = chunks if isinstance(chunks, (dict, str)) else "auto"
+    skeleton_chunks = chunks if isinstance(chunks, tuple) else "auto"
+    return file_chunks, skeleton_chunks
+
+
+def _has_wildcards(filename: str) -> bool:
+    """Checks if a filename is a glob-pattern, e.g. 'hindcast_2020*.nc'"""
+    return any(char in filename for char in "*?[")
+
+
+def _is_scalar_index(val) -> bool:
+    """Checks if an index (e.g. 0, but not [0] or slice(0,1)) would drop the dimension"""
+    return not isinstance(val, slice) and np.ndim(val) == 0
+
+
+def _nest_list(flat_list: list, shape: list[int]) -> list:
+    """Reshapes a flat list to nested lists, e.g. shape [2, 3] gives a list of two lists of length three."""
+    if not shape:
+        return flat_list[0]
+    if len(shape) == 1:
+        return flat_list
+    step = len(flat_list) // shape[0]
+    return [
+        _nest_list(flat_list[n * step : (n + 1) * step], shape[1:])
+        for n in range(shape[0])
+    ]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+import os
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from .errors import UnknownCoordinateError, UnknownVariableError
+
+if TYPE_CHECKING:
+    from .skeleton import Skeleton
+
+
+class TimeAppendBuffer:
+    """Collects timesteps of a Skeleton in arrays that are preallocated along the time-dimension.
+
+    Appending a timestep only writes that slice. The capacity is doubled when the buffer is full, so appending
+    N timesteps copies O(N) data in total instead of concatenating the whole Skeleton for every timestep.
+
+    capacity: Number of timesteps to preallocate (at least the number of times in the Skeleton)
+    store: Zarr-store ('.zarr') or netcdf-file that full blocks are flushed to
+    flush_every: Flush the buffer to the store when it contains this many timesteps
+
+    Each flushed block is appended to the Zarr-store (also if the store existed before the buffer was created).
+    For netcdf, every block is written to its own numbered file, e.g. 'obs_0000.nc', 'obs_0001.nc', which can be
+    combined with .concat(..., dim='time'). Existing files are never overwritten: the next free number is used.
+
+    Masks triggered by a data variable are not updated when the data variable is appended.
+    """
+
+    def __init__(
+        self,
+        skeleton: Skeleton,
+        capacity: int = 16,
+        store: Optional[str] = None,
+        flush_every: Optional[int] = None,
+    ) -> None:
+        if "time" not in skeleton.core.coords("all"):
+            raise UnknownCoordinateError(
+                f"Can only append along 'time', but {type(skeleton).__name__} has no time coordinate!"
+            )
+        if flush_every is not None:
+            if store is None:
+                raise ValueError("Need a 'store' to flush the buffer to!")
+            if flush_every < 1:
+                raise ValueError(
+                    f"'flush_every' needs to be positive, not {flush_every}!"
+                )
+
+        self.store = store
+        self.flush_every = flush_every
+        self.n_flushed = 0
+
+        ds = skeleton.ds()
+        times = ds.time.values
+        self._n = len(times)
+        self._capacity = max(capacity, self._n, 1)
+
+        # Variables without the time-dimension are kept as they are
+        self._static = ds.drop_dims("time")
+        self._template = skeleton._from_sliced_ds(self._static)
+        self._coord_order = list(ds.coords)
+        self._var_order = list(ds.data_vars)
+
+        self._times = np.empty(self._capacity, dtype=times.dtype)
+        self._times[: self._n] = times
+        # Last time written to the store, so that the times stay increasing over all flushed blocks
+        self._last_flushed_time = None
+
+        # Time is always the first dimension of a variable (see move_time_and_spatial_to_front)
+        self._dims: dict[str, tuple[str]] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        for name in ds.data_vars:
+            if "time" in ds[name].dims:
+                self._dims[name] = ds[name].dims
+                self._arrays[name] = self._allocate(ds[name].values, self._n)
+
+    def __len__(self) -> int:
+        """Number of timesteps in the buffer (not counting flushed ones)"""
+        return self._n
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, time, **data) -> None:
+        """Appends one timestep (or several) to the buffer.
+
+        time: A single time or a list of times. Needs to be after the times already appended (also those flushed).
+        data: Data variables and masks of one timestep (shape without the time-dimension), or of all given times.
+            Variables that are not given are set to their default values for these times.
+
+        E.g. buffer.append('2020-01-01 06:00', hs=hs_obs, tp=tp_obs)
+        """
+        times = pd.to_datetime(np.atleast_1d(time)).values.astype(self._times.dtype)
+        last_time = self._times[self._n - 1] if self._n > 0 else self._last_flushed_time
+        if np.any(np.diff(times) <= np.timedelta64(0)) or (
+            last_time is not None and times[0] <= last_time
+        ):
+            raise ValueError(
+                "Can only append times that are increasing and after the times already appended (also the flushed ones)!"
+            )
+
+        n_times = len(times)
+        new_data = {}
+        for name, values in data.items():
+            stored_name, values = self._prepare(name, values)
+            if np.ndim(time) == 0:
+                values = np.expand_dims(values, 0)
+            shape = (n_times,) + self._slice_shape(stored_name)
+            new_data[stored_name] = np.broadcast_to(values, shape)
+
+        self._reserve(self._n + n_times)
+        for name, values in new_data.items():
+            if name not in self._arrays:
+                self._add_variable(name)
+            array = self._arrays[name]
+            if np.result_type(array.dtype, values.dtype) != array.dtype:
+                array = array.astype(np.result_type(array.dtype, values.dtype))
+                self._arrays[name] = array
+            array[self._n : self._n + n_times] = values
+
+        for name, array in self._arrays.items():
+            if name not in new_data:
+                array[self._n : self._n + n_times] = self._fill_value(name)
+
+        self._times[self._n : self._n + n_times] = times
+        self._n += n_times
+
+        if self.flush_every is not None and self._n >= self.flush_every:
+            self.flush()
+
+    def view(self) -> Skeleton:
+        """The timesteps in the buffer as a Skeleton. The data is not copied.
+
+        The Skeleton keeps its data after the buffer is flushed or grows."""
+        coords = {}
+        for coord in self._coord_order:
+            if coord == "time":
+                coords[coord] = ("time", self._times[: self._n])
+            else:
+                coords[coord] = self._static[coord]
+
+        data_vars = {}
+        new_vars = sorted(set(self._arrays) - set(self._var_order))
+        for name in self._var_order + new_vars:
+            if name in self._arrays:
+                data_vars[name] = xr.Variable(
+                    self._dims[name],
+                    self._arrays[name][: self._n],
+                    attrs=self._template.meta.get(name),
+                )
+            else:
+                data_vars[name] = self._static[name]
+
+        ds = xr.Dataset(
+            data_vars=data_vars, coords=coords, attrs=self._static.attrs
+        )
+        return self._template._from_sliced_ds(ds)
+
+    def flush(self) -> Optional[str]:
+        """Writes the timesteps in the buffer to the store and empties the buffer.
+
+        Returns the file or store that was written to (None if the buffer was empty)."""
+        if self.store is None:
+            raise ValueError("Need a 'store' to flush the buffer to!")
+        if self._n == 0:
+            return None
+
+        skeleton = self.view()
+        if _is_zarr(self.store):
+            skeleton.to_zarr(self.store, append=os.path.exists(self.store))
+            filename = self.store
+        else:
+            filename = _next_free_filename(self.store)
+            skeleton.ds().to_netcdf(filename)
+        self.n_flushed += 1
+        self._last_flushed_time = self._times[self._n - 1]
+
+        # New arrays, so that Skeletons viewing the flushed block are not overwritten
+        self._times = np.empty_like(self._times)
+        for name, array in self._arrays.items():
+            self._arrays[name] = np.empty_like(array)
+        self._n = 0
+        return filename
+
+    def _prepare(self, name: str, values) -> tuple[str, np.ndarray]:
+        """Converts values of a data variable or mask to how they are stored in the Dataset"""
+        plan = self._template.core.accessor_plan(name)
+        if plan is None or plan.kind not in ["data", "mask"]:
+            raise UnknownVariableError(f"Cannot append data to '{name}'!")
+        if "time" not in self._template.core.dims(plan.stored_name):
+            raise UnknownCoordinateError(
+                f"Cannot append '{name}', since it does not depend on time!"
+            )
+
+        values = np.asarray(values)
+        if plan.kind == "mask":
+            if plan.inverted:
+                values = np.logical_not(values)
+            return plan.stored_name, values.astype(bool)
+        return name, self._template._to_storage(name, values)
+
+    def _fill_value(self, name: str) -> np.ndarray:
+        """The stored default value of a variable"""
+        default = self._template.core.get(name).default_value
+        if name in self._template.core.masks():
+            return np.array(default, dtype=bool)
+        return self._template._to_storage(name, np.array(default, dtype=float))
+
+    def _add_variable(self, name: str) -> None:
+        """Starts buffering a variable that is appended for the first time. Earlier timesteps get the default value."""
+        self._dims[name] = tuple(self._template.core.dims(name))
+        fill = self._fill_value(name)
+        shape = (self._capacity,) + self._slice_shape(name)
+        self._arrays[name] = np.full(shape, fill, dtype=fill.dtype)
+
+    def _slice_shape(self, name: str) -> tuple[int]:
+        """Shape of one timestep of a variable"""
+        dims = self._template.core.dims(name)
+        return tuple(self._static.sizes[dim] for dim in dims if dim != "time")
+
+    def _allocate(self, values: np.ndarray, n: int) -> np.ndarray:
+        """Array with room for the capacity of the buffer, having the n first timesteps of the values"""
+        array = np.empty((self._capacity,) + values.shape[1:], dtype=values.dtype)
+        array[:n] = values[:n]
+        return array
+
+    def _reserve(self, n_times: int) -> None:
+        """Doubles the capacity until there is room for n_times timesteps"""
+        if n_times <= self._capacity:
+            return
+        while self._capacity < n_times:
+            self._capacity *= 2
+        self._times = self._allocate(self._times, self._n)
+        for name, array in self._arrays.items():
+            self._arrays[name] = self._allocate(array, self._n)
+
+
+def _next_free_filename(filename: str) -> str:
+    """E.g. 'obs.nc' -> 'obs_0002.nc' if 'obs_0000.nc' and 'obs_0001.nc' exist"""
+    stem, ext = os.path.splitext(filename)
+    number = 0
+    while os.path.exists(f"{stem}_{number:04d}{ext or '.nc'}"):
+        number += 1
+    return f"{stem}_{number:04d}{ext or '.nc'}"
+
+
+def _is_zarr(store: str) -> bool:
+    return os.path.splitext(str(store).rstrip("/"))[1] == ".zarr"
@@ -9,3 +9,6 @@ class DataVar:
     coord_group: str
     default_value: float
     dir_type: str = None
+    dtype: str = None
+    scale_factor: float = None
+    add_offset: float = None
@@ -1,7 +1,16 @@
 from geo_skeletons.point_skeleton import PointSkeleton
 from geo_skeletons.gridded_skeleton import GriddedSkeleton
-from geo_skeletons.decorators import add_coord, add_datavar
+from geo_skeletons.decorators import (
+    add_coord,
+    add_datavar,
+    add_mask,
+    add_time,
+    add_magnitude,
+)
+from geo_skeletons.errors import UnknownCoordinateError, UnknownVariableError
 import numpy as np
+import pandas as pd
+import pytest
 
 
 def test_absorb_point_cartesian():
@@ -105,3 +114,258 @@ def test_absorb_gridded_skeleton_along_new_coordinate():
     assert np.all(points3.test(z=slice(0, 4)) == points1.test())
     assert np.all(points3.test(z=slice(5, 7)) == points2.test())
     assert points3.size() == (4, 3, 8)
+
+
+def test_append_grows_by_doubling():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    buffer = obs.append_buffer(capacity=2)
+    assert len(buffer) == 1
+    capacities = []
+    for n, time in enumerate(pd.date_range("2020-01-01 01:00", periods=9, freq="h")):
+        buffer.append(time, tp=np.full(3, float(n)))
+        capacities.append(buffer.capacity)
+    assert capacities == [2, 4, 4, 8, 8, 8, 8, 16, 16]
+    assert len(buffer) == 10
+
+    obs = buffer.view()
+    assert isinstance(obs, Obs)
+    np.testing.assert_array_equal(
+        obs.time(), pd.date_range("2020-01-01 00:00", periods=10, freq="h")
+    )
+    np.testing.assert_array_almost_equal(obs.tp()[0], 10.0)
+    np.testing.assert_array_almost_equal(obs.tp()[1:, 0], np.arange(9))
+    # Variables without time are kept
+    np.testing.assert_array_almost_equal(obs.topo(), [10.0, 20.0, 30.0])
+    np.testing.assert_array_almost_equal(obs.lon(), [1.0, 2.0, 3.0])
+
+
+def test_view_is_not_copied():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    buffer = obs.append_buffer(capacity=8)
+    buffer.append("2020-01-01 01:00", tp=np.ones(3))
+    obs = buffer.view()
+    assert np.shares_memory(obs.ds().tp.values, buffer._arrays["tp"])
+
+    # Later appends don't change the view
+    buffer.append("2020-01-01 02:00", tp=np.zeros(3))
+    assert len(obs.time()) == 2
+    np.testing.assert_array_almost_equal(obs.tp()[1], 1.0)
+
+
+def test_append_several_times_and_defaults():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    buffer = obs.append_buffer()
+    times = pd.date_range("2020-01-01 01:00", periods=3, freq="h")
+    buffer.append(times, land_mask=[True, False, False], tp=np.ones((3, 3)))
+    obs = buffer.view()
+    np.testing.assert_array_almost_equal(obs.tp()[1:], 1.0)
+    assert obs.ds().sea_mask.dtype == bool
+    np.testing.assert_array_equal(obs.land_mask()[1:, 0], True)
+    np.testing.assert_array_equal(obs.land_mask()[:, 1:], False)
+    # Never given for the first time
+    np.testing.assert_array_equal(obs.land_mask()[0], False)
+
+    # Packed variable appended for the first time
+    buffer.append("2020-01-01 04:00", hs=[1.0, 2.0, np.nan])
+    obs = buffer.view()
+    assert obs.ds().hs.dtype == np.int16
+    np.testing.assert_allclose(obs.hs()[-1], [1.0, 2.0, np.nan], atol=1e-3)
+    np.testing.assert_allclose(obs.hs()[:-1], 0.0, atol=1e-3)
+    # Not given, so default value
+    np.testing.assert_array_almost_equal(obs.tp()[-1], 5.0)
+
+
+def test_append_errors():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    buffer = obs.append_buffer()
+    with pytest.raises(ValueError):
+        buffer.append("2020-01-01 00:00", tp=np.ones(3))
+    with pytest.raises(ValueError):
+        buffer.append(["2020-01-01 03:00", "2020-01-01 02:00"])
+    with pytest.raises(UnknownCoordinateError):
+        buffer.append("2020-01-01 01:00", topo=np.ones(3))
+    with pytest.raises(UnknownVariableError):
+        buffer.append("2020-01-01 01:00", swh=np.ones(3))
+    with pytest.raises(ValueError):
+        obs.append_buffer(flush_every=2)
+    with pytest.raises(UnknownCoordinateError):
+        PointSkeleton(lon=0, lat=0).append_buffer()
+
+
+def test_append_gridded_upcasts():
+    @add_magnitude("wind", x="u", y="v", direction="wdir", dir_type="from")
+    @add_datavar("v", default_value=0.0)
+    @add_datavar("u", default_value=0.0)
+    @add_time()
+    class Wind(GriddedSkeleton):
+        pass
+
+    wind = Wind(lon=(0, 2), lat=(50, 51), time=["2020-01-01 00:00"])
+    wind.set_spacing(nx=3, ny=2)
+    wind.set_u(np.ones(wind.size(), dtype=int))
+    buffer = wind.append_buffer()
+    buffer.append("2020-01-01 01:00", u=np.full((2, 3), 0.5), v=1.0)
+    new_wind = buffer.view()
+    np.testing.assert_array_almost_equal(new_wind.u()[:, 0, 0], [1.0, 0.5])
+    np.testing.assert_array_almost_equal(new_wind.v()[:, 0, 0], [0.0, 1.0])
+    np.testing.assert_array_almost_equal(new_wind.wind()[1], 1.25**0.5)
+
+
+def test_flush_zarr(tmp_path):
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    store = str(tmp_path / "obs.zarr")
+    buffer = obs.append_buffer(capacity=4, store=store, flush_every=4)
+    for n, time in enumerate(pd.date_range("2020-01-01 01:00", periods=9, freq="h")):
+        buffer.append(time, tp=np.full(3, float(n)))
+    assert buffer.n_flushed == 2
+    assert len(buffer) == 2
+    # Memory stays bounded
+    assert buffer.capacity == 4
+
+    buffer.flush()
+    assert len(buffer) == 0
+    obs = Obs.from_zarr(store, lazy=False)
+    assert len(obs.time()) == 10
+    np.testing.assert_array_almost_equal(obs.tp()[1:, 0], np.arange(9))
+    np.testing.assert_array_almost_equal(obs.lon(), [1.0, 2.0, 3.0])
+
+
+def test_append_after_flush_needs_later_times(tmp_path):
+    @add_datavar("tp", default_value=5.0)
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0], lat=[4.0, 5.0], time=["2020-01-01 00:00"])
+    store = str(tmp_path / "obs.zarr")
+    buffer = obs.append_buffer(store=store, flush_every=2)
+    buffer.append("2020-01-01 01:00", tp=[1.0, 2.0])
+    assert len(buffer) == 0
+    with pytest.raises(ValueError):
+        buffer.append("2020-01-01 01:00", tp=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        buffer.append("2020-01-01 00:30", tp=[1.0, 2.0])
+
+    buffer.append("2020-01-01 02:00", tp=[3.0, 4.0])
+    buffer.flush()
+    obs = Obs.from_zarr(store, lazy=False)
+    assert obs.time()[-1] == pd.Timestamp("2020-01-01 02:00")
+    assert len(obs.time()) == 3
+
+
+def test_flush_netcdf(tmp_path):
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    store = str(tmp_path / "obs.nc")
+    buffer = obs.append_buffer(store=store, flush_every=5)
+    for n, time in enumerate(pd.date_range("2020-01-01 01:00", periods=7, freq="h")):
+        buffer.append(time, tp=np.full(3, float(n)))
+    first_block = buffer.view()
+    assert buffer.flush() == str(tmp_path / "obs_0001.nc")
+    assert len(first_block.time()) == 3
+    assert sorted(p.name for p in tmp_path.glob("obs_*.nc")) == [
+        "obs_0000.nc",
+        "obs_0001.nc",
+    ]
+
+    blocks = [Obs.from_netcdf(str(fn)) for fn in sorted(tmp_path.glob("obs_*.nc"))]
+    obs = Obs.concat(blocks, dim="time")
+    np.testing.assert_array_almost_equal(obs.tp()[1:, 0], np.arange(7))
+    np.testing.assert_array_almost_equal(obs.lon(), [1.0, 2.0, 3.0])
+    assert buffer.flush() is None
+
+
+def test_flush_restart_does_not_overwrite(tmp_path):
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_datavar("hs", default_value=0.0, dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    obs = Obs(lon=[1.0, 2.0, 3.0], lat=[4.0, 5.0, 6.0], time=["2020-01-01 00:00"])
+    obs.set_tp(np.full(obs.size(), 10.0))
+    obs.set_topo([10.0, 20.0, 30.0])
+    times = pd.date_range("2020-01-01 01:00", periods=4, freq="h")
+    zarr_store = str(tmp_path / "obs.zarr")
+    nc_store = str(tmp_path / "obs.nc")
+    for store in [zarr_store, nc_store]:
+        buffer = obs.append_buffer(store=store)
+        buffer.append(times[:2], tp=np.ones((2, 3)))
+        buffer.flush()
+
+        # Restarted ingestion
+        buffer = obs.isel(time=slice(0, 0)).append_buffer(store=store)
+        buffer.append(times[2:], tp=np.full((2, 3), 2.0))
+        buffer.flush()
+
+    obs = Obs.from_zarr(zarr_store, lazy=False)
+    np.testing.assert_array_almost_equal(obs.tp()[:, 0], [10.0, 1.0, 1.0, 2.0, 2.0])
+
+    assert sorted(p.name for p in tmp_path.glob("obs_*.nc")) == [
+        "obs_0000.nc",
+        "obs_0001.nc",
+    ]
+    blocks = [Obs.from_netcdf(str(fn)) for fn in sorted(tmp_path.glob("obs_*.nc"))]
+    obs = Obs.concat(blocks, dim="time")
+    np.testing.assert_array_almost_equal(obs.tp()[:, 0], [10.0, 1.0, 1.0, 2.0, 2.0])
@@ -1,6 +1,10 @@
 from geo_skeletons import PointSkeleton
-from geo_skeletons.decorators import add_datavar, add_coord
+from geo_skeletons.decorators import add_datavar, add_coord, add_magnitude, add_time
+import geo_parameters as gp
+import dask.array as da
 import numpy as np
+import xarray as xr
+import pytest
 
 
 def test_add_datavar():
@@ -38,3 +42,130 @@ def test_add_datavar_on_top():
 
     assert "hs" in Expanded.core.data_vars()
     assert "tp" not in Expanded.core.data_vars()
+
+
+def test_add_datavar_dtype():
+    @add_datavar("temp")
+    @add_datavar("hs", dtype="int16", valid_range=(0, 30))
+    @add_datavar(gp.wave.Tp("tp"), dtype="float32")
+    @add_time()
+    class Wave(PointSkeleton):
+        pass
+
+    data = Wave(
+        lon=[1, 2, 3], lat=[4, 5, 6], time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    assert data.tp(empty=True).dtype == np.float32
+    data.set_tp(np.full(data.size(), 10.0))
+    assert data.ds().tp.dtype == np.float32
+    assert data.tp().dtype == np.float32
+    # Not affected
+    data.set_temp(np.full(data.size(), 10.0))
+    assert data.ds().temp.dtype == np.float64
+
+    class SmallWave(Wave):
+        dtype = "float32"
+
+    data = SmallWave(
+        lon=[1.0, 2.0, 3.0],
+        lat=[4, 5, 6],
+        time=("2020-01-01 00:00", "2020-01-01 05:00"),
+    )
+    data.set_temp(np.full(data.size(), 10.0))
+    assert data.ds().temp.dtype == np.float32
+    assert data.temp(empty=True).dtype == np.float32
+    # Explicitly set dtype not affected
+    data.set_hs(1.0)
+    assert data.ds().hs.dtype == np.int16
+    # Coordinates not affected
+    assert data.lon().dtype == np.float64
+
+
+def test_add_datavar_packed(capsys):
+    @add_datavar(gp.wave.Dirp("dirp"), dtype="int16")
+    @add_datavar(gp.wave.Hs("hs"), dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Wave(PointSkeleton):
+        pass
+
+    data = Wave(
+        lon=[1, 2, 3], lat=[4, 5, 6], time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    hs = np.random.rand(*data.size()) * 30
+    hs[0, 0] = np.nan
+    data.set_hs(hs)
+
+    stored = data.ds().hs
+    assert stored.dtype == np.int16
+    assert stored.values[0, 0] == np.iinfo(np.int16).min
+    assert stored.attrs["scale_factor"] == pytest.approx(30 / 65534)
+    assert stored.attrs["_FillValue"] == np.iinfo(np.int16).min
+
+    unpacked = data.hs()
+    assert unpacked.dtype == np.float32
+    assert np.isnan(unpacked[0, 0])
+    np.testing.assert_allclose(unpacked, hs, atol=30 / 65534, equal_nan=True)
+
+    # Outside valid range is missing
+    hs = np.full(data.size(), 40.0)
+    hs[0, 0] = 30.0
+    data.set_hs(hs)
+    assert "outside of the valid range" in capsys.readouterr().out
+    assert np.all(np.isnan(data.hs()[0, 1:]))
+    assert data.hs()[0, 0] == pytest.approx(30.0, rel=1e-5)
+
+    # Empty data is not packed
+    np.testing.assert_array_almost_equal(data.hs(empty=True), 0.0)
+
+    # Directions are packed using the range of the dir_type
+    data.set_dirp(np.full(data.size(), 90.0))
+    assert data.ds().dirp.dtype == np.int16
+    np.testing.assert_allclose(data.dirp(), 90.0, atol=360 / 65534)
+    np.testing.assert_allclose(data.dirp(dir_type="to"), 270.0, atol=360 / 65534)
+
+
+def test_add_datavar_packed_dask_is_lazy():
+    @add_datavar(gp.wave.Hs("hs"), dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Wave(PointSkeleton):
+        pass
+
+    data = Wave(
+        lon=[1, 2, 3], lat=[4, 5, 6], time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    data.dask.activate(rechunk=False)
+    data.set_hs(da.from_array(np.full(data.size(), 3.0)))
+    assert isinstance(data.ds().hs.data, da.Array)
+    assert isinstance(data.hs(), da.Array)
+    np.testing.assert_allclose(data.hs(dask=False), 3.0, atol=30 / 65534)
+
+
+def test_add_datavar_packed_netcdf(tmp_path):
+    @add_datavar(gp.wave.Hs("hs"), dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class Wave(PointSkeleton):
+        pass
+
+    data = Wave(
+        lon=[1, 2, 3], lat=[4, 5, 6], time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    hs = np.random.rand(*data.size()) * 30
+    hs[1, 1] = np.nan
+    data.set_hs(hs)
+    filename = str(tmp_path / "wave.nc")
+    data.ds().to_netcdf(filename)
+
+    ds = xr.open_dataset(filename)
+    np.testing.assert_allclose(ds.hs.values, data.hs(), atol=1e-6, equal_nan=True)
+
+    data2 = Wave.from_netcdf(filename)
+    np.testing.assert_array_equal(data2.ds().hs.values, data.ds().hs.values)
+
+
+def test_add_datavar_bad_dtype():
+    with pytest.raises(ValueError):
+        add_datavar("hs", dtype="int16")
+    with pytest.raises(ValueError):
+        add_datavar("hs", dtype="float32", valid_range=(0, 1))
+    with pytest.raises(ValueError):
+        add_magnitude("ff", x="u", y="v", dtype="int16")
@@ -3,6 +3,7 @@ from geo_skeletons.decorators import add_coord, add_time, add_datavar, add_mask
 from geo_skeletons.errors import StaticSkeletonError
 import pytest
 import numpy as np
+import dask.array as da
 import pandas as pd
 
 
@@ -148,3 +149,71 @@ def test_get_points():
     lon, lat = data.land_points()
     np.testing.assert_array_almost_equal(lon, lon_all[:3])
     np.testing.assert_array_almost_equal(lat, lat_all[:3])
+
+
+def test_mask_stored_as_bool():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    class Grid(GriddedSkeleton):
+        pass
+
+    grid = Grid(lon=(0, 4), lat=(10, 12))
+    grid.set_spacing(nx=5, ny=3)
+    assert grid.sea_mask(empty=True).dtype == bool
+    assert np.all(grid.sea_mask(empty=True))
+    assert not np.any(grid.land_mask(empty=True))
+
+    mask = np.full(grid.size(), False)
+    mask[1, 2] = True
+    grid.set_sea_mask(mask)
+    assert grid.ds().sea_mask.dtype == bool
+    assert grid.ds().get("land_mask") is None
+    # Input array is not shared with the Skeleton
+    mask[0, 0] = True
+    assert not grid.sea_mask()[0, 0]
+
+    # Getting the stored mask gives a view
+    sea = grid.sea_mask()
+    assert sea.dtype == bool
+    assert np.shares_memory(sea, grid.ds().sea_mask.values)
+    land = grid.land_mask()
+    assert land.dtype == bool
+    np.testing.assert_array_equal(land, np.logical_not(sea))
+
+    # Opposite mask stored as the primary mask
+    land = np.full(grid.size(), False)
+    land[0, :] = True
+    grid.set_land_mask(land)
+    assert grid.ds().sea_mask.dtype == bool
+    np.testing.assert_array_equal(grid.land_mask(), land)
+    np.testing.assert_array_equal(grid.sea_mask(), np.logical_not(land))
+
+
+def test_triggered_mask_stored_as_bool():
+    @add_mask(name="sea", default_value=1, opposite_name="land", triggered_by="topo")
+    @add_datavar(name="topo", default_value=0)
+    class Grid(GriddedSkeleton):
+        pass
+
+    grid = Grid(lon=(0, 4), lat=(10, 12))
+    grid.set_spacing(nx=5, ny=3)
+    topo = np.zeros(grid.size())
+    topo[2, :] = -10
+    grid.set_topo(topo)
+    assert grid.ds().sea_mask.dtype == bool
+    np.testing.assert_array_equal(grid.land_mask(), topo < 0)
+
+
+def test_mask_stored_as_bool_dask():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    class Grid(GriddedSkeleton):
+        pass
+
+    grid = Grid(lon=(0, 4), lat=(10, 12))
+    grid.set_spacing(nx=5, ny=3)
+    grid.dask.activate(rechunk=False)
+    grid.set_sea_mask(da.from_array(np.full(grid.size(), 1)))
+    assert isinstance(grid.ds().sea_mask.data, da.Array)
+    assert grid.ds().sea_mask.dtype == bool
+    land = grid.land_mask()
+    assert isinstance(land, da.Array)
+    assert not np.any(land.compute())
@@ -1,5 +1,6 @@
 from geo_skeletons import GriddedSkeleton, PointSkeleton
-from geo_skeletons.decorators import add_datavar, add_magnitude
+from geo_skeletons.decorators import add_datavar, add_magnitude, add_time
+import geo_parameters as gp
 import numpy as np
 
 
@@ -412,3 +413,28 @@ def test_turn_direction():
     np.testing.assert_almost_equal(points.wdir(), ud - 180)
     np.testing.assert_almost_equal(points.u(), -ux)
     np.testing.assert_almost_equal(points.v(), -uy)
+
+
+def test_magnitude_dtype():
+    @add_magnitude(
+        gp.wind.Wind("ff"),
+        x="u",
+        y="v",
+        direction=gp.wind.WindDir("dd"),
+        dtype="float32",
+    )
+    @add_datavar("v")
+    @add_datavar("u")
+    @add_time()
+    class Wind(PointSkeleton):
+        pass
+
+    data = Wind(
+        lon=[1, 2, 3], lat=[4, 5, 6], time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    data.set_ff(10.0)
+    data.set_dd(90.0)
+    assert data.ds().u.dtype == np.float32
+    assert data.ds().v.dtype == np.float32
+    np.testing.assert_array_almost_equal(data.ff(), 10.0, decimal=5)
+    np.testing.assert_array_almost_equal(data.dd(), 90.0, decimal=4)
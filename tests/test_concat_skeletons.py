@@ -0,0 +1,93 @@
+from geo_skeletons.point_skeleton import PointSkeleton
+from geo_skeletons.gridded_skeleton import GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_time
+from geo_skeletons.errors import SkeletonError, UnknownCoordinateError
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@add_datavar("hs", default_value=0.0)
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def hours():
+    hours = []
+    for hour in range(24):
+        data = WaveData(
+            lon=(5, 6), lat=(60, 61), time=[f"2020-01-01 {hour:02.0f}:00"]
+        )
+        data.set_hs(hour)
+        hours.append(data)
+    return hours
+
+
+def test_concat_time(hours):
+    data = WaveData.concat(hours, dim="time")
+    assert data.size() == (24, 2)
+    np.testing.assert_array_almost_equal(data.hs()[:, 0], np.arange(24))
+    np.testing.assert_array_almost_equal(data.lon(), [5, 6])
+
+
+def test_concat_time_unsorted(hours):
+    data = WaveData.concat([hours[2], hours[0], hours[1]], dim="time")
+    np.testing.assert_array_almost_equal(data.hs()[:, 0], [0, 1, 2])
+    assert data.time()[0] == pd.Timestamp("2020-01-01 00:00")
+
+
+def test_concat_inds():
+    points = [PointSkeleton(x=(n, n + 0.5), y=(0, 1)) for n in range(3)]
+    data = PointSkeleton.concat(points, dim="inds")
+    np.testing.assert_array_almost_equal(data.inds(), np.arange(6))
+    np.testing.assert_array_almost_equal(data.x(), [0, 0.5, 1, 1.5, 2, 2.5])
+    # Original skeletons are not modified
+    np.testing.assert_array_almost_equal(points[1].inds(), [0, 1])
+
+
+def test_concat_gridded():
+    grids = [GriddedSkeleton(lon=(n, n + 0.5), lat=(60, 61)) for n in range(3)]
+    grid = GriddedSkeleton.concat(grids, dim="lon")
+    np.testing.assert_array_almost_equal(grid.lon(), [0, 0.5, 1, 1.5, 2, 2.5])
+    assert grid.size() == (2, 6)
+
+
+def test_concat_incompatible(hours):
+    with pytest.raises(SkeletonError):
+        PointSkeleton.concat([PointSkeleton(x=0, y=0), hours[0]], dim="inds")
+    with pytest.raises(UnknownCoordinateError):
+        WaveData.concat(hours[:2], dim="z")
+    with pytest.raises(ValueError):
+        WaveData.concat([], dim="time")
+
+
+def test_concat_conflicting_static_variable_raises():
+    @add_datavar("topo", default_value=0.0, coord_group="spatial")
+    @add_datavar("hs", default_value=0.0)
+    @add_time()
+    class Topo(PointSkeleton):
+        pass
+
+    first = Topo(lon=(5, 6), lat=(60, 61), time=["2020-01-01 00:00"])
+    first.set_topo(5)
+    second = Topo(lon=(5, 6), lat=(60, 61), time=["2020-01-01 01:00"])
+    second.set_topo(7)
+    with pytest.raises(SkeletonError):
+        Topo.concat([first, second], dim="time")
+
+    second.set_topo(5)
+    data = Topo.concat([first, second], dim="time")
+    np.testing.assert_array_almost_equal(data.topo(), [5, 5])
+
+
+def test_concat_mismatched_grid_raises():
+    @add_time()
+    class TimeGrid(GriddedSkeleton):
+        pass
+
+    first = TimeGrid(lon=(0, 1, 2), lat=(60, 61), time=["2020-01-01 00:00"])
+    second = TimeGrid(lon=(1, 2, 3), lat=(60, 61), time=["2020-01-01 01:00"])
+    with pytest.raises(SkeletonError):
+        TimeGrid.concat([first, second], dim="time")
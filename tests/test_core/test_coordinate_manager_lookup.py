@@ -0,0 +1,46 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+from geo_skeletons.decorators import add_time, add_frequency, add_datavar
+from geo_skeletons.variables import DataVar, Coordinate
+
+
+@add_datavar("hs", coord_group="grid")
+@add_frequency()
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+def test_cached_queries_are_copies():
+    points = WaveData(lon=(1, 2), lat=(3, 4), time=("2020-01-01 00:00", "2020-01-01 01:00"), freq=[0.1])
+    coords = points.core.coords("all")
+    assert coords == ["time", "inds", "freq"]
+    coords.append("test")
+    assert points.core.coords("all") == ["time", "inds", "freq"]
+    assert points.core.coords() == ["time", "inds", "freq"]
+
+
+def test_dims():
+    points = WaveData(lon=(1, 2), lat=(3, 4), time=("2020-01-01 00:00", "2020-01-01 01:00"), freq=[0.1])
+    assert points.core.dims("hs") == ["time", "inds"]
+    assert points.core.dims("lon") == ["inds"]
+    assert points.core.coord_group("hs") == "grid"
+
+
+def test_cache_invalidated_when_structure_changes():
+    points = WaveData(lon=(1, 2), lat=(3, 4), time=("2020-01-01 00:00", "2020-01-01 01:00"), freq=[0.1])
+    assert points.core.data_vars() == ["hs"]
+    points.core.add_var(DataVar(name="tp", meta=None, coord_group="all", default_value=0))
+    assert points.core.data_vars() == ["hs", "tp"]
+    assert points.core.dims("tp") == ["time", "inds", "freq"]
+
+    points.core.add_coord(Coordinate(name="z", meta=None, coord_group="gridpoint"))
+    assert points.core.coords("gridpoint") == ["freq", "z"]
+    assert points.core.dims("tp") == ["time", "inds", "freq", "z"]
+
+
+def test_class_core_not_changed_by_instance():
+    grid = GriddedSkeleton(x=(0, 1), y=(2, 3))
+    assert grid.core.coords() == ["y", "x"]
+    lonlat_grid = GriddedSkeleton(lon=(0, 1), lat=(2, 3))
+    assert lonlat_grid.core.coords() == ["lat", "lon"]
+    assert grid.core.coords() == ["y", "x"]
@@ -162,3 +162,24 @@ def test_atleast_1d_data_array_da():
     assert dc.atleast_1d(data.squeeze()).shape == (1,)
     assert isinstance(dc.atleast_1d(data), xr.DataArray)
     assert data_is_dask(dc.atleast_1d(data).data)
+
+
+def test_writable_constant():
+    constant = np.broadcast_to(np.array(3.0), (2, 3))
+    data = dc.writable_constant(constant)
+    assert data.flags.writeable
+    np.testing.assert_array_almost_equal(data, 3.0)
+
+    # Broadcast along only some axes is not a constant
+    row = np.broadcast_to(np.array([1.0, 2.0, 3.0]), (2, 3))
+    data = dc.writable_constant(row)
+    assert data.flags.writeable
+    np.testing.assert_array_almost_equal(data, [[1, 2, 3], [1, 2, 3]])
+
+    column = np.broadcast_to(np.array([[1.0], [2.0]]), (2, 3))
+    np.testing.assert_array_almost_equal(
+        dc.writable_constant(column), [[1, 1, 1], [2, 2, 2]]
+    )
+
+    writable = np.zeros(3)
+    assert dc.writable_constant(writable) is writable
@@ -0,0 +1,92 @@
+from geo_skeletons import GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_mask, add_magnitude
+from geo_skeletons.dask_computations import ComputeCounter
+import dask.array as da
+import numpy as np
+import pytest
+
+
+@add_mask(
+    name="sea",
+    default_value=1,
+    opposite_name="land",
+    triggered_by="topo",
+    valid_range=(0, None),
+    range_inclusive=False,
+)
+@add_magnitude(name="wind", x="u", y="v", direction="wdir", dir_type="from")
+@add_datavar("v", default_value=0)
+@add_datavar("u", default_value=0)
+@add_datavar("topo", default_value=1)
+@add_datavar("peak_dir", default_value=0, dir_type="from")
+@add_datavar("hs", default_value=1)
+class Grid(GriddedSkeleton):
+    pass
+
+
+@pytest.fixture
+def grid():
+    grid = Grid(lon=range(10), lat=range(20))
+    grid.dask.activate(chunks=(5, 5))
+    return grid
+
+
+@pytest.fixture
+def lazy():
+    return da.ones((20, 10), chunks=5)
+
+
+def test_compute_counter():
+    with ComputeCounter() as counter:
+        da.ones(4, chunks=2).sum().compute()
+        np.asarray(da.ones(4, chunks=2))
+    assert counter.count == 2
+    assert "test_lazy_paths.py" in counter.calls[0]
+
+
+def test_set_stays_lazy(grid, lazy):
+    with grid.dask.count_computes() as counter:
+        grid.set_hs(lazy)
+        grid.set_hs()
+        grid.set_topo(lazy)
+        grid.set_peak_dir(lazy, dir_type="to")
+        grid.set_wind(lazy)
+        grid.set_wdir(lazy, dir_type="math")
+        grid.set_many({"hs": lazy, "topo": 2, "wind": 3})
+    assert counter.count == 0
+    assert isinstance(grid.ds().sea_mask.data, da.Array)
+    assert isinstance(grid.ds().u.data, da.Array)
+
+
+def test_get_stays_lazy(grid, lazy):
+    grid.set_topo(lazy)
+    grid.set_peak_dir(lazy)
+    grid.set_wind(lazy)
+    with ComputeCounter() as counter:
+        grid.hs()
+        grid.hs(empty=True)
+        grid.peak_dir(dir_type="math")
+        grid.wind()
+        grid.wdir(dir_type="to")
+        grid.sea_mask()
+        grid.land_mask()
+        grid.sel(lon=slice(0, 4))
+    assert counter.count == 0
+
+
+def test_rechunk_and_dechunk(grid, lazy):
+    grid.set_u(lazy)
+    grid.set_v(lazy)
+    grid.set_topo(lazy)
+    with ComputeCounter() as counter:
+        grid.dask.rechunk((10, 2))
+    assert counter.count == 0
+    assert grid.u(data_array=True).data.chunks == ((10, 10), (2, 2, 2, 2, 2))
+    assert grid.sea_mask(data_array=True).data.chunks == ((10, 10), (2, 2, 2, 2, 2))
+
+    with ComputeCounter() as counter:
+        grid.dask.deactivate(dechunk=True)
+    assert counter.count == 1
+    assert isinstance(grid.ds().u.data, np.ndarray)
+    assert isinstance(grid.ds().sea_mask.data, np.ndarray)
+    np.testing.assert_array_almost_equal(grid.u(), np.ones((20, 10)))
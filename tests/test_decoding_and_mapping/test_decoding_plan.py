@@ -0,0 +1,81 @@
+from geo_skeletons import PointSkeleton
+from geo_skeletons.decorators import add_datavar, add_time
+from geo_skeletons.decoders import DecodingPlan, clear_decoding_plans, get_cached_plan
+import geo_parameters as gp
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+
+@add_datavar(gp.wave.Tp("tp"))
+@add_datavar(gp.wave.Hs("hs"))
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def ds():
+    time = pd.date_range("2020-01-01 00:00", periods=1, freq="h")
+    return xr.Dataset(
+        {
+            "Hm0": (("time", "x"), np.full((1, 3), 0.0), {"standard_name": "sea_surface_wave_significant_height"}),
+            "fp": (("time", "x"), np.full((1, 3), 0.1), {"standard_name": "sea_surface_wave_frequency_at_variance_spectral_density_maximum"}),
+            "longitude": ("x", [5.0, 6.0, 7.0]),
+            "latitude": ("x", [60.0, 61.0, 62.0]),
+        },
+        coords={"time": time, "x": [0, 1, 2]},
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_decoding_plans()
+    yield
+    clear_decoding_plans()
+
+
+def test_plan_is_reused(ds, monkeypatch):
+    data = WaveData.from_ds(ds)
+    np.testing.assert_array_almost_equal(data.tp(), np.full(3, 10.0))
+
+    def no_decoding(*args, **kwargs):
+        raise AssertionError("Dataset was decoded again!")
+
+    monkeypatch.setattr(WaveData, "_decode_ds", no_decoding)
+    data = WaveData.from_ds(ds.assign(Hm0=ds.Hm0 + 1))
+    np.testing.assert_array_almost_equal(data.hs(), np.full(3, 1.0))
+    np.testing.assert_array_almost_equal(data.tp(), np.full(3, 10.0))
+    np.testing.assert_array_almost_equal(data.lon(), [5.0, 6.0, 7.0])
+
+
+def test_different_keywords_gives_new_plan(ds):
+    plan = WaveData.create_decoding_plan(ds)
+    plan_hs = WaveData.create_decoding_plan(ds, only_vars=["Hm0"])
+    assert plan.fingerprint != plan_hs.fingerprint
+    clear_decoding_plans()
+
+    WaveData.from_ds(ds)
+    data = WaveData.from_ds(ds, only_vars=["Hm0"])
+    assert data.tp(strict=True) is None
+    assert get_cached_plan(plan.fingerprint) is not None
+    assert get_cached_plan(plan_hs.fingerprint) is not None
+
+
+def test_pickled_plan(ds, tmp_path):
+    plan = WaveData.create_decoding_plan(ds)
+    filename = str(tmp_path / "plan.pkl")
+    plan.save(filename)
+    clear_decoding_plans()
+
+    plan = DecodingPlan.load(filename)
+    data = WaveData.from_ds(ds.assign(Hm0=ds.Hm0 + 3), plan=plan)
+    np.testing.assert_array_almost_equal(data.hs(), np.full(3, 3.0))
+    np.testing.assert_array_almost_equal(data.tp(), np.full(3, 10.0))
+
+
+def test_plan_not_matching_raises(ds):
+    plan = WaveData.create_decoding_plan(ds)
+    with pytest.raises(ValueError):
+        WaveData.from_ds(ds.rename({"Hm0": "swh"}), plan=plan)
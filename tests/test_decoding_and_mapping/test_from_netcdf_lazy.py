@@ -0,0 +1,66 @@
+from geo_skeletons.gridded_skeleton import GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_time
+import dask.array as da
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+
+@add_datavar("hs", default_value=1.0)
+@add_datavar("tp", default_value=10.0)
+@add_time()
+class WaveGrid(GriddedSkeleton):
+    pass
+
+
+@pytest.fixture
+def files(tmp_path):
+    filenames = []
+    for month in (1, 2):
+        time = pd.date_range(f"2020-{month:02.0f}-01", periods=4, freq="h")
+        shape = (len(time), 3, 2)
+        ds = xr.Dataset(
+            {
+                "hs": (("time", "lat", "lon"), np.full(shape, float(month))),
+                "tp": (("time", "lat", "lon"), np.full(shape, 10.0 * month)),
+            },
+            coords={"time": time, "lat": [60.0, 61.0, 62.0], "lon": [5.0, 6.0]},
+        )
+        filename = str(tmp_path / f"hindcast_2020{month:02.0f}.nc")
+        ds.to_netcdf(filename)
+        filenames.append(filename)
+    return filenames
+
+
+def test_from_netcdf_not_lazy(files):
+    data = WaveGrid.from_netcdf(files[0])
+    assert not data.dask.is_active()
+    assert isinstance(data.hs(), np.ndarray)
+
+
+def test_from_netcdf_lazy(files):
+    data = WaveGrid.from_netcdf(files[0], lazy=True)
+    assert data.dask.is_active()
+    assert isinstance(data.hs(), da.Array)
+    hs = data.hs(dask=False)
+    assert isinstance(hs, np.ndarray)
+    np.testing.assert_array_almost_equal(hs, np.ones((4, 3, 2)))
+
+
+def test_from_netcdf_lazy_only_vars(files):
+    data = WaveGrid.from_netcdf(files[0], chunks={"time": 2}, only_vars=["hs"])
+    assert data.hs().chunks[0] == (2, 2)
+    assert data.tp(strict=True) is None
+
+
+def test_from_netcdf_multiple_files(files, tmp_path):
+    data = WaveGrid.from_netcdf(str(tmp_path / "hindcast_2020*.nc"))
+    assert data.dask.is_active()
+    assert len(data.time()) == 8
+    hs = data.hs(dask=False)
+    np.testing.assert_array_almost_equal(hs[:4], np.ones((4, 3, 2)))
+    np.testing.assert_array_almost_equal(hs[4:], np.full((4, 3, 2), 2.0))
+
+    data2 = WaveGrid.from_netcdf(files)
+    np.testing.assert_array_almost_equal(data2.tp(dask=False), data.tp(dask=False))
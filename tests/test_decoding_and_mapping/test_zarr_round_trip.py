@@ -0,0 +1,155 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_time, add_magnitude, add_mask
+from geo_skeletons.errors import UnknownCoordinateError, UnknownVariableError
+import geo_parameters as gp
+import dask.array as da
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("zarr")
+
+
+@add_magnitude(gp.wind.Wind("ff"), x="u", y="v", direction=gp.wind.WindDir("dd"))
+@add_datavar(gp.wind.YWind("v"))
+@add_datavar(gp.wind.XWind("u"))
+@add_time()
+class WindData(PointSkeleton):
+    pass
+
+
+@add_mask(name="sea", default_value=1, opposite_name="land")
+@add_datavar("hs")
+class WaveGrid(GriddedSkeleton):
+    pass
+
+
+@pytest.fixture
+def wind():
+    data = WindData(
+        lon=(5, 6, 7),
+        lat=(60, 61, 62),
+        time=pd.date_range("2020-01-01 00:00", periods=6, freq="h"),
+    )
+    data.set_u(np.arange(18).reshape(6, 3))
+    data.set_v(2.0)
+    return data
+
+
+def test_round_trip(tmp_path, wind):
+    store = str(tmp_path / "wind.zarr")
+    data = wind.isel(time=slice(0, 4))
+    data.to_zarr(store)
+
+    data2 = WindData.from_zarr(store)
+    assert data2.dask.is_active()
+    assert isinstance(data2.u(), da.Array)
+    np.testing.assert_array_almost_equal(data2.u(dask=False), data.u())
+    np.testing.assert_array_almost_equal(data2.ff(dask=False), data.ff())
+    np.testing.assert_array_almost_equal(data2.lon(), data.lon())
+    assert data2.utm.zone() == data.utm.zone()
+    assert data2.meta.get("u") == data.meta.get("u")
+
+
+def test_round_trip_gridded_with_mask(tmp_path):
+    store = str(tmp_path / "grid.zarr")
+    grid = WaveGrid(x=(0, 100), y=(0, 200))
+    grid.set_spacing(nx=3, ny=4)
+    grid.utm.set((33, "W"), silent=True)
+    grid.set_hs(1.5)
+    sea = np.full(grid.size(), True)
+    sea[0, 0] = False
+    grid.set_sea_mask(sea)
+    grid.to_zarr(store)
+
+    grid2 = WaveGrid.from_zarr(store, lazy=False)
+    assert not grid2.dask.is_active()
+    np.testing.assert_array_almost_equal(grid2.x(), grid.x())
+    np.testing.assert_array_almost_equal(grid2.hs(), grid.hs())
+    np.testing.assert_array_equal(grid2.sea_mask(), sea)
+    np.testing.assert_array_equal(grid2.land_mask(), np.logical_not(sea))
+    assert grid2.utm.zone() == (33, "W")
+
+
+def test_append_along_time(tmp_path, wind):
+    store = str(tmp_path / "wind.zarr")
+    wind.isel(time=slice(0, 4)).to_zarr(store)
+    wind.isel(time=slice(4, 6)).to_zarr(store, append=True)
+
+    data = WindData.from_zarr(store)
+    assert len(data.time()) == 6
+    assert data.time()[-1] == pd.Timestamp("2020-01-01 05:00")
+    np.testing.assert_array_almost_equal(data.u(dask=False), wind.u())
+
+
+def test_append_creates_missing_store(tmp_path, wind):
+    store = str(tmp_path / "wind.zarr")
+    wind.isel(time=slice(0, 2)).to_zarr(store, append=True)
+    wind.isel(time=slice(2, 4)).to_zarr(store, append=True)
+
+    data = WindData.from_zarr(store)
+    assert len(data.time()) == 4
+
+
+def test_from_zarr_is_silent(tmp_path, capsys, wind):
+    store = str(tmp_path / "wind.zarr")
+    wind.to_zarr(store)
+    capsys.readouterr()
+
+    data = WindData.from_zarr(store)
+    assert capsys.readouterr().out == ""
+    assert data.utm.zone() == wind.utm.zone()
+
+
+def test_append_without_time_raises(tmp_path):
+    grid = WaveGrid(x=(0, 100), y=(0, 200))
+    with pytest.raises(UnknownCoordinateError):
+        grid.to_zarr(str(tmp_path / "grid.zarr"), append=True)
+
+
+def test_wrong_class_raises(tmp_path, wind):
+    store = str(tmp_path / "wind.zarr")
+    wind.to_zarr(store)
+    with pytest.raises(UnknownCoordinateError):
+        PointSkeleton.from_zarr(store)
+
+
+def test_round_trip_spatial_datavar(tmp_path):
+    @add_datavar("topo", default_value=-1.0, coord_group="spatial")
+    @add_datavar("tp", default_value=5.0)
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    store = str(tmp_path / "obs.zarr")
+    data = Obs(lon=(1, 2, 3), lat=(4, 5, 6), time=["2020-01-01 00:00"])
+    data.set_topo([10.0, 20.0, 30.0])
+    data.to_zarr(store)
+
+    read = Obs.from_zarr(store, lazy=False)
+    np.testing.assert_array_almost_equal(read.topo(), [10.0, 20.0, 30.0])
+    np.testing.assert_array_almost_equal(read.lon(), [1, 2, 3])
+
+
+def test_unknown_variables_reported(tmp_path, capsys):
+    @add_datavar("tp")
+    @add_time()
+    class Obs(PointSkeleton):
+        pass
+
+    @add_time()
+    class Positions(PointSkeleton):
+        pass
+
+    store = str(tmp_path / "obs.zarr")
+    data = Obs(lon=(1, 2, 3), lat=(4, 5, 6), time=["2020-01-01 00:00"])
+    data.set_tp(7.0)
+    data.to_zarr(store)
+
+    capsys.readouterr()
+    read = Positions.from_zarr(store, lazy=False)
+    assert "Zarr-store has variables ['tp']" in capsys.readouterr().out
+    assert "tp" not in read.ds()
+
+    with pytest.raises(UnknownVariableError):
+        Positions.from_zarr(store, strict=True)
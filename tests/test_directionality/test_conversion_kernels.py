@@ -0,0 +1,73 @@
+from geo_skeletons import dir_conversions
+import dask.array as da
+import numpy as np
+import pytest
+
+
+def _reference_math_dir(data, dir_type):
+    offset = {"from": 180, "to": 0}[dir_type]
+    math_dir = np.mod((90 - data + offset) * np.pi / 180, 2 * np.pi)
+    return np.where(math_dir <= np.pi, math_dir, math_dir - 2 * np.pi)
+
+
+@pytest.mark.parametrize("dir_type", ["from", "to"])
+def test_convert_to_math_dir(dir_type):
+    dirs = np.arange(-720, 720, 7.5)
+    math_dir = dir_conversions.convert_to_math_dir(dirs, dir_type)
+    np.testing.assert_array_almost_equal(
+        math_dir, _reference_math_dir(dirs, dir_type)
+    )
+    assert np.all(math_dir <= np.pi)
+    assert np.all(math_dir > -np.pi)
+
+    np.testing.assert_array_almost_equal(
+        dir_conversions.convert_from_math_dir(math_dir, dir_type), np.mod(dirs, 360)
+    )
+
+
+def test_input_not_modified():
+    dirs = np.array([0.0, 90.0, 400.0])
+    original = dirs.copy()
+    for in_type in ["from", "to", "math"]:
+        for out_type in ["from", "to", "math"]:
+            dir_conversions.convert(dirs, in_type, out_type)
+    np.testing.assert_array_equal(dirs, original)
+
+    mag = np.array([1.0, 2.0, 3.0])
+    dir_conversions.compute_components(mag, dirs, "math")
+    np.testing.assert_array_equal(dirs, original)
+    np.testing.assert_array_equal(mag, [1.0, 2.0, 3.0])
+
+
+def test_convert_integers():
+    converted = dir_conversions.convert(np.array([0, 90, 270]), "from", "to")
+    assert converted.dtype == float
+    np.testing.assert_array_almost_equal(converted, [180, 270, 90])
+
+
+def test_components_round_trip():
+    mag = np.array([1.0, 2.0, 3.0, 4.0])
+    dirs = np.array([0.0, 90.0, 180.0, 315.0])
+    u, v = dir_conversions.compute_components(mag, dirs, "from")
+    np.testing.assert_array_almost_equal(u, [0, -2, 0, 4 / 2**0.5])
+    np.testing.assert_array_almost_equal(v, [-1, 0, 3, -4 / 2**0.5])
+
+    new_mag, new_dirs = dir_conversions.compute_polar(u, v, "from")
+    np.testing.assert_array_almost_equal(new_mag, mag)
+    np.testing.assert_array_almost_equal(new_dirs, dirs)
+
+
+def test_dask_stays_lazy():
+    dirs = da.from_array(np.arange(0, 360, 10.0), chunks=6)
+    mag = da.ones(36, chunks=6)
+    math_dir = dir_conversions.convert_to_math_dir(dirs, "from")
+    assert isinstance(math_dir, da.Array)
+    u, v = dir_conversions.compute_components(mag, dirs, "from")
+    assert isinstance(u, da.Array)
+    assert isinstance(v, da.Array)
+
+    u_np, v_np = dir_conversions.compute_components(
+        mag.compute(), dirs.compute(), "from"
+    )
+    np.testing.assert_array_almost_equal(u.compute(), u_np)
+    np.testing.assert_array_almost_equal(v.compute(), v_np)
@@ -1,4 +1,7 @@
 from geo_skeletons.point_skeleton import PointSkeleton
+from geo_skeletons.gridded_skeleton import GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_mask, add_time
+import dask.array as da
 import numpy as np
 
 
@@ -9,3 +12,83 @@ def test_init_trivial():
 
     np.testing.assert_array_almost_equal(grid.ds().lat.values, np.array([0, 3]))
     np.testing.assert_array_almost_equal(grid.ds().lon.values, np.array([1, 2]))
+
+
+def test_empty_data_is_zero_stride():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("tp", default_value=10.0, dtype="float32")
+    @add_datavar("hs", default_value=0.0)
+    @add_time()
+    class WaveGrid(GriddedSkeleton):
+        pass
+
+    grid = WaveGrid(
+        lon=(0, 9), lat=(50, 59), time=("2020-01-01 00:00", "2020-01-01 02:00")
+    )
+    grid.set_spacing(nx=10, ny=10)
+
+    hs = grid.get("hs", empty=True, data_array=True)
+    assert hs.data.strides == (0, 0, 0)
+    assert hs.data.base is not None
+    assert grid.tp(empty=True, data_array=True).dtype == np.float32
+
+    grid.set_hs()
+    grid.set_tp()
+    grid.set_sea_mask()
+    for name in ["hs", "tp"]:
+        assert grid.ds()[name].data.strides == (0, 0, 0)
+        assert grid.ds()[name].data.base is not None
+    assert grid.ds().sea_mask.data.strides == (0, 0, 0)
+    assert grid.ds().tp.dtype == np.float32
+    assert grid.ds().sea_mask.dtype == bool
+    assert grid._ds_manager.empty_vars() == []
+
+    # Slicing keeps the data zero-stride
+    hs = grid.isel(time=slice(0, 2)).hs(data_array=True)
+    assert hs.shape == (2, 10, 10)
+    assert hs.data.strides == (0, 0, 0)
+
+
+def test_empty_data_is_writable_when_given_out():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar("tp", default_value=10.0, dtype="float32")
+    @add_time()
+    class WaveGrid(GriddedSkeleton):
+        pass
+
+    grid = WaveGrid(
+        lon=(0, 2), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 02:00")
+    )
+    grid.set_spacing(nx=3, ny=3)
+    grid.set_tp()
+
+    tp = grid.tp()
+    assert tp.flags.writeable
+    np.testing.assert_array_almost_equal(tp, 10.0)
+    tp[0, 0, 0] = 0.0
+    # Stored placeholder not changed
+    np.testing.assert_array_almost_equal(grid.tp(), 10.0)
+    grid.set_tp(tp)
+    assert grid.tp()[0, 0, 0] == 0.0
+    assert grid.tp()[0, 0, 1] == 10.0
+
+    sea = grid.sea_mask(empty=True)
+    assert sea.flags.writeable
+    sea[0, 0] = False
+    assert np.all(grid.sea_mask(empty=True))
+
+
+def test_empty_data_dask():
+    @add_datavar("hs", default_value=0.0)
+    @add_time()
+    class WaveGrid(GriddedSkeleton):
+        pass
+
+    grid = WaveGrid(
+        lon=(0, 2), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 02:00")
+    )
+    grid.set_spacing(nx=3, ny=3)
+    grid.dask.activate(rechunk=False)
+    grid.set_hs()
+    assert isinstance(grid.ds().hs.data, da.Array)
+    np.testing.assert_array_almost_equal(grid.hs(dask=False), 0.0)
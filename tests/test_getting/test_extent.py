@@ -1,5 +1,6 @@
 from geo_skeletons import GriddedSkeleton, PointSkeleton
 import numpy as np
+import pytest
 from geo_skeletons.distance_funcs import distance_2points
 
 
@@ -25,3 +26,37 @@ def test_gridded_spherical():
     points = GriddedSkeleton(lon=(0, 6), lat=(-10, 10))
     np.testing.assert_almost_equal(distance_2points(0, 0, 0, 6), points.extent("x"))
     np.testing.assert_almost_equal(distance_2points(-10, 3, 10, 3), points.extent("y"))
+
+
+def test_distance_2points_vectorized():
+    lat2 = np.array([0, 10, 60, 85])
+    dist = distance_2points(0, 0, lat2, np.zeros(4))
+    assert dist.shape == (4,)
+    for n, lat in enumerate(lat2):
+        np.testing.assert_almost_equal(dist[n], distance_2points(0, 0, lat, 0))
+    # One degree of latitude at the equator on WGS84
+    np.testing.assert_almost_equal(distance_2points(0, 0, 1, 0), 110574.389, decimal=2)
+
+
+def test_distance_2points_haversine():
+    vincenty = distance_2points(60, 5, 61, 6)
+    haversine = distance_2points(60, 5, 61, 6, method="haversine")
+    assert abs(vincenty - haversine) / vincenty < 0.005
+
+
+def test_distance_2points_antipodal():
+    # Reference values from GeographicLib (Karney 2013)
+    dist = distance_2points(
+        np.array([0.0, 0.0, 60.0]),
+        0.0,
+        np.array([0.5, 0.0, 61.0]),
+        [179.7, 180.0, 1.0],
+    )
+    np.testing.assert_allclose(dist[:2], [19944127.4208, 20003931.4586], atol=1e-3)
+    assert dist[2] == pytest.approx(distance_2points(60.0, 0.0, 61.0, 1.0))
+    assert distance_2points(0.0, 0.0, 0.5, 179.7) == pytest.approx(19944127.4208)
+
+
+def test_distance_2points_tolerance():
+    dist = distance_2points(0.0, 0.0, 0.5, 179.7, tolerance=1e-6, max_iter=50)
+    assert dist == pytest.approx(19944127.4208, abs=1)
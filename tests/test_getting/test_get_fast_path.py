@@ -0,0 +1,67 @@
+from geo_skeletons import GriddedSkeleton, PointSkeleton
+from geo_skeletons.decorators import add_datavar, add_mask, add_frequency, add_time
+from geo_skeletons.variables import DataVar
+import dask.array as da
+import numpy as np
+import pytest
+
+
+@add_mask(name="sea", default_value=1, opposite_name="land")
+@add_datavar("wdir", default_value=0, dir_type="from")
+@add_datavar("hs", default_value=1)
+@add_frequency()
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def data():
+    data = WaveData(
+        lon=(1, 2, 3), lat=(4, 5, 6), time=("2020-01-01 00:00", "2020-01-01 03:00"), freq=[0.1]
+    )
+    data.set_hs(np.arange(12).reshape(4, 3, 1))
+    data.set_wdir(90)
+    data.set_sea_mask(np.array([[1, 0, 1]] * 4).reshape(4, 3))
+    return data
+
+
+def test_get_fast_path_returns_view(data):
+    hs = data.hs()
+    assert hs.shape == (4, 3)
+    assert np.shares_memory(hs, data.ds().hs.values)
+    np.testing.assert_array_equal(hs, data.hs(data_array=True).values)
+    assert data.hs(squeeze=False).shape == (4, 3, 1)
+
+
+def test_get_fast_path_same_as_slow_path(data):
+    for name in ["hs", "wdir", "sea_mask", "land_mask", "freq", "inds"]:
+        fast = data.get(name)
+        slow = data.get(name, data_array=True).values
+        np.testing.assert_array_equal(fast, slow)
+        assert fast.dtype == slow.dtype
+
+    np.testing.assert_array_equal(data.land_mask(), np.logical_not(data.sea_mask()))
+    np.testing.assert_array_almost_equal(data.wdir(dir_type="to"), np.full((4, 3), 270))
+    np.testing.assert_array_almost_equal(data.wdir(dir_type="from"), np.full((4, 3), 90))
+
+
+def test_get_fast_path_respects_dask(data):
+    assert isinstance(data.hs(dask=True), da.Array)
+    data.dask.activate()
+    assert isinstance(data.hs(), da.Array)
+    assert isinstance(data.freq(), np.ndarray)
+
+
+def test_accessor_plan(data):
+    plan = data.core.accessor_plan("land_mask")
+    assert plan.kind == "mask"
+    assert plan.stored_name == "sea_mask"
+    assert plan.inverted
+    assert data.core.accessor_plan("wdir").dir_type == "from"
+    assert data.core.accessor_plan("sea_points").kind == "mask_point"
+    assert data.core.accessor_plan("not_a_variable") is None
+
+    assert data.core.accessor_plan("tp") is None
+    data.core.add_var(DataVar(name="tp", meta=None, coord_group="all", default_value=0))
+    assert data.core.accessor_plan("tp").kind == "data"
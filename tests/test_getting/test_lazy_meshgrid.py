@@ -0,0 +1,74 @@
+from geo_skeletons import GriddedSkeleton
+from geo_skeletons.lazy_meshgrid import LazyMeshgrid
+import numpy as np
+import pytest
+
+
+def test_lazy_meshgrid_matches_numpy():
+    x, y = np.array([1.0, 2.0, 3.0]), np.array([10.0, 20.0])
+    mesh = LazyMeshgrid(x, y)
+    xx, yy = np.meshgrid(x, y)
+
+    assert mesh.shape == (2, 3)
+    np.testing.assert_array_equal(mesh.xgrid(), xx)
+    np.testing.assert_array_equal(mesh.ygrid(), yy)
+    rx, ry = mesh.ravel()
+    np.testing.assert_array_equal(rx, xx.ravel())
+    np.testing.assert_array_equal(ry, yy.ravel())
+
+    mask = np.array([[True, False, True], [False, True, False]])
+    mx, my = mesh.masked(mask)
+    np.testing.assert_array_equal(mx, xx[mask])
+    np.testing.assert_array_equal(my, yy[mask])
+    mx, my = mesh.masked(mask.ravel())
+    np.testing.assert_array_equal(mx, xx[mask])
+
+
+def test_lazy_meshgrid_views_are_not_materialized():
+    mesh = LazyMeshgrid(np.arange(1000.0), np.arange(500.0))
+    xgrid = mesh.xgrid()
+    assert xgrid.shape == (500, 1000)
+    assert xgrid.strides[0] == 0
+    assert not xgrid.flags.writeable
+
+
+def test_lazy_meshgrid_bad_mask():
+    mesh = LazyMeshgrid(np.arange(3.0), np.arange(2.0))
+    with pytest.raises(ValueError):
+        mesh.masked(np.full(5, True))
+
+
+def test_gridded_xy_with_mask():
+    grid = GriddedSkeleton(x=(0, 3), y=(10, 12))
+    grid.set_spacing(nx=4, ny=3)
+    xx, yy = np.meshgrid(grid.x(), grid.y())
+    mask = np.full(grid.size(), False)
+    mask[1, 2] = True
+    mask[2, 0] = True
+
+    x, y = grid.xy(mask=mask)
+    np.testing.assert_array_equal(x, xx[mask])
+    np.testing.assert_array_equal(y, yy[mask])
+
+    np.testing.assert_array_equal(grid.xgrid(), xx)
+    np.testing.assert_array_equal(grid.ygrid(), yy)
+    np.testing.assert_array_equal(grid.longrid(native=True), xx)
+    np.testing.assert_array_equal(grid.latgrid(native=True), yy)
+
+    x, __ = grid.xy()
+    x[0] = -1
+    assert grid.xy()[0][0] == 0
+
+
+def test_gridded_meshgrids_are_writable():
+    grid = GriddedSkeleton(lon=(0, 3), lat=(10, 12))
+    grid.set_spacing(nx=4, ny=3)
+    lon = grid.longrid()
+    mask = np.full(grid.size(), False)
+    mask[1, 2] = True
+    lon[mask] = -1.0
+    assert lon[1, 2] == -1.0
+    assert grid.longrid()[1, 2] == 2.0
+
+    for meshgrid in [grid.latgrid(), grid.xgrid(native=True), grid.ygrid(native=True)]:
+        assert meshgrid.flags.writeable
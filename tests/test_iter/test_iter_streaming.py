@@ -0,0 +1,66 @@
+from geo_skeletons import PointSkeleton
+from geo_skeletons.decorators import add_time
+import pandas as pd
+import pytest
+
+
+@add_time()
+class TimePoints(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def points():
+    return TimePoints(
+        x=(0, 1, 2), y=(5, 6, 7), time=pd.date_range("2020-01-01", periods=4, freq="h")
+    )
+
+
+def test_slices_created_on_demand(points, monkeypatch):
+    calls = []
+    isel = points.isel
+
+    def counting_isel(**kwargs):
+        calls.append(kwargs)
+        return isel(**kwargs)
+
+    monkeypatch.setattr(points, "isel", counting_isel)
+    iterator = iter(points)
+    assert len(iterator) == 12
+    assert calls == []
+
+    first = next(iterator)
+    assert len(calls) == 1
+    assert first.time()[0] == pd.Timestamp("2020-01-01 00:00")
+    assert first.x()[0] == 0
+
+
+def test_iteration_order(points):
+    order = [(p.time()[0], p.x()[0]) for p in points.iterate(["time", "inds"])]
+    assert order[1] == (pd.Timestamp("2020-01-01 01:00"), 0)
+    assert order[4] == (pd.Timestamp("2020-01-01 00:00"), 1)
+    assert len(order) == 12
+
+
+def test_offset(points):
+    iterator = points.iterate(["time", "inds"], offset=10)
+    assert len(iterator) == 2
+    slices = list(iterator)
+    assert slices[0].time()[0] == pd.Timestamp("2020-01-01 02:00")
+    assert slices[0].x()[0] == 2
+
+
+def test_batch_size(points):
+    iterator = points.iterate(["inds"], batch_size=2)
+    assert len(iterator) == 2
+    batches = list(iterator)
+    assert [len(b) for b in batches] == [2, 1]
+    assert batches[1][0].x()[0] == 2
+
+    with pytest.raises(ValueError):
+        points.iterate(["inds"], batch_size=0)
+
+
+def test_unknown_coord(points):
+    with pytest.raises(KeyError):
+        points.iterate(["z"])
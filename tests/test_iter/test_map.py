@@ -0,0 +1,68 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_time
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@add_datavar("hs_max", default_value=0.0)
+@add_datavar("hs", default_value=0.0)
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+@add_datavar("hs", default_value=0.0)
+@add_time(grid_coord=False)
+class WaveGrid(GriddedSkeleton):
+    pass
+
+
+def double_hs(wave_slice):
+    wave_slice.set_hs(wave_slice.hs(squeeze=False) * 2)
+    return wave_slice
+
+
+def max_hs(wave_slice):
+    wave_slice.set_hs_max(np.max(wave_slice.hs()))
+    return wave_slice
+
+
+@pytest.fixture
+def data():
+    data = WaveData(
+        lon=(5, 6, 7), lat=(60, 61, 62), time=pd.date_range("2020-01-01", periods=4, freq="h")
+    )
+    data.set_hs(np.arange(12).reshape(4, 3))
+    return data
+
+
+@pytest.mark.parametrize("backend", ["thread", "process", "dask"])
+def test_map_over_time_and_inds(data, backend):
+    new_data = data.map(double_hs, coords=["time", "inds"], workers=2, backend=backend)
+    assert isinstance(new_data, WaveData)
+    np.testing.assert_array_almost_equal(new_data.hs(), data.hs() * 2)
+    np.testing.assert_array_almost_equal(new_data.inds(), [0, 1, 2])
+    np.testing.assert_array_almost_equal(new_data.lon(), data.lon())
+    assert new_data.time()[-1] == data.time()[-1]
+
+
+def test_map_over_one_coord(data):
+    new_data = data.map(max_hs, coords=["inds"])
+    np.testing.assert_array_almost_equal(new_data.hs_max(), np.tile([9, 10, 11], (4, 1)))
+    np.testing.assert_array_almost_equal(new_data.hs(), data.hs())
+
+
+def test_map_gridded():
+    grid = WaveGrid(lon=(5, 6), lat=(60, 61, 62), time=pd.date_range("2020-01-01", periods=2, freq="h"))
+    grid.set_hs(np.arange(12).reshape(grid.size()))
+    new_grid = grid.map(double_hs)
+    np.testing.assert_array_almost_equal(new_grid.hs(), grid.hs() * 2)
+    np.testing.assert_array_almost_equal(new_grid.lat(), grid.lat())
+
+
+def test_map_bad_input(data):
+    with pytest.raises(ValueError):
+        data.map(double_hs, backend="mpi")
+    with pytest.raises(TypeError):
+        data.map(lambda x: None)
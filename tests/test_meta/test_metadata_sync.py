@@ -0,0 +1,59 @@
+from geo_skeletons import PointSkeleton
+from geo_skeletons.decorators import add_datavar
+from copy import deepcopy
+import json
+import pickle
+import geo_parameters as gp
+
+
+@add_datavar(gp.wave.Tp("tp"))
+@add_datavar(gp.wave.Hs("hs"))
+class WaveData(PointSkeleton):
+    pass
+
+
+def test_get_returns_independent_dict():
+    data = WaveData(lon=(1, 2), lat=(3, 4))
+    meta = data.meta.get("hs")
+    assert meta.get("standard_name") == gp.wave.Hs.standard_name()
+    meta["units"] = "cm"
+    assert data.meta.get("hs").get("units") == "m"
+
+    # The metadata can be copied, pickled and written as json
+    assert deepcopy(data.meta.meta_dict()) == data.meta.meta_dict()
+    assert pickle.loads(pickle.dumps(data.meta.get("hs"))) == data.meta.get("hs")
+    assert json.loads(json.dumps(data.meta.meta_dict())) == data.meta.meta_dict()
+
+    # Given out metadata is not affected by later changes
+    meta = data.meta.get("hs")
+    data.meta.append({"units": "cm"}, name="hs")
+    assert meta.get("units") == "m"
+    assert data.meta.get("hs").get("units") == "cm"
+
+
+def test_metadata_synced_when_ds_accessed():
+    data = WaveData(lon=(1, 2), lat=(3, 4))
+    data.set_hs(1)
+    version = data.meta.version
+    data.meta.append({"units": "cm"}, name="hs")
+    data.meta.append({"institution": "test"})
+    assert data.meta.version == version + 2
+
+    assert data.ds().hs.attrs.get("units") == "cm"
+    assert data.ds().attrs.get("institution") == "test"
+    assert data.meta.get("lon") == data.ds().lon.attrs
+
+
+def test_metadata_of_copies_independent():
+    data = WaveData(lon=(1, 2), lat=(3, 4))
+    data.set_hs(1)
+    data2 = deepcopy(data)
+    data2.meta.append({"units": "cm"}, name="hs")
+    assert data.meta.get("hs").get("units") == "m"
+    assert data.ds().hs.attrs.get("units") == "m"
+    assert data2.ds().hs.attrs.get("units") == "cm"
+
+    data3 = data.sel(inds=0)
+    data3.meta.append({"units": "km"}, name="hs")
+    assert data.ds().hs.attrs.get("units") == "m"
+    assert data3.ds().hs.attrs.get("units") == "km"
@@ -0,0 +1,70 @@
+from geo_skeletons.classes import WindGrid
+from geo_skeletons import GriddedSkeleton
+from geo_skeletons.managers.resample.sparse_regridders import RegridWeights
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def wind_grid():
+    data = WindGrid.add_time()(
+        lon=(10, 20), lat=(50, 60), time=("2020-01-01 00:00", "2020-01-01 12:00")
+    )
+    data.set_spacing(nx=11, ny=21)
+    np.random.seed(5)
+    data.set_u(np.random.rand(*data.size()))
+    data.set_v(np.random.rand(*data.size()))
+    return data
+
+
+@pytest.fixture
+def new_grid():
+    new_grid = GriddedSkeleton(lon=(10.1, 20.1), lat=(50.1, 60.1))
+    new_grid.set_spacing(nx=13, ny=17)
+    return new_grid
+
+
+def test_save_load(tmp_path, wind_grid, new_grid):
+    weights = RegridWeights.from_skeletons(wind_grid, new_grid, method="linear")
+    filename = str(tmp_path / "weights.npz")
+    weights.save(filename)
+    loaded = RegridWeights.load(filename)
+
+    assert loaded.method == "linear"
+    assert loaded.target_shape == weights.target_shape
+    assert loaded.fingerprint == weights.fingerprint
+    np.testing.assert_array_equal(loaded.outside, weights.outside)
+    np.testing.assert_array_equal(loaded.matrix.toarray(), weights.matrix.toarray())
+
+
+def test_cache_dir_reuses_weights(tmp_path, monkeypatch, wind_grid, new_grid):
+    new_data = wind_grid.resample.grid(
+        new_grid, engine="sparse", method="linear", cache_dir=str(tmp_path)
+    )
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    def no_computing(*args, **kwargs):
+        raise AssertionError("Weights should have been read from the cache!")
+
+    monkeypatch.setattr(RegridWeights, "from_points", no_computing)
+    new_data_cached = wind_grid.resample.grid(
+        new_grid, engine="sparse", method="linear", cache_dir=str(tmp_path)
+    )
+    np.testing.assert_array_equal(new_data.u(), new_data_cached.u())
+
+    # Different method or target grid needs new weights
+    with pytest.raises(AssertionError):
+        wind_grid.resample.grid(
+            new_grid, engine="sparse", method="nearest", cache_dir=str(tmp_path)
+        )
+    new_grid.set_spacing(nx=14, ny=17)
+    with pytest.raises(AssertionError):
+        wind_grid.resample.grid(
+            new_grid, engine="sparse", method="linear", cache_dir=str(tmp_path)
+        )
+
+
+def test_cache_dir_created(tmp_path, wind_grid, new_grid):
+    cache_dir = tmp_path / "weights" / "model_to_product"
+    wind_grid.resample.grid(new_grid, engine="sparse", cache_dir=str(cache_dir))
+    assert len(list(cache_dir.glob("regrid_weights_*.npz"))) == 1
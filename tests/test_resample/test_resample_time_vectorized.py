@@ -0,0 +1,104 @@
+from geo_skeletons import PointSkeleton
+from geo_skeletons.decorators import add_time, add_datavar, add_magnitude
+from geo_skeletons.dask_computations import ComputeCounter
+from geo_skeletons.managers.resample.time_resampler import TimeBins, resample_array
+import geo_parameters as gp
+import dask.array as da
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@add_magnitude(gp.wind.Wind("ff"), x="u", y="v", direction=gp.wind.WindDir("dd"))
+@add_datavar("v", default_value=1)
+@add_datavar("u", default_value=1)
+@add_datavar(gp.wave.Hmax)
+@add_datavar(gp.wave.Tp)
+@add_datavar(gp.wave.Dirp)
+@add_datavar(gp.wave.Hs)
+@add_datavar("temp")
+@add_time()
+class Wave(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def data():
+    time = pd.date_range("2020-01-01 00:00", "2020-01-01 06:00", freq="10min")
+    data = Wave(lon=[1, 3, 4], lat=[5, 6, 7], time=time)
+    np.random.seed(42)
+    shape = data.size()
+    data.set_hs(np.random.rand(*shape) * 5)
+    data.set_tp(np.random.rand(*shape) * 10 + 2)
+    data.set_dirp(np.random.rand(*shape) * 360)
+    data.set_hmax(np.random.rand(*shape) * 8)
+    data.set_temp(np.random.rand(*shape) * 20)
+    data.set_u(np.random.rand(*shape) * 10 - 5)
+    data.set_v(np.random.rand(*shape) * 10 - 5)
+    return data
+
+
+def _assert_same(data, data2, names):
+    np.testing.assert_array_equal(data.time(), data2.time())
+    for name in names:
+        np.testing.assert_allclose(data.get(name), data2.get(name), atol=1e-10)
+        assert data.meta.get(name) == data2.meta.get(name)
+
+
+VARS = ["hs", "tp", "dirp", "hmax", "temp", "ff", "dd", "u", "v"]
+
+
+@pytest.mark.parametrize("mode", ["left", "right", "centered"])
+def test_vectorized_same_as_xarray(data, mode):
+    dt = "1h" if mode != "centered" else "30min"
+    resampled = data.resample.time(dt=dt, mode=mode)
+    resampled_xr = data.resample.time(dt=dt, mode=mode, engine="xarray")
+    _assert_same(resampled, resampled_xr, VARS)
+
+
+def test_vectorized_missing_time(data):
+    data = data.isel(time=list(range(6)) + list(range(12, len(data.time()))))
+    resampled = data.resample.time(dt="1h")
+    resampled_xr = data.resample.time(dt="1h", engine="xarray")
+    assert np.all(np.isnan(resampled.hs()[1, :]))
+    _assert_same(resampled, resampled_xr, VARS)
+
+
+def test_vectorized_skipna():
+    time = pd.date_range("2020-01-01 00:00", "2020-01-01 02:00", freq="30min")
+    data = Wave(lon=[1, 3], lat=[5, 6], time=time)
+    data.set_temp(np.array([[1.0, 2.0], [np.nan, 4.0], [3.0, 6.0], [5, 8], [7, 10]]))
+
+    np.testing.assert_array_almost_equal(
+        data.resample.time(dt="1h").temp(), [[np.nan, 3.0], [4.0, 7.0], [7, 10]]
+    )
+    np.testing.assert_array_almost_equal(
+        data.resample.time(dt="1h", skipna=True).temp(),
+        [[1.0, 3.0], [4.0, 7.0], [7, 10]],
+    )
+
+
+def test_angular_mean_wraps_around():
+    bins = TimeBins(np.array([0, 2, 4]))
+    dirs = np.array([350.0, 10.0, 90.0, 180.0])
+    np.testing.assert_array_almost_equal(
+        resample_array(dirs, bins, "angular_mean_deg"), [0.0, 135.0]
+    )
+
+
+def test_bad_engine(data):
+    with pytest.raises(ValueError):
+        data.resample.time(dt="1h", engine="pandas")
+
+
+def test_vectorized_dask_is_lazy(data):
+    reference = data.resample.time(dt="1h")
+
+    data.dask.activate(chunks={"time": 10})
+    with ComputeCounter() as counter:
+        resampled = data.resample.time(dt="1h")
+        assert isinstance(resampled.hs(), da.Array)
+    assert counter.count == 0
+
+    resampled.dask.deactivate()
+    _assert_same(resampled, reference, ["hs", "tp", "dirp", "hmax", "temp"])
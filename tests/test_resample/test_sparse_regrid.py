@@ -0,0 +1,125 @@
+from geo_skeletons.classes import WindGrid, Wind
+from geo_skeletons import GriddedSkeleton, PointSkeleton
+from geo_skeletons.managers.resample.sparse_regridders import RegridWeights
+from copy import deepcopy
+import numpy as np
+import pytest
+
+
+def _wind_grid():
+    data = WindGrid.add_time()(
+        lon=(10, 20), lat=(50, 60), time=("2020-01-01 00:00", "2020-01-02 00:00")
+    )
+    data.set_spacing(nx=11, ny=21)
+    np.random.seed(3)
+    data.set_u(np.random.rand(*data.size()) * 10)
+    data.set_v(np.random.rand(*data.size()) * 10)
+    return data
+
+
+def _assert_same(new_data, new_data_scipy):
+    for name in ["u", "v"]:
+        np.testing.assert_array_equal(
+            np.isnan(new_data.get(name)), np.isnan(new_data_scipy.get(name))
+        )
+        np.testing.assert_array_almost_equal(
+            new_data.get(name), new_data_scipy.get(name)
+        )
+
+
+@pytest.mark.parametrize("method", ["nearest", "linear"])
+def test_sparse_grid_grid_same_as_scipy(method):
+    data = _wind_grid()
+    new_grid = GriddedSkeleton(lon=(9.5, 20.1), lat=(50.1, 60.1))
+    new_grid.set_spacing(nx=13, ny=17)
+
+    new_data = data.resample.grid(new_grid, engine="sparse", method=method)
+    new_data_scipy = data.resample.grid(new_grid, method=method)
+    assert new_data.is_gridded()
+    assert new_data.size() == (len(data.time()), 17, 13)
+    _assert_same(new_data, new_data_scipy)
+
+    # Some points are outside of the convex hull
+    if method == "linear":
+        assert np.all(np.isnan(new_data.u()[:, :, 0]))
+
+
+@pytest.mark.parametrize("method", ["nearest", "linear"])
+def test_sparse_grid_point_same_as_scipy(method):
+    data = _wind_grid()
+    points = PointSkeleton(lon=(10.5, 12.3, 19.9), lat=(50.2, 55.5, 59.1))
+
+    new_data = data.resample.grid(points, engine="sparse", method=method)
+    new_data_scipy = data.resample.grid(points, method=method)
+    assert not new_data.is_gridded()
+    _assert_same(new_data, new_data_scipy)
+
+
+def test_sparse_workers():
+    data = _wind_grid()
+    new_grid = GriddedSkeleton(lon=(10.1, 20.1), lat=(50.1, 60.1))
+    new_grid.set_spacing(nx=11, ny=21)
+
+    new_data = data.resample.grid(new_grid, engine="sparse", method="linear")
+    new_data_parallel = data.resample.grid(
+        new_grid, engine="sparse", method="linear", workers=3
+    )
+    np.testing.assert_array_equal(new_data.u(), new_data_parallel.u())
+
+
+def test_sparse_reuse_weights():
+    data = _wind_grid()
+    new_grid = GriddedSkeleton(lon=(10.1, 20.1), lat=(50.1, 60.1))
+    new_grid.set_spacing(nx=11, ny=21)
+
+    weights = RegridWeights.from_skeletons(data, new_grid, method="linear")
+    assert weights.target_shape == (21, 11)
+    assert weights.matrix.shape == (21 * 11, 11 * 21)
+
+    new_data = data.resample.grid(new_grid, engine="sparse", weights=weights)
+    new_data_scipy = data.resample.grid(new_grid, method="linear")
+    _assert_same(new_data, new_data_scipy)
+
+
+def test_sparse_nan_treatment():
+    data = Wind.add_time()(
+        lon=(10, 11, 12, 20),
+        lat=(50, 50, 51, 60),
+        time=("2020-01-01 00:00", "2020-01-02 06:00"),
+    )
+    data_high = deepcopy(data)
+    data_nan = deepcopy(data)
+    data.set_dd(0)
+    data.set_ff(10)
+
+    u, v = data.u(), data.v()
+    u[:, 0], v[:, 0] = 100, 100
+    data_high.set_u(u)
+    data_high.set_v(v)
+    u[:, 0], v[:, 0] = np.nan, np.nan
+    # Different NaN-pattern for some time steps
+    u[3:5, 1], v[3:5, 1] = np.nan, np.nan
+    data_nan.set_u(u)
+    data_nan.set_v(v)
+
+    grid = Wind(x=data.edges("x"), y=data.edges("y"), utm=data.utm.zone())
+
+    new_data_drop_nan = data_nan.resample.grid(grid, engine="sparse", drop_nan=True)
+    np.testing.assert_array_almost_equal(
+        new_data_drop_nan.u(), data_nan.resample.grid(grid, drop_nan=True).u()
+    )
+
+    u[3:5, 1], v[3:5, 1] = 100, 100
+    data_nan.set_u(u)
+    data_nan.set_v(v)
+    data_high.set_u(np.where(np.isnan(u), 100, u))
+    np.testing.assert_array_almost_equal(
+        data_high.resample.grid(grid, engine="sparse").u(),
+        data_nan.resample.grid(grid, engine="sparse", mask_nan=100).u(),
+    )
+
+
+def test_sparse_bad_method():
+    data = _wind_grid()
+    with pytest.raises(ValueError):
+        data.resample.grid(data, engine="sparse", method="cubic")
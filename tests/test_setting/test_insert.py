@@ -7,8 +7,11 @@ from geo_skeletons.decorators import (
     activate_dask,
     add_magnitude,
 )
+from geo_skeletons.dask_computations import ComputeCounter
+import dask.array as da
 import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_insert_point():
@@ -145,3 +148,201 @@ def test_insert_time():
     np.testing.assert_array_almost_equal(points.hs(), data)
     points.ind_insert("hs", 1, time=1, threshold=0)
     np.testing.assert_almost_equal(points.hs()[1, 0], 1)
+
+
+def test_ind_insert_in_place():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.set_hs()
+    grid.ind_insert("hs", np.ones((3, 5)), time=1)
+    grid.ind_insert("hs", np.full((3, 5), 2.0), time=2)
+
+    hs = grid.hs()
+    np.testing.assert_array_almost_equal(hs[1], 1.0)
+    np.testing.assert_array_almost_equal(hs[2], 2.0)
+    np.testing.assert_array_almost_equal(hs[[0, 3, 4, 5]], 0.0)
+
+
+def test_ind_insert_does_not_modify_parent():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.set_hs(np.zeros(grid.shape("hs")))
+    sliced = grid.isel(time=slice(0, 3))
+    sliced.ind_insert("hs", np.ones((3, 5)), time=0)
+    np.testing.assert_array_almost_equal(sliced.hs()[0], 1.0)
+    np.testing.assert_array_almost_equal(grid.hs(), 0.0)
+
+
+def test_ind_insert_after_slicing_does_not_modify_slice():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.set_hs(np.zeros(grid.shape("hs")))
+    grid.ind_insert("hs", np.ones((3, 5)), time=0)
+    child = grid.sel(time="2020-01-01 01:00")
+    sliced = grid.isel(time=slice(0, 3))
+    hs = grid.hs()
+    stored = grid.ds().hs.values
+    grid.ind_insert("hs", np.full((3, 5), 7.0), time=[1, 2])
+    np.testing.assert_array_almost_equal(grid.hs()[1:3], 7.0)
+    np.testing.assert_array_almost_equal(child.hs(), 0.0)
+    np.testing.assert_array_almost_equal(sliced.hs()[1:], 0.0)
+    np.testing.assert_array_almost_equal(hs[1:], 0.0)
+    np.testing.assert_array_almost_equal(stored[1:], 0.0)
+
+
+def test_ind_insert_batch():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.set_hs()
+    grid.ind_insert("hs", np.ones((2, 3, 2)), time=[1, 4], lon=[0, 3])
+    hs = grid.hs()
+    assert np.sum(hs) == 12
+    np.testing.assert_array_almost_equal(hs[np.ix_([1, 4], [0, 1, 2], [0, 3])], 1.0)
+
+    # Scalar index and a batch of indices
+    grid.ind_insert("hs", np.full((2, 5), 2.0), time=0, lat=[0, 2])
+    np.testing.assert_array_almost_equal(grid.hs()[0, [0, 2], :], 2.0)
+    np.testing.assert_array_almost_equal(grid.hs()[0, 1, :], 0.0)
+
+
+def test_insert_by_value():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.set_hs()
+    grid.insert("hs", np.ones((3, 2)), time="2020-01-01 03:00", lon=[1.0, 2.0])
+    hs = grid.hs()
+    np.testing.assert_array_almost_equal(hs[3][:, 1:3], 1.0)
+    assert np.sum(hs) == 6
+
+    with pytest.raises(KeyError):
+        grid.insert("hs", 1.0, time="2021-01-01 03:00")
+    with pytest.raises(KeyError):
+        grid.insert("hs", 1.0, lon=1.5)
+
+
+def test_insert_dask_stays_lazy():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.dask.activate(rechunk=False)
+    grid.set_hs()
+    with ComputeCounter() as counter:
+        grid.ind_insert("hs", da.ones((3, 5)), time=2)
+        grid.ind_insert("hs", np.full((2, 3, 5), 2.0), time=[4, 5])
+    assert counter.count == 0, counter.calls
+    assert isinstance(grid.ds().hs.data, da.Array)
+
+    hs = grid.hs(dask=False)
+    np.testing.assert_array_almost_equal(hs[2], 1.0)
+    np.testing.assert_array_almost_equal(hs[4:], 2.0)
+    np.testing.assert_array_almost_equal(hs[[0, 1, 3]], 0.0)
+
+
+def test_insert_mask():
+    @add_mask(name="sea", default_value=1, opposite_name="land")
+    @add_datavar(name="hs", default_value=0.0)
+    @add_time()
+    class WaveHeight(GriddedSkeleton):
+        pass
+
+    grid = WaveHeight(
+        lon=(0, 4), lat=(50, 52), time=("2020-01-01 00:00", "2020-01-01 05:00")
+    )
+    grid.set_spacing(nx=5, ny=3)
+    grid.ind_insert("land_mask", True, lon=0)
+    assert grid.ds().sea_mask.dtype == bool
+    assert np.all(grid.land_mask()[..., 0])
+    assert not np.any(grid.land_mask()[..., 1:])
+    assert not np.any(grid.sea_mask()[..., 0])
+
+
+def test_insert_packed():
+    @add_datavar(name="hs", dtype="int16", valid_range=(0, 30))
+    @add_time()
+    class WaveHeight(PointSkeleton):
+        pass
+
+    points = WaveHeight(
+        lon=[1.0, 2.0, 3.0],
+        lat=[4.0, 5.0, 6.0],
+        time=("2020-01-01 00:00", "2020-01-01 05:00"),
+    )
+    points.set_hs(np.full(points.size(), 1.0))
+    points.ind_insert("hs", np.array([3.0, np.nan, 40.0]), time=2)
+    assert points.ds().hs.dtype == np.int16
+    hs = points.hs()
+    np.testing.assert_allclose(hs[2], [3.0, np.nan, np.nan], atol=1e-3)
+    np.testing.assert_allclose(hs[[0, 1, 3, 4, 5]], 1.0, atol=1e-3)
+
+
+def test_insert_magnitude_region():
+    @add_magnitude(name="wind", x="u", y="v", direction="wdir", dir_type="from")
+    @add_datavar(name="v", default_value=0.0)
+    @add_datavar(name="u", default_value=0.0)
+    @add_time()
+    class Wind(PointSkeleton):
+        pass
+
+    points = Wind(
+        lon=[1.0, 2.0, 3.0],
+        lat=[4.0, 5.0, 6.0],
+        time=("2020-01-01 00:00", "2020-01-01 05:00"),
+    )
+    points.set_u(1.0)
+    points.set_v(0.0)
+    points.ind_insert("wind", 2.0, time=[0, 1], inds=0)
+    np.testing.assert_array_almost_equal(points.u()[[0, 1], 0], 2.0)
+    np.testing.assert_array_almost_equal(points.u()[2:, 0], 1.0)
+    np.testing.assert_array_almost_equal(points.v(), 0.0)
+
+    points.ind_insert("wdir", 180.0, time=0)
+    np.testing.assert_array_almost_equal(points.u()[0], [0.0, 0.0, 0.0])
+    np.testing.assert_array_almost_equal(points.v()[0], [2.0, 1.0, 1.0])
+    np.testing.assert_array_almost_equal(points.wind()[0], [2.0, 1.0, 1.0])
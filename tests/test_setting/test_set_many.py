@@ -0,0 +1,91 @@
+from geo_skeletons import GriddedSkeleton, PointSkeleton
+from geo_skeletons.decorators import add_datavar, add_magnitude, add_mask
+import numpy as np
+import pytest
+
+
+@add_mask(
+    name="sea",
+    default_value=1,
+    opposite_name="land",
+    triggered_by="topo",
+    valid_range=(0, None),
+    range_inclusive=False,
+)
+@add_magnitude(name="wind", x="u", y="v", direction="wdir", dir_type="from")
+@add_datavar("v", default_value=0)
+@add_datavar("u", default_value=0)
+@add_datavar("topo", default_value=1)
+@add_datavar("tp", default_value=10)
+@add_datavar("hs", default_value=1)
+class Grid(GriddedSkeleton):
+    pass
+
+
+def test_set_many():
+    grid = Grid(lon=(5, 6), lat=(59, 61, 62))
+    topo = np.array([[0, 1], [2, 3], [-1, 5]])
+    grid.set_many({"hs": 2, "tp": np.full((3, 2), 5.0), "topo": topo})
+    np.testing.assert_array_almost_equal(grid.hs(), np.full((3, 2), 2.0))
+    np.testing.assert_array_almost_equal(grid.tp(), np.full((3, 2), 5.0))
+    np.testing.assert_array_almost_equal(grid.topo(), topo)
+    # Triggered mask set
+    np.testing.assert_array_equal(grid.sea_mask(), topo > 0)
+
+
+def test_set_many_magnitude_and_direction():
+    points = Grid(lon=(5, 6), lat=(59, 61))
+    points.set_many({"wind": 10, "wdir": 90})
+    np.testing.assert_array_almost_equal(points.wind(), np.full((2, 2), 10.0))
+    np.testing.assert_array_almost_equal(points.wdir(), np.full((2, 2), 90.0))
+    np.testing.assert_array_almost_equal(points.u(), np.full((2, 2), -10.0))
+
+
+def test_set_many_directional_variable():
+    @add_datavar("dirp", dir_type="from")
+    @add_datavar("hs", default_value=1)
+    class Waves(GriddedSkeleton):
+        pass
+
+    grid = Waves(lon=(5, 6), lat=(59, 61))
+    dirp = np.array([[-90.0, 360.0], [450.0, 10.0]])
+    grid.set_many({"hs": 2, "dirp": dirp})
+    expected = np.array([[270.0, 0.0], [90.0, 10.0]])
+    np.testing.assert_array_almost_equal(grid.dirp(), expected)
+
+    grid.set("dirp", dirp)
+    np.testing.assert_array_almost_equal(grid.dirp(), expected)
+
+
+def test_set_many_opposite_mask():
+    grid = Grid(lon=(5, 6), lat=(59, 61))
+    land = np.array([[True, False], [False, False]])
+    grid.set_many({"hs": 2, "land_mask": land})
+    assert "land_mask" not in grid.ds()
+    np.testing.assert_array_equal(grid.land_mask(), land)
+    np.testing.assert_array_equal(grid.sea_mask(), np.logical_not(land))
+
+
+def test_set_keeps_attributes_of_other_variables():
+    grid = Grid(lon=(5, 6), lat=(59, 61))
+    grid.set_hs(1)
+    grid.ds().lon.attrs["units"] = "degrees_east"
+    grid.ds().hs.attrs["custom"] = "kept"
+    grid.set_tp(5)
+    grid.set_many({"topo": 1, "u": 2})
+    assert grid.ds().lon.attrs["units"] == "degrees_east"
+    assert grid.ds().hs.attrs["custom"] == "kept"
+
+
+def test_set_copies_given_array():
+    grid = Grid(lon=(5, 6), lat=(59, 61))
+    hs = np.zeros((2, 2))
+    grid.set_hs(hs)
+    hs[0, 0] = 5
+    assert grid.hs()[0, 0] == 0
+
+
+def test_set_many_unknown_variable():
+    points = PointSkeleton(lon=(5, 6), lat=(59, 61))
+    with pytest.raises(TypeError):
+        points.set_many({1: 0})
@@ -0,0 +1,85 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+from geo_skeletons.decorators import add_datavar, add_time
+import dask.array as da
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@add_datavar("hs", default_value=1.0)
+@add_time()
+class WaveData(PointSkeleton):
+    pass
+
+
+@pytest.fixture
+def data():
+    data = WaveData(
+        x=(0, 100, 200, 300),
+        y=(6_600_000, 6_600_100, 6_600_200, 6_600_300),
+        time=pd.date_range("2020-01-01", periods=5, freq="h"),
+    )
+    data.utm.set((33, "W"), silent=True)
+    data.set_hs(np.arange(20).reshape(5, 4))
+    return data
+
+
+def test_isel_does_not_decode(data, monkeypatch):
+    def no_decoding(*args, **kwargs):
+        raise AssertionError("from_ds was called!")
+
+    monkeypatch.setattr(WaveData, "from_ds", no_decoding)
+    data2 = data.isel(time=slice(1, 3), inds=[1, 3])
+    np.testing.assert_array_almost_equal(data2.hs(), [[5, 7], [9, 11]])
+    np.testing.assert_array_almost_equal(data2.inds(), [0, 1])
+    np.testing.assert_array_almost_equal(data2.x(), [100, 300])
+
+    data3 = data.sel(time="2020-01-01 02:00")
+    np.testing.assert_array_almost_equal(data3.hs(), [8, 9, 10, 11])
+
+
+def test_scalar_index_keeps_dimension(data):
+    data2 = data.isel(time=0)
+    assert data2.size() == (1, 4)
+    assert data2.hs(squeeze=False).shape == (1, 4)
+    assert data2.sel(time="2020-01-01 00:00").size() == (1, 4)
+
+    grid = GriddedSkeleton(lon=(0, 3), lat=(60, 62))
+    grid.set_spacing(nx=4, ny=3)
+    assert grid.isel(lon=1).size() == (3, 1)
+
+
+def test_structure_is_copied(data):
+    data2 = data.isel(time=[0])
+    assert data2.utm.zone() == (33, "W")
+    assert data2.core is not data.core
+    assert data2.name == data.name
+
+    data2.meta.append({"units": "m"}, name="hs")
+    assert data.meta.get("hs").get("units") is None
+    data2.set_hs(0)
+    np.testing.assert_array_almost_equal(data.hs()[0], [0, 1, 2, 3])
+
+
+def test_dask_mode_is_kept(data):
+    data.dask.activate(chunks="auto")
+    data2 = data.isel(time=slice(0, 2))
+    assert data2.dask.is_active()
+    assert isinstance(data2.hs(), da.Array)
+
+
+def test_slice_and_parent_share_no_writes(data):
+    data2 = data.isel(time=slice(0, 3))
+    data2.ind_insert("hs", [-1, -1, -1, -1], time=0)
+    np.testing.assert_array_almost_equal(data.hs()[0], [0, 1, 2, 3])
+    np.testing.assert_array_almost_equal(data2.hs()[0], -1)
+
+    data.ind_insert("hs", [-2, -2, -2, -2], time=1)
+    np.testing.assert_array_almost_equal(data2.hs()[1], [4, 5, 6, 7])
+    np.testing.assert_array_almost_equal(data.hs()[1], -2)
+
+    # Parent written in place before slicing is still copied after slicing
+    data3 = data.sel(time="2020-01-01 02:00")
+    data.ind_insert("hs", [-3, -3, -3, -3], time=2)
+    np.testing.assert_array_almost_equal(data3.hs(), [8, 9, 10, 11])
+    np.testing.assert_array_almost_equal(data.hs()[2], -3)
@@ -0,0 +1,77 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+from geo_skeletons.distance_funcs import min_cartesian_distance, min_distance
+import numpy as np
+
+
+def test_yank_many_points_cartesian_matches_brute_force():
+    np.random.seed(1)
+    points = PointSkeleton(x=np.random.rand(500) * 1000, y=np.random.rand(500) * 1000)
+    qx, qy = np.random.rand(50) * 1000, np.random.rand(50) * 1000
+    yanked = points.yank_point(x=qx, y=qy, npoints=3)
+    assert len(yanked["inds"]) == 150
+
+    x, y = points.xy()
+    for n in range(50):
+        dx, inds = min_cartesian_distance(qx[n], qy[n], x, y, npoints=3)
+        np.testing.assert_array_equal(yanked["inds"][n * 3 : (n + 1) * 3], inds)
+        np.testing.assert_array_almost_equal(yanked["dx"][n * 3 : (n + 1) * 3], dx)
+
+
+def test_yank_points_spherical_slow_matches_brute_force():
+    np.random.seed(2)
+    lon, lat = np.random.rand(60) * 10, 80 + np.random.rand(60) * 9
+    points = PointSkeleton(lon=lon, lat=lat)
+    qlon, qlat = np.random.rand(5) * 10, 80 + np.random.rand(5) * 9
+    yanked = points.yank_point(lon=qlon, lat=qlat, npoints=2, fast=False)
+
+    for n in range(5):
+        dx, inds = min_distance(qlon[n], qlat[n], lon, lat, npoints=2)
+        np.testing.assert_array_equal(yanked["inds"][n * 2 : (n + 1) * 2], inds)
+        np.testing.assert_array_almost_equal(yanked["dx"][n * 2 : (n + 1) * 2], dx)
+
+
+def test_spatial_index_is_cached():
+    points = PointSkeleton(lon=(10, 11, 12), lat=(60, 61, 62))
+    points.yank_point(lon=10.1, lat=60.1)
+    tree, __ = points._spatial_index.cartesian_tree(points.utm.zone())
+    points.yank_point(lon=11.1, lat=61.1)
+    tree2, __ = points._spatial_index.cartesian_tree(points.utm.zone())
+    assert tree is tree2
+
+
+def test_spatial_index_reset_by_set_spacing():
+    grid = GriddedSkeleton(x=(0, 10), y=(0, 10))
+    grid.set_spacing(nx=3, ny=3)
+    yanked = grid.yank_point(x=9, y=9)
+    assert yanked["inds_x"][0] == 2
+    assert yanked["inds_y"][0] == 2
+
+    grid.set_spacing(nx=11, ny=11)
+    yanked = grid.yank_point(x=9, y=9)
+    assert yanked["inds_x"][0] == 9
+    assert yanked["inds_y"][0] == 9
+    np.testing.assert_almost_equal(yanked["dx"][0], 0)
+
+
+def test_yank_more_points_than_exist():
+    points = PointSkeleton(x=(0, 1, 2), y=(0, 0, 0))
+    yanked = points.yank_point(x=0.1, y=0, npoints=10)
+    np.testing.assert_array_equal(yanked["inds"], np.array([0, 1, 2]))
+
+
+def test_yank_point_spherical_exact_when_orderings_differ():
+    # Near the equator a meridian degree is shorter than a degree along the equator on the ellipsoid,
+    # so the point to the north is the nearest even though the other points are closer on the sphere
+    lon = np.concatenate(([0.0], np.full(20, 0.995)))
+    lat = np.concatenate(([1.0], np.linspace(-0.05, 0.05, 20)))
+    points = PointSkeleton(lon=lon, lat=lat)
+    yanked = points.yank_point(lon=0.0, lat=0.0, fast=False)
+    dx, inds = min_distance(0.0, 0.0, lon, lat)
+    assert inds[0] == 0
+    np.testing.assert_array_equal(yanked["inds"], inds)
+    np.testing.assert_array_almost_equal(yanked["dx"], dx)
+
+    yanked = points.yank_point(lon=0.0, lat=0.0, npoints=3, fast=False)
+    dx, inds = min_distance(0.0, 0.0, lon, lat, npoints=3)
+    assert yanked["inds"][0] == 0
+    np.testing.assert_array_almost_equal(yanked["dx"], dx)
@@ -0,0 +1,64 @@
+from geo_skeletons import PointSkeleton, GriddedSkeleton
+import numpy as np
+import utm as utm_module
+
+
+def test_point_projection_is_memoized():
+    points = PointSkeleton(lon=(10, 11, 12), lat=(60, 61, 62))
+    x, y = points._projected_xy()
+    x2, y2 = points._projected_xy()
+    assert x is x2
+    assert y is y2
+    assert not x.flags.writeable
+
+    # Returned coordinates are still private copies
+    x3 = points.x()
+    x3[0] = 0
+    np.testing.assert_array_almost_equal(points.x(), x)
+
+
+def test_point_projection_matches_utm_module():
+    lon, lat = np.array([10, 11, 12]), np.array([60, 61, 62])
+    points = PointSkeleton(lon=lon, lat=lat)
+    points.utm.set((33, "W"), silent=True)
+    x, y, __, __ = utm_module.from_latlon(
+        lat, lon, force_zone_number=33, force_zone_letter="W"
+    )
+    np.testing.assert_array_almost_equal(points.x(), x)
+    np.testing.assert_array_almost_equal(points.y(), y)
+
+
+def test_cache_cleared_when_zone_changes():
+    points = PointSkeleton(lon=(10, 11, 12), lat=(60, 61, 62))
+    points.utm.set((33, "W"), silent=True)
+    x33 = points.x()
+    points.utm.set((32, "W"), silent=True)
+    x32 = points.x()
+    assert not np.allclose(x33, x32)
+    assert ("xy", (33, "W")) not in points.utm._cache
+
+
+def test_cache_cleared_when_grid_changes():
+    grid = GriddedSkeleton(lon=(10, 12), lat=(60, 62))
+    grid.set_spacing(nx=3, ny=3)
+    x, __ = grid.xy()
+    assert len(x) == 9
+
+    grid.set_spacing(nx=5, ny=5)
+    x, __ = grid.xy()
+    assert len(x) == 25
+
+
+def test_gridded_cartesian_lonlat_is_memoized():
+    grid = GriddedSkeleton(x=(0, 100_000), y=(6_600_000, 6_700_000))
+    grid.utm.set((33, "W"), silent=True)
+    grid.set_spacing(nx=4, ny=3)
+    lon, lat = grid._projected_lonlat()
+    lon2, __ = grid._projected_lonlat()
+    assert lon is lon2
+
+    x, y = grid.xy()
+    lat_ref, lon_ref = utm_module.to_latlon(x, y, 33, "W", strict=False)
+    lon, lat = grid.lonlat()
+    np.testing.assert_array_almost_equal(lon, lon_ref)
+    np.testing.assert_array_almost_equal(lat, lat_ref)